@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Render-engine throughput: print-ready HTML vs. LaTeX/pdflatex, in resumes per second.
+
+Builds the same synthetic resumes (already loaded, so only rendering and
+writing are timed) with each engine in a single process, without the build
+cache:
+- html: webapp template rendered to resume.html
+- latex (tex only): the LaTeX source, i.e. the LaTeX engine minus pdflatex
+- latex: LaTeX source plus the pdflatex passes, when pdflatex is installed
+
+Usage:
+    python3 benchmarks/bench_engines.py [--resumes 20] [--positions 10]
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'scripts'))
+
+from resume_generator import ResumeGenerator  # noqa: E402
+from synthetic import make_resume, write_template  # noqa: E402
+
+
+def build_all(resumes, formats, templates, output_root):
+    started = time.perf_counter()
+    for i, data in enumerate(resumes):
+        generator = ResumeGenerator(templates_dir=templates, output_dir=output_root / str(i), data=data,
+                                    use_cache=False, quiet=True)
+        outputs = generator.generate_all_formats(formats=formats)
+        if not all(outputs[fmt] for fmt in formats):
+            raise RuntimeError(f"{'/'.join(formats)} build {i} failed")
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render-engine throughput benchmark')
+    parser.add_argument('--resumes', type=int, default=20, help='Resumes built per engine')
+    parser.add_argument('--positions', type=int, default=10, help='Experience entries per synthetic resume')
+    args = parser.parse_args()
+
+    resumes = [make_resume(positions=args.positions, seed=seed) for seed in range(args.resumes)]
+    engines = [('html', ('html',)), ('latex (tex only)', ('tex',))]
+    if shutil.which('pdflatex'):
+        engines.append(('latex', ('tex', 'pdf')))
+    else:
+        print("ℹ️  pdflatex not found, timing the LaTeX engine without PDF compilation")
+
+    print(f"📊 {args.resumes} resume(s), {args.positions} positions each:")
+    with tempfile.TemporaryDirectory() as tmp:
+        templates = write_template(Path(tmp) / 'templates')
+        # Warm-up: template compiles and lazy imports are paid once per process, not per resume
+        for _, formats in engines:
+            build_all(resumes[:1], formats, templates, Path(tmp) / 'warmup')
+
+        for label, formats in engines:
+            elapsed = build_all(resumes, formats, templates, Path(tmp) / label.replace(' ', '-'))
+            print(f"   {label:<18} {args.resumes / elapsed:10.1f} resumes/s  {elapsed / args.resumes * 1000:9.2f} ms each")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Golden check and microbenchmark for the single-pass LaTeX escaper.
+
+Verifies that scripts/latex_escape.escape_latex is byte-identical to the
+original multi-step implementation on every string in sections/ and jobs/,
+a set of edge cases and a seeded random corpus, then times both.
+
+Usage:
+    python3 benchmarks/bench_escape_latex.py [--fuzz 20000] [--repeat 5]
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'scripts'))
+
+from latex_escape import escape_latex  # noqa: E402
+
+
+def legacy_escape_latex(text, preserve_ampersand=False):
+    """The original ResumeGenerator.escape_latex, kept verbatim as the golden reference"""
+    text = re.sub(r'\*\*(.+?)\*\*', r'\\textbf{\1}', text)
+    text = re.sub(r'\\(?!textbf|&)', r'\\textbackslash{}', text)
+
+    latex_special_chars = {
+        '%': r'\%',
+        '$': r'\$',
+        '#': r'\#',
+        '^': r'\textasciicircum{}',
+        '_': r'\_',
+        '{': r'\{',
+        '}': r'\}',
+        '~': r'\textasciitilde{}',
+    }
+    if not preserve_ampersand:
+        latex_special_chars['&'] = r'\&'
+
+    for char, escape in latex_special_chars.items():
+        text = text.replace(char, escape)
+
+    return text
+
+
+EDGE_CASES = [
+    '', '*', '**', '***', '****', '*****', '****a**', '**a**b**c**', '**a\n**b**',
+    '\\', '\\\\', '\\&', '\\textbf{x}', '\\**bold**', '**ends with\\**', '\\text**bf**',
+    '&', 'R&D', '100% of $5 #1 ^2 a_b {c} ~d', '**50%** faster', '** spaced **',
+    'C:\\path\\to\\file', '{{{NAME}}}', 'ünïcödé — “quotes”',
+]
+
+
+def collect_strings(value, out):
+    if isinstance(value, str):
+        out.append(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            collect_strings(item, out)
+    elif isinstance(value, list):
+        for item in value:
+            collect_strings(item, out)
+    return out
+
+
+def resume_strings():
+    """Every string value in sections/ and jobs/, as the generator would escape them"""
+    strings = []
+    for path in sorted(ROOT.glob('sections/*.json')) + sorted(ROOT.glob('jobs/*/*.json')):
+        collect_strings(json.loads(path.read_text(encoding='utf-8')), strings)
+    return strings
+
+
+def fuzz_strings(count, seed=1234):
+    rng = random.Random(seed)
+    alphabet = 'ab *\\&%$#^_{}~\n' + 'textbf'
+    return [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 24))) for _ in range(count)]
+
+
+def check_golden(corpus):
+    mismatches = []
+    for text in corpus:
+        for preserve in (False, True):
+            expected = legacy_escape_latex(text, preserve)
+            actual = escape_latex.__wrapped__(text, preserve)
+            if actual != expected:
+                mismatches.append((text, preserve, expected, actual))
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Golden check and microbenchmark for escape_latex')
+    parser.add_argument('--fuzz', type=int, default=20000, help='Number of random strings to check')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best is reported)')
+    args = parser.parse_args()
+
+    real = resume_strings()
+    corpus = EDGE_CASES + real + fuzz_strings(args.fuzz)
+    mismatches = check_golden(corpus)
+    if mismatches:
+        print(f"❌ {len(mismatches)} mismatch(es) against the legacy escaper:")
+        for text, preserve, expected, actual in mismatches[:10]:
+            print(f"   {text!r} (preserve_ampersand={preserve}): expected {expected!r}, got {actual!r}")
+        return 1
+    print(f"✅ Byte-identical to legacy escaper on {len(corpus)} strings (x2 ampersand modes)")
+
+    def run(fn):
+        for text in real:
+            fn(text)
+
+    def best(stmt):
+        return min(timeit.repeat(stmt, number=1, repeat=args.repeat)) / len(real) * 1e6
+
+    legacy = best(lambda: run(legacy_escape_latex))
+    single_pass = best(lambda: run(escape_latex.__wrapped__))
+    escape_latex.cache_clear()
+    run(escape_latex)
+    memoized = best(lambda: run(escape_latex))
+
+    print(f"📊 {len(real)} strings, best of {args.repeat}:")
+    print(f"   legacy       {legacy:8.3f} µs/call")
+    print(f"   single-pass  {single_pass:8.3f} µs/call  ({legacy / single_pass:.1f}x)")
+    print(f"   memoized     {memoized:8.3f} µs/call  ({legacy / memoized:.1f}x)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Keyword tailoring benchmark: index build vs. cached load, and per-job ranking.
+
+Writes synthetic sections of increasing size, then times building the TF-IDF
+index from scratch, loading it from the cache (which still hashes every
+section file to detect edits), and scoring plus tailoring a batch of
+synthetic job descriptions. Scoring is timed with the pure-Python postings
+walk and, when NumPy is installed, with the matrix product.
+
+Usage:
+    python3 benchmarks/bench_keyword_index.py [--positions 10 100] [--jobs 200]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'scripts'))
+
+import keyword_index  # noqa: E402
+from synthetic import make_resume, sentence, write_sections  # noqa: E402
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Keyword index benchmark')
+    parser.add_argument('--positions', type=int, nargs='+', default=[10, 100],
+                        help='Experience entries in the synthetic resume')
+    parser.add_argument('--jobs', type=int, default=200, help='Job descriptions tailored per size')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions (best is reported)')
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    jobs = [' '.join(sentence(rng, 20) for _ in range(10)) for _ in range(args.jobs)]
+    backends = [('python', False)] + ([('numpy', True)] if keyword_index.numpy is not None else [])
+
+    print(f"📊 Keyword index, {args.jobs} job descriptions per size (best of {args.repeat}):")
+    with tempfile.TemporaryDirectory() as tmp:
+        for positions in args.positions:
+            sections = write_sections(make_resume(positions=positions, projects=positions // 2),
+                                      Path(tmp) / f"sections-{positions}")
+            index_path = Path(tmp) / f"index-{positions}"
+            key, data = keyword_index.read_sections(sections)
+
+            build = best_of(args.repeat, lambda: keyword_index.KeywordIndex.build(key, data).save(index_path))
+            load = best_of(args.repeat, lambda: keyword_index.load_index(sections, index_path))
+            index, data, rebuilt = keyword_index.load_index(sections, index_path)
+            assert not rebuilt
+
+            print(f"   {positions:>4} positions, {len(index.documents):>5} items, {len(index.terms):>5} terms: "
+                  f"build {build * 1000:8.2f} ms  cached load {load * 1000:8.2f} ms")
+            for label, use_numpy in backends:
+                if use_numpy:
+                    index.matrix()
+                score = best_of(args.repeat, lambda: [index.score(job, use_numpy=use_numpy) for job in jobs])
+                print(f"        {label:<6} score {score / len(jobs) * 1000:8.3f} ms/job")
+            tailor = best_of(args.repeat, lambda: [keyword_index.tailor(index, data, job) for job in jobs])
+            print(f"        tailor (default backend) {tailor / len(jobs) * 1000:8.3f} ms/job")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
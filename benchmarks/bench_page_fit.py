@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Page-fit benchmark: estimator-guided search vs. trimming one cut per compile.
+
+Renders a synthetic resume (written with the synthetic template) and fits
+it into each page budget twice: with PageFitter, and with the naive loop of
+applying one more cut and recompiling until the PDF fits. Reports the
+pdflatex compiles and wall time of both. Needs pdflatex.
+
+Usage:
+    python3 benchmarks/bench_page_fit.py [--positions 12] [--budgets 1 2 3]
+"""
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'scripts'))
+
+from page_fit import PageFitter  # noqa: E402
+from profiling import NULL_PROFILER  # noqa: E402
+from resume_generator import ResumeGenerator  # noqa: E402
+from synthetic import make_resume, write_template  # noqa: E402
+
+
+def linear_fit(fitter, budget):
+    for count in range(len(fitter.plan) + 1):
+        if fitter.fits(count, budget):
+            return count
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Page-fit benchmark')
+    parser.add_argument('--positions', type=int, default=12, help='Experience entries in the synthetic resume')
+    parser.add_argument('--budgets', type=int, nargs='+', default=[1, 2, 3], help='Page budgets to fit')
+    args = parser.parse_args()
+
+    if shutil.which('pdflatex') is None:
+        print("❌ pdflatex not found")
+        return 1
+
+    data = make_resume(positions=args.positions, projects=args.positions // 2)
+    with tempfile.TemporaryDirectory() as tmp:
+        templates = write_template(Path(tmp) / 'templates')
+
+        def render(trimmed):
+            return ResumeGenerator(templates_dir=templates, output_dir=None, data=trimmed, quiet=True).render_latex()
+
+        print(f"📊 Fitting {args.positions} positions into a page budget:")
+        for budget in args.budgets:
+            results = []
+            for label, search in (('estimate + bisect', lambda f: f.fit(budget)[0]), ('one cut per compile', None)):
+                fitter = PageFitter(data, render, Path(tmp) / f"{label}-{budget}".replace(' ', '-'), NULL_PROFILER)
+                started = time.perf_counter()
+                cuts = search(fitter) if search else linear_fit(fitter, budget)
+                results.append((label, cuts, len(fitter.probes), time.perf_counter() - started, len(fitter.plan)))
+            for label, cuts, compiles, elapsed, total in results:
+                print(f"   {budget} page(s), {label:<20} {cuts if cuts is not None else '-':>4}/{total} cuts "
+                      f"{compiles:4d} compile(s) {elapsed:8.2f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
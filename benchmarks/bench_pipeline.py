@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Per-stage benchmark of the generation pipeline on synthetic resumes.
+
+Builds a synthetic resume of parametric size (plus sparse job variants),
+then times each stage separately: section loading, model validation,
+escape_latex, every generate_*_section, template rendering, Markdown, PDF
+compilation (skipped without pdflatex) and webapp rendering through the
+FastAPI test client (skipped if the webapp can't be imported). Every stage
+runs cold: escape and model caches are dropped before each repetition.
+
+Results are printed and can be written as JSON (--output). Given a previous
+result file (--baseline), each stage is compared against it and the script
+exits with status 1 if any stage got slower than --threshold allows.
+
+Usage:
+    python3 benchmarks/bench_pipeline.py [--positions 50] [--variants 20] [--output results.json]
+    python3 benchmarks/bench_pipeline.py --baseline results.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'scripts'))
+
+from latex_escape import escape_latex  # noqa: E402
+from resume_generator import ResumeGenerator  # noqa: E402
+from resume_model import Resume  # noqa: E402
+from synthetic import make_resume, write_sections, write_template  # noqa: E402
+
+SECTIONS = ('skills', 'experience', 'projects', 'education', 'achievements', 'learning', 'languages')
+
+
+def time_stage(run, repeat, setup=None):
+    """Best wall time of run() over repeat runs; setup() runs untimed before each"""
+    best = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            if setup is not None:
+                setup()
+            started = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def text_values(value):
+    """Every string in a JSON-like structure"""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from text_values(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from text_values(item)
+
+
+def generator_stages(args, sections_dir, variant_dirs, templates_dir, output_dir):
+    stages = {}
+
+    def new_generator(**options):
+        return ResumeGenerator(sections_dir=sections_dir, templates_dir=templates_dir, output_dir=output_dir,
+                               use_cache=False, **options)
+
+    stages['load_modular_json_data'] = time_stage(lambda: new_generator().load_modular_json_data(), args.repeat)
+    stages['load_variants'] = time_stage(
+        lambda: [
+            ResumeGenerator(sections_dir=path, base_dir=sections_dir, output_dir=None).load_modular_json_data()
+            for path in variant_dirs
+        ],
+        args.repeat
+    )
+
+    generator = new_generator()
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = generator.data
+    stages['resume_model'] = time_stage(lambda: Resume.from_dict(data), args.repeat)
+
+    strings = list(text_values(data))
+    stages['escape_latex'] = time_stage(
+        lambda: [escape_latex(text) for text in strings], args.repeat, setup=escape_latex.cache_clear
+    )
+
+    def cold():
+        # Reassigning the data drops the model and the escaped text cached on it
+        escape_latex.cache_clear()
+        generator.data = data
+        generator.validate()
+
+    for name in SECTIONS:
+        stages[f'generate_{name}_section'] = time_stage(
+            getattr(generator, f'generate_{name}_section'), args.repeat, setup=cold
+        )
+
+    stages['generate_latex_from_template'] = time_stage(generator.generate_latex_from_template, args.repeat, setup=cold)
+    stages['generate_markdown'] = time_stage(generator.generate_markdown, args.repeat)
+
+    if args.skip_pdf or shutil.which('pdflatex') is None:
+        print("⏭️  pdflatex not available, skipping generate_pdf_from_latex")
+    else:
+        latex_file = output_dir / "resume.tex"
+        build_dir = output_dir / "build"
+
+        def clean_build():
+            shutil.rmtree(build_dir, ignore_errors=True)
+
+        stages['generate_pdf_from_latex'] = time_stage(
+            lambda: generator.generate_pdf_from_latex(latex_file, build_dir=build_dir), args.pdf_repeat,
+            setup=clean_build
+        )
+
+    return stages
+
+
+def webapp_stages(args):
+    """Render through the FastAPI test client; RESUME_SECTIONS_DIR/RESUME_JOBS_DIR must be set"""
+    try:
+        from fastapi.testclient import TestClient
+        sys.path.insert(0, str(ROOT / 'webapp'))
+        import app as webapp
+    except (ImportError, RuntimeError) as e:
+        print(f"⏭️  Webapp not available ({e}), skipping webapp stages")
+        return {}
+
+    from utils.pages import PageCache
+
+    client = TestClient(webapp.app)
+    variant = webapp.list_variants()[0] if webapp.list_variants() else None
+
+    def get(path):
+        response = client.get(path)
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {path} returned {response.status_code}")
+        return response
+
+    def drop_pages():
+        webapp.page_cache = PageCache()
+
+    stages = {
+        'webapp_html': time_stage(lambda: get('/'), args.repeat, setup=drop_pages),
+        'webapp_html_cached': time_stage(lambda: get('/'), args.repeat),
+        'webapp_state': time_stage(lambda: get('/state'), args.repeat, setup=drop_pages),
+        'webapp_markdown': time_stage(lambda: get('/resume.md'), args.repeat),
+    }
+    if variant is not None:
+        stages['webapp_variant_html'] = time_stage(lambda: get(f'/jobs/{variant}'), args.repeat, setup=drop_pages)
+    return stages
+
+
+def compare(stages, baseline, threshold, noise):
+    """Print each stage against the baseline; returns the names of stages that regressed
+
+    Stages that got slower by less than `noise` seconds are never flagged, so
+    sub-millisecond stages don't trip the threshold on timer jitter.
+    """
+    regressions = []
+    for name, seconds in stages.items():
+        before = baseline['stages'].get(name)
+        if before is None:
+            print(f"   {name:<32} {seconds * 1000:10.2f} ms  (new)")
+            continue
+        ratio = seconds / before if before else float('inf')
+        flag = ''
+        if ratio > threshold and seconds - before > noise:
+            flag = '  ⚠️  regression'
+            regressions.append(name)
+        print(f"   {name:<32} {seconds * 1000:10.2f} ms  {before * 1000:10.2f} ms  {ratio:5.2f}x{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-stage benchmark of the resume generation pipeline')
+    parser.add_argument('--positions', type=int, default=50, help='Experience entries')
+    parser.add_argument('--highlights', type=int, default=8, help='Highlights per experience entry')
+    parser.add_argument('--skill-groups', type=int, default=8, help='Skill groups')
+    parser.add_argument('--skills', type=int, default=10, help='Skills per group')
+    parser.add_argument('--projects', type=int, default=10, help='Projects')
+    parser.add_argument('--variants', type=int, default=20, help='Sparse job variants on top of the base')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions per stage (best is reported)')
+    parser.add_argument('--pdf-repeat', type=int, default=1, help='Timing repetitions for the PDF stage')
+    parser.add_argument('--skip-pdf', action='store_true', help='Skip the PDF stage even if pdflatex is installed')
+    parser.add_argument('--skip-webapp', action='store_true', help='Skip the webapp stages')
+    parser.add_argument('--output', default=None, help='Write results as JSON to this file')
+    parser.add_argument('--baseline', default=None, help='Previous results file to compare against')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Slowdown ratio vs. the baseline that counts as a regression')
+    parser.add_argument('--noise-ms', type=float, default=0.1,
+                        help='Slowdowns smaller than this many milliseconds are not regressions')
+    args = parser.parse_args()
+
+    params = {
+        'positions': args.positions,
+        'highlights': args.highlights,
+        'skill_groups': args.skill_groups,
+        'skills': args.skills,
+        'projects': args.projects,
+        'variants': args.variants,
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        data = make_resume(positions=args.positions, highlights_per_position=args.highlights,
+                           skill_groups=args.skill_groups, skills_per_group=args.skills, projects=args.projects)
+        sections_dir = write_sections(data, tmp / 'sections')
+
+        # Variants are sparse overlays replacing the summary and skills, like a tailored resume
+        variant_dirs = []
+        for seed in range(1, args.variants + 1):
+            variant = make_resume(positions=1, skill_groups=args.skill_groups, skills_per_group=args.skills, seed=seed)
+            variant_dirs.append(write_sections(
+                {'summary': variant['summary'], 'skills': variant['skills']}, tmp / 'jobs' / f"variant-{seed}"
+            ))
+
+        templates_dir = write_template(tmp / 'templates')
+        output_dir = tmp / 'output'
+
+        print(f"📊 Pipeline stages ({', '.join(f'{key}={value}' for key, value in params.items())}):")
+        stages = generator_stages(args, sections_dir, variant_dirs, templates_dir, output_dir)
+
+        if not args.skip_webapp:
+            os.environ['RESUME_SECTIONS_DIR'] = str(sections_dir)
+            os.environ['RESUME_JOBS_DIR'] = str(tmp / 'jobs')
+            stages.update(webapp_stages(args))
+
+    results = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': params,
+        'stages': stages,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        if baseline.get('params') != params:
+            print(f"⚠️  Baseline was measured with different parameters: {baseline.get('params')}")
+        print(f"   {'stage':<32} {'current':>13}  {'baseline':>13}")
+        regressions = compare(stages, baseline, args.threshold, args.noise_ms / 1000)
+    else:
+        for name, seconds in stages.items():
+            print(f"   {name:<32} {seconds * 1000:10.2f} ms")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"📁 Results written to: {args.output}")
+
+    if regressions:
+        print(f"❌ {len(regressions)} stage(s) slower than {args.threshold:.2f}x the baseline: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
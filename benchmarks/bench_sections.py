@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Scaling benchmark for the LaTeX section emitters.
+
+Builds synthetic resumes with a growing number of experience highlights (up
+to 10k by default) and times generate_experience_section. Time per highlight
+should stay flat if generation is linear in input size.
+
+Usage:
+    python3 benchmarks/bench_sections.py [--sizes 1000 2500 5000 10000]
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'scripts'))
+
+from latex_escape import escape_latex  # noqa: E402
+from resume_generator import ResumeGenerator  # noqa: E402
+from synthetic import make_resume, write_sections  # noqa: E402
+
+HIGHLIGHTS_PER_POSITION = 25
+
+
+def time_section(generator, repeat):
+    def run():
+        escape_latex.cache_clear()
+        # Reassigning the data drops the model, and with it the escaped text cached on each entry
+        generator.data = generator.data
+        generator.generate_experience_section()
+    return min(timeit.repeat(run, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Scaling benchmark for LaTeX section emitters')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 2500, 5000, 10000],
+                        help='Total experience highlights per synthetic resume')
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions (best is reported)')
+    args = parser.parse_args()
+
+    print(f"📊 generate_experience_section, {HIGHLIGHTS_PER_POSITION} highlights per position:")
+    per_highlight = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            data = make_resume(positions=max(1, size // HIGHLIGHTS_PER_POSITION),
+                               highlights_per_position=HIGHLIGHTS_PER_POSITION)
+            sections_dir = write_sections(data, Path(tmp) / f"sections-{size}")
+            with contextlib.redirect_stdout(io.StringIO()):
+                generator = ResumeGenerator(sections_dir=sections_dir, output_dir=Path(tmp) / 'output')
+                generator.validate()
+
+            elapsed = time_section(generator, args.repeat)
+            per_highlight.append(elapsed / size * 1e6)
+            print(f"   {size:>7} highlights  {elapsed * 1000:9.2f} ms  {per_highlight[-1]:7.3f} µs/highlight")
+
+    growth = per_highlight[-1] / per_highlight[0]
+    print(f"   per-highlight cost, largest vs smallest: {growth:.2f}x (≈1.0 means linear)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Cold-load benchmark: section JSON files vs. the compiled binary snapshot.
+
+Writes a base sections directory plus N full variants, then times loading
+every section file (read + parse vs. snapshot lookup, including unpickling
+the snapshot itself) and constructing a ResumeGenerator per variant, which
+adds model validation on top of the same loading.
+
+Usage:
+    python3 benchmarks/bench_snapshot.py [--variants 50 200] [--positions 10]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / 'scripts'))
+
+import snapshot  # noqa: E402
+from resume_generator import ResumeGenerator  # noqa: E402
+from synthetic import make_resume, write_sections  # noqa: E402
+
+
+def load_files(files, snapshot_path):
+    snapshot._loaded.clear()
+    started = time.perf_counter()
+    loaded = snapshot.load_snapshot(snapshot_path) if snapshot_path else None
+    for path in files:
+        cached = loaded.lookup(path) if loaded is not None else None
+        if cached is None:
+            json.loads(path.read_bytes().decode('utf-8'))
+    return time.perf_counter() - started
+
+
+def load_generators(directories, snapshot_path):
+    snapshot._loaded.clear()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for directory in directories:
+            ResumeGenerator(sections_dir=directory, output_dir=None, snapshot_path=snapshot_path).validate()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Cold-load benchmark for the section snapshot')
+    parser.add_argument('--variants', type=int, nargs='+', default=[50, 200],
+                        help='Number of jobs/ variants to load')
+    parser.add_argument('--positions', type=int, default=10, help='Experience entries per synthetic resume')
+    parser.add_argument('--repeat', type=int, default=3, help='Timing repetitions (best is reported)')
+    args = parser.parse_args()
+
+    print("📊 Loading every variant, JSON parse vs. snapshot:")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.variants:
+            root = Path(tmp) / f"tree-{count}"
+            directories = [write_sections(make_resume(positions=args.positions), root / 'sections')]
+            directories += [
+                write_sections(make_resume(positions=args.positions, seed=seed), root / 'jobs' / f"variant-{seed}")
+                for seed in range(1, count + 1)
+            ]
+            snapshot_path = root / snapshot.SNAPSHOT_FILENAME
+            files = snapshot.compile_snapshot(snapshot_path, directories)
+
+            paths = [path for directory in directories for path in sorted(directory.glob('*.json'))]
+            size_kb = snapshot_path.stat().st_size / 1024
+            print(f"   {count + 1} dirs, {files} files, snapshot {size_kb:.0f} KB")
+            for stage, run, inputs in (('files', load_files, paths), ('generator', load_generators, directories)):
+                from_json = min(run(inputs, None) for _ in range(args.repeat))
+                from_snapshot = min(run(inputs, snapshot_path) for _ in range(args.repeat))
+                print(f"      {stage:<10} json {from_json * 1000:8.1f} ms  snapshot {from_snapshot * 1000:8.1f} ms  "
+                      f"{from_json / from_snapshot:.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+CLI startup benchmark for resume_generator.py, based on `python -X importtime`.
+
+Runs the generator in fresh interpreters for a few common invocations and
+reports the import time the script adds on top of a bare interpreter, the
+slowest top-level imports and the wall-clock time per call. Invocations that
+do no real work (--help, up-to-date builds) must not import the modules that
+are only needed to produce output; the benchmark exits with status 1 if one
+of them does, or if an import budget given with --budget-ms is exceeded.
+
+Usage:
+    python3 benchmarks/bench_startup.py [--runs 10] [--budget-ms 40]
+"""
+
+import argparse
+import compileall
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+GENERATOR = ROOT / 'scripts' / 'resume_generator.py'
+
+from synthetic import write_template  # noqa: E402
+
+# Modules only needed to render, compile or batch-build; cheap invocations must not load them
+DEFERRED_MODULES = (
+    'subprocess', 'concurrent.futures', 'datetime', 'pickle',
+    'resume_model', 'markdown_renderer', 'latex_format',
+)
+
+
+def parse_importtime(stderr):
+    """(module, cumulative µs) for each top-level import, plus the set of every imported module"""
+    top_level = []
+    modules = set()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules.add(name.strip())
+        if not name.startswith('  '):
+            top_level.append((name.strip(), int(cumulative)))
+    return top_level, modules
+
+
+def import_profile(args, cwd):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args], cwd=cwd, capture_output=True, text=True
+    )
+    return parse_importtime(result.stderr)
+
+
+def wall_time(args, cwd, runs):
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=cwd, capture_output=True)
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='CLI startup benchmark for resume_generator.py')
+    parser.add_argument('--runs', type=int, default=10, help='Wall-clock runs per invocation (median is reported)')
+    parser.add_argument('--budget-ms', type=float, default=None,
+                        help='Fail if any invocation adds more import time than this')
+    parser.add_argument('--top', type=int, default=5, help='Slowest top-level imports to list per invocation')
+    args = parser.parse_args()
+
+    # Measure imports from bytecode, not the one-off cost of compiling changed sources
+    compileall.compile_dir(ROOT / 'scripts', quiet=1)
+
+    baseline_imports, baseline_modules = import_profile(['-c', 'pass'], ROOT)
+    baseline_wall = wall_time(['-c', 'pass'], ROOT, args.runs)
+    baseline_names = {name for name, _ in baseline_imports}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        templates_dir = write_template(Path(tmp) / 'templates')
+        common = ['--templates-dir', str(templates_dir), '--output-dir', str(Path(tmp) / 'output'), '--no-snapshot']
+
+        # (label, arguments, whether it must be up to date and avoid DEFERRED_MODULES)
+        invocations = [
+            ('--help', ['--help'], False),
+            ('check', ['check', *common], False),
+            ('md', ['md', '--no-cache', *common], False),
+            ('md (up to date)', ['md', *common], True),
+            ('tex (up to date)', ['tex', *common], True),
+        ]
+
+        print(f"📊 resume_generator.py startup (interpreter alone: {baseline_wall * 1000:.1f} ms)")
+        failures = []
+        for label, cli_args, up_to_date in invocations:
+            script_args = [str(GENERATOR), *cli_args]
+            if up_to_date:
+                # Build once so the measured runs find the output fresh
+                subprocess.run([sys.executable, *script_args], cwd=ROOT, capture_output=True)
+
+            top_level, modules = import_profile(script_args, ROOT)
+            added = [(name, us) for name, us in top_level if name not in baseline_names]
+            import_ms = sum(us for _, us in added) / 1000
+            wall = wall_time(script_args, ROOT, args.runs)
+
+            print(f"   {label:<18} imports {import_ms:6.1f} ms  wall {wall * 1000:6.1f} ms")
+            slowest = sorted(added, key=lambda item: item[1], reverse=True)[:args.top]
+            print("      " + ', '.join(f"{name} {us / 1000:.1f}" for name, us in slowest))
+
+            if up_to_date or label == '--help':
+                loaded = [name for name in DEFERRED_MODULES if name in modules and name not in baseline_modules]
+                if loaded:
+                    failures.append(f"{label} imports {', '.join(loaded)}")
+            if args.budget_ms is not None and import_ms > args.budget_ms:
+                failures.append(f"{label} adds {import_ms:.1f} ms of imports (budget {args.budget_ms:.1f} ms)")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
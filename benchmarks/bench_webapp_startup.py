@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Webapp worker startup benchmark: Jinja2 template compilation vs. the bytecode cache.
+
+Each sample starts a fresh interpreter, imports webapp/app.py and serves the
+first GET / through the FastAPI test client, timing both. Modes:
+- dev, cold cache: templates compiled on the first request (the old behaviour
+  of every worker start)
+- dev, warm cache: compiled code loaded from the bytecode cache
+- production, cold/warm cache: RESUME_PRODUCTION=1, templates compiled (or
+  loaded) at import so the first request does no template work
+
+Usage:
+    python3 benchmarks/bench_webapp_startup.py [--runs 5]
+"""
+
+import argparse
+import compileall
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+WEBAPP = ROOT / 'webapp'
+
+SAMPLE = """
+import json, sys, time
+sys.path.insert(0, '.')
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+client = TestClient(app.app)
+requested = time.perf_counter()
+status = client.get('/').status_code
+served = time.perf_counter()
+print(json.dumps({'import': imported - started, 'first_request': served - requested, 'status': status}))
+"""
+
+
+def sample(env):
+    result = subprocess.run([sys.executable, '-c', SAMPLE], cwd=WEBAPP, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else 'sample failed')
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    if timings['status'] != 200:
+        raise RuntimeError(f"GET / returned {timings['status']}")
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Webapp worker startup benchmark')
+    parser.add_argument('--runs', type=int, default=5, help='Fresh workers per mode (median is reported)')
+    args = parser.parse_args()
+
+    # Measure imports from bytecode, not the one-off cost of compiling changed sources
+    for directory in (ROOT / 'scripts', WEBAPP):
+        compileall.compile_dir(directory, quiet=1)
+
+    print("📊 Worker start, import app + first GET / (median):")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, production, warm in (
+            ('dev, cold cache', False, False),
+            ('dev, warm cache', False, True),
+            ('production, cold cache', True, False),
+            ('production, warm cache', True, True),
+        ):
+            samples = []
+            for run in range(args.runs):
+                cache_dir = Path(tmp) / (f"{label}-warm" if warm else f"{label}-{run}")
+                env = dict(os.environ, RESUME_TEMPLATE_CACHE_DIR=str(cache_dir), RESUME_PRODUCTION='1' if production else '0')
+                if warm and run == 0:
+                    # Fill the cache once; the measured runs all find it warm
+                    sample(env)
+                samples.append(sample(env))
+
+            imported = statistics.median(s['import'] for s in samples) * 1000
+            first = statistics.median(s['first_request'] for s in samples) * 1000
+            print(f"   {label:<24} import {imported:7.1f} ms  first request {first:7.1f} ms  total {imported + first:7.1f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
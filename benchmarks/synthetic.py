@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Synthetic resume data of parametric size, for benchmarks.
+
+Generated data follows the schema of sections/*.json and mixes in the
+characters the LaTeX escaper has to handle (%, &, _, **bold**, ...).
+"""
+
+import json
+import random
+from pathlib import Path
+
+WORDS = (
+    "designed implemented optimized migrated scaled automated built led reduced improved "
+    "latency throughput pipeline service cluster firmware protocol database cache queue "
+    "PostgreSQL Redis Kubernetes FastAPI asyncio ESP32 CAN_BUS R&D 40% $2M #1 C++ API"
+).split()
+
+
+def sentence(rng, words=14):
+    text = ' '.join(rng.choice(WORDS) for _ in range(words))
+    return f"**{text[:12]}**{text[12:]}" if rng.random() < 0.2 else text
+
+
+def make_resume(positions=10, highlights_per_position=5, skill_groups=5, skills_per_group=6,
+                projects=5, seed=0):
+    """Build merged resume data (as ResumeGenerator.data) of the requested size"""
+    rng = random.Random(seed)
+    return {
+        'personal': {
+            'name': 'Synthetic Candidate',
+            'title': 'Software Engineer',
+            'location': 'Cape Town, South Africa',
+            'email': 'candidate@example.com',
+            'phone': '+27 00 000 0000',
+            'github': 'github.com/example',
+            'linkedin': 'linkedin.com/in/example',
+            'website': 'example.com',
+        },
+        'summary': {'text': ' '.join(sentence(rng) for _ in range(4))},
+        'skills': [
+            {'category': f"Group {g} & Tools", 'items': [sentence(rng, 6) for _ in range(skills_per_group)]}
+            for g in range(skill_groups)
+        ],
+        'experience': [
+            {
+                'title': f"Engineer {p}",
+                'company': f"Company_{p % 17}",
+                'dates': f"{2000 + p % 25} - {2001 + p % 25}",
+                'location': rng.choice(['Remote', 'Cape Town, South Africa', 'Berlin, Germany']),
+                'description': sentence(rng, 10),
+                'highlights': [sentence(rng) for _ in range(highlights_per_position)],
+            }
+            for p in range(positions)
+        ],
+        'projects': [
+            {
+                'name': f"Project {p}",
+                'technologies': ', '.join(rng.sample(WORDS, 5)),
+                'link': f"https://example.com/p{p}" if p % 2 else '',
+                'highlights': [sentence(rng) for _ in range(3)],
+            }
+            for p in range(projects)
+        ],
+        'education': [
+            {
+                'degree': 'BEng Electrical & Electronic',
+                'institution': 'University',
+                'dates': '2016-2020',
+                'location': 'Stellenbosch',
+                'note': 'Cum Laude',
+                'details': [sentence(rng, 8)],
+            }
+        ],
+        'achievements': {'items': [sentence(rng, 8) for _ in range(5)]},
+        'learning': {
+            'focus_areas': [sentence(rng, 8) for _ in range(3)],
+            'continuous_learning': [sentence(rng, 8) for _ in range(2)],
+        },
+        'languages': {'items': [{'language': 'English', 'proficiency': 'Native'}]},
+        'metadata': {'last_updated': 'June 2025', 'template_version': '2.0'},
+    }
+
+
+def write_sections(data, directory):
+    """Write merged data as one <key>.json file per top-level key, like sections/"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for key, value in data.items():
+        with open(directory / f"{key}.json", 'w', encoding='utf-8') as f:
+            json.dump({key: value}, f, indent=2)
+    return directory
+
+
+# Every placeholder the generator resolves, with minimal definitions of the
+# environments the section emitters use, so the output also compiles with pdflatex
+SYNTHETIC_TEMPLATE = r"""\documentclass[10pt]{article}
+\usepackage[margin=2cm]{geometry}
+\usepackage{hyperref}
+\newenvironment{onecolentry}{\par\noindent}{\par}
+\newenvironment{twocolentry}[1]{\par\noindent\hfill #1\par\noindent}{\par}
+\newenvironment{highlights}{\begin{itemize}}{\end{itemize}}
+\newenvironment{highlightsforbulletentries}{\begin{itemize}}{\end{itemize}}
+\newcommand{\hrefWithoutArrow}[2]{\href{#1}{#2}}
+\begin{document}
+{\LARGE {{{NAME}}}} \\
+{{{LOCATION}}} | \href{mailto:{{{EMAIL}}}}{{{{EMAIL}}}} | \href{tel:{{{PHONE_CLEAN}}}}{{{{PHONE}}}} \\
+{{{WEBSITE}}} | {{{LINKEDIN}}} | {{{GITHUB}}}
+\section{Summary}
+{{{SUMMARY}}}
+
+{{{SKILLS_SECTION}}}
+{{{EXPERIENCE_SECTION}}}
+{{{PROJECTS_SECTION}}}
+{{{EDUCATION_SECTION}}}
+{{{ACHIEVEMENTS_SECTION}}}
+{{{LEARNING_SECTION}}}
+{{{LANGUAGES_SECTION}}}
+Last updated {{{LAST_UPDATED}}}
+\end{document}
+"""
+
+
+def write_template(directory, name="modern_template.tex"):
+    """Write SYNTHETIC_TEMPLATE into directory, returning the directory"""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / name).write_text(SYNTHETIC_TEMPLATE)
+    return directory
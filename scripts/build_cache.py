@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Content-addressed build cache for generated resume outputs
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+CACHE_FILENAME = ".build_cache.json"
+
+
+def hash_bytes(data):
+    """Return the SHA-256 hex digest of a bytes object"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path):
+    """Return the SHA-256 hex digest of a file's contents"""
+    with open(path, 'rb') as f:
+        return hash_bytes(f.read())
+
+
+def write_atomic(path, write, mode='w'):
+    """Create path by calling write(f) on a temp file renamed into place
+
+    Concurrent readers see either the old or the new file, never a partial one.
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, mode) as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def save_artifact(path, magic, version, payload):
+    """Pickle payload (a dict) to path after a magic line, tagged with version; written atomically"""
+    # Imported here so that commands without binary artifacts never pay for it
+    import pickle
+
+    def write(f):
+        f.write(magic)
+        pickle.dump(dict(payload, version=version), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    write_atomic(path, write, 'wb')
+
+
+def load_artifact(path, magic, version):
+    """Payload saved by save_artifact, or None if it is missing, corrupt or from another version
+
+    Artifacts are local build outputs; like any pickle they must not be
+    loaded from an untrusted source.
+    """
+    import pickle
+
+    try:
+        with open(path, 'rb') as f:
+            if f.readline() != magic:
+                return None
+            payload = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get('version') != version:
+        return None
+    return payload
+
+
+class BuildCache:
+    """
+    Tracks, per output format, the key of the inputs each artifact was built from.
+
+    A key is a hash over everything the format depends on (section file hashes,
+    template hash, generator version, ...). An artifact is only rebuilt when its
+    key changes or the file on disk no longer matches what was written.
+    """
+
+    def __init__(self, output_dir):
+        self.path = Path(output_dir) / CACHE_FILENAME
+        self.entries = self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def make_key(*parts):
+        """Combine JSON-serializable parts into a single cache key"""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(json.dumps(part, sort_keys=True).encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def is_fresh(self, fmt, key, output_path):
+        """Check whether the cached artifact for fmt was built from key and is intact"""
+        entry = self.entries.get(fmt)
+        if not entry or entry.get('key') != key:
+            return False
+        try:
+            return hash_file(output_path) == entry.get('output_hash')
+        except OSError:
+            return False
+
+    def record(self, fmt, key, output_path):
+        """Remember that output_path was built from key"""
+        self.entries[fmt] = {
+            'key': key,
+            'output': str(output_path),
+            'output_hash': hash_file(output_path),
+        }
+        self.save()
+
+    def value(self, name, key):
+        """Result stored under name for key (e.g. a computed setting rather than a file), else None"""
+        entry = self.entries.get(name)
+        if not entry or entry.get('key') != key:
+            return None
+        return entry.get('value')
+
+    def store_value(self, name, key, value):
+        """Remember a JSON-serializable result computed from key"""
+        self.entries[name] = {'key': key, 'value': value}
+        self.save()
+
+    def invalidate(self, fmt):
+        """Forget the cached artifact for fmt"""
+        if self.entries.pop(fmt, None) is not None:
+            self.save()
+
+    def save(self):
+        write_atomic(self.path, lambda f: json.dump(self.entries, f, indent=2, sort_keys=True))
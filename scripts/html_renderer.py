@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+HTML renderer for resume data: the webapp page as a standalone, print-ready document.
+
+Renders webapp/templates/index.html with Jinja2 from the merged section
+data, exactly as the webapp serves it. The generator validates that data
+against the typed model first, but the template is given the dicts: it
+reads the raw section shapes (summary.text, achievements['items']) that
+the model flattens. The print stylesheet included by the
+template (print.css) hides the controls and lays the content out for paper,
+so printing the file from a browser gives a PDF without a TeX installation.
+The screen layout is Tailwind, loaded from its CDN like in the webapp, so
+the browser needs network access to lay the document out as designed.
+Compiled templates are kept per process, so batch builds pay for the Jinja2
+compile once rather than once per resume.
+"""
+
+from pathlib import Path
+
+HTML_TEMPLATE = Path(__file__).resolve().parent.parent / 'webapp' / 'templates' / 'index.html'
+
+# Jinja2 environments per template directory
+_environments = {}
+
+
+def template_files(template_path=HTML_TEMPLATE):
+    """Files the rendered document depends on: the template and everything next to it (includes)"""
+    return sorted(path for path in Path(template_path).resolve().parent.iterdir() if path.is_file())
+
+
+def load_template(template_path=HTML_TEMPLATE):
+    """Compiled Jinja2 template, reused while the file is unchanged"""
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
+    template_path = Path(template_path).resolve()
+    directory = str(template_path.parent)
+    env = _environments.get(directory)
+    if env is None:
+        env = _environments[directory] = Environment(
+            loader=FileSystemLoader(directory),
+            autoescape=select_autoescape(['html', 'xml']),
+        )
+    return env.get_template(template_path.name)
+
+
+def render_html(data, template_path=HTML_TEMPLATE):
+    """The whole document as a string"""
+    return load_template(template_path).render(resume=data, state=data)
+
+
+def write_html(data, output_path, template_path=HTML_TEMPLATE):
+    """Stream the document to output_path"""
+    load_template(template_path).stream(resume=data, state=data).dump(str(output_path), encoding='utf-8')
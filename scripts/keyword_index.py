@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Keyword index over the resume content, for tailoring variants to job descriptions.
+
+Every experience and project highlight, project technology line, skill item
+and achievement in sections/*.json becomes a document. Documents are
+tokenized (lowercased, markdown stripped, light suffix stemming) and stored
+as L2-normalised TF-IDF vectors in an inverted index. A job description is
+scored against all documents at once: with NumPy as one matrix product over
+the query's terms, otherwise by walking the query terms' postings.
+
+The index is pickled next to the sections directory, keyed on a hash of the
+section files, and rebuilt only when one of them changed.
+
+Build variants with `resume_generator.py --tailor job.txt [job2.txt ...]`.
+"""
+
+import json
+import math
+import os
+import re
+from collections import Counter
+from pathlib import Path
+
+from build_cache import BuildCache, hash_bytes, load_artifact, save_artifact
+from overlay import diff_overlay
+
+try:
+    import numpy
+except ImportError:  # optional: scoring falls back to the pure-Python postings walk
+    numpy = None
+
+INDEX_MAGIC = b'RESUME-KEYWORD-INDEX\n'
+INDEX_VERSION = 1
+INDEX_FILENAME = '.keyword-index'
+
+# First line of the README written into generated variants; only such variants are overwritten
+TAILORED_MARKER = '<!-- generated by resume_generator.py --tailor -->'
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:[./-][a-z0-9+#]+)*')
+SUFFIXES = ('ations', 'ation', 'ings', 'ing', 'ed', 's')
+STOPWORDS = frozenset("""
+a about above across after all also an and any are as at be been being both but by can could did do does
+doing during each either etc for from had has have having he her his how i if in into is it its just may
+more most must new not of on or our out over own per plus such than that the their them then there these
+they this those through to under up us using via was we well were what when where which while who will
+with within without would you your
+""".split())
+
+
+def stem(token):
+    """Crude suffix stripping so that optimize/optimized/optimization share a term"""
+    if not token.isalpha():
+        return token
+    for suffix in SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3 and not token.endswith('ss'):
+            token = token[:-len(suffix)]
+            break
+    return token[:-1] if len(token) > 4 and token.endswith('e') else token
+
+
+def tokenize(text):
+    """Index terms of text: compound tokens (esp32-s3, ci/cd) also yield their parts"""
+    terms = []
+    for token in TOKEN_PATTERN.findall(text.replace('**', '').lower()):
+        parts = re.split(r'[./-]', token) if re.search(r'[./-]', token) else ()
+        for term in (token, *parts):
+            if term and term not in STOPWORDS and not (term.isdigit() and len(term) < 3):
+                terms.append(stem(term))
+    return terms
+
+
+def section_documents(data):
+    """(section, group, item, text) for every indexed piece of content in merged data
+
+    group identifies the list the item belongs to (a position, a project, a
+    skill category); item is the index within it, None for a project's
+    technology line.
+    """
+    documents = []
+    for p, position in enumerate(data.get('experience', [])):
+        for h, text in enumerate(position.get('highlights', [])):
+            documents.append(('experience', p, h, text))
+    for p, project in enumerate(data.get('projects', [])):
+        technologies = f"{project.get('name', '')} {project.get('technologies', '')}".strip()
+        if technologies:
+            documents.append(('projects', p, None, technologies))
+        for h, text in enumerate(project.get('highlights', [])):
+            documents.append(('projects', p, h, text))
+    for c, category in enumerate(data.get('skills', [])):
+        for i, text in enumerate(category.get('items', [])):
+            documents.append(('skills', c, i, text))
+    for i, text in enumerate(data.get('achievements', {}).get('items', [])):
+        documents.append(('achievements', 0, i, text))
+    return documents
+
+
+def read_sections(sections_dir):
+    """(key, merged data) for the JSON files of sections_dir; key changes whenever a file does"""
+    data = {}
+    hashes = []
+    for path in sorted(Path(sections_dir).glob('*.json')):
+        raw = path.read_bytes()
+        hashes.append((path.name, hash_bytes(raw)))
+        data.update(json.loads(raw.decode('utf-8')))
+    return BuildCache.make_key(INDEX_VERSION, hashes), data
+
+
+class KeywordIndex:
+    """
+    TF-IDF vectors of the section documents, as an inverted index.
+
+    postings[t] lists (document, weight) for every document containing term
+    t. The dense document x term matrix used for NumPy scoring is built from
+    the postings on first use and is not stored.
+    """
+
+    def __init__(self, key, documents, terms, idf, postings):
+        self.key = key
+        self.documents = documents
+        self.terms = terms
+        self.idf = idf
+        self.postings = postings
+        self.term_ids = {term: t for t, term in enumerate(terms)}
+        self._matrix = None
+
+    @classmethod
+    def build(cls, key, data):
+        documents = section_documents(data)
+        counts = [Counter(tokenize(text)) for _, _, _, text in documents]
+
+        frequency = Counter()
+        for document_counts in counts:
+            frequency.update(document_counts.keys())
+        terms = sorted(frequency)
+        term_ids = {term: t for t, term in enumerate(terms)}
+        # Smoothed idf, so a term found in every document still counts a little
+        idf = [math.log((1 + len(documents)) / (1 + frequency[term])) + 1 for term in terms]
+
+        postings = [[] for _ in terms]
+        for d, document_counts in enumerate(counts):
+            weights = {term_ids[term]: (1 + math.log(count)) * idf[term_ids[term]]
+                       for term, count in document_counts.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for t, weight in weights.items():
+                postings[t].append((d, weight / norm))
+        return cls(key, documents, terms, idf, postings)
+
+    @classmethod
+    def load(cls, path, key=None):
+        """Index stored at path, or None if it is missing, corrupt, another version or not built from key"""
+        payload = load_artifact(path, INDEX_MAGIC, INDEX_VERSION)
+        if payload is None:
+            return None
+        if key is not None and payload['key'] != key:
+            return None
+        return cls(payload['key'], payload['documents'], payload['terms'], payload['idf'], payload['postings'])
+
+    def save(self, path):
+        save_artifact(path, INDEX_MAGIC, INDEX_VERSION, {
+            'key': self.key,
+            'documents': self.documents,
+            'terms': self.terms,
+            'idf': self.idf,
+            'postings': self.postings,
+        })
+
+    def query(self, text):
+        """{term id: weight} for a job description; terms not in the index are dropped"""
+        counts = Counter(term for term in tokenize(text) if term in self.term_ids)
+        return {self.term_ids[term]: (1 + math.log(count)) * self.idf[self.term_ids[term]]
+                for term, count in counts.items()}
+
+    def matrix(self):
+        if self._matrix is None:
+            matrix = numpy.zeros((len(self.documents), len(self.terms)), dtype=numpy.float32)
+            for t, postings in enumerate(self.postings):
+                for d, weight in postings:
+                    matrix[d, t] = weight
+            self._matrix = matrix
+        return self._matrix
+
+    def score(self, text, use_numpy=None):
+        """Relevance of every document to text, as a list indexed like documents"""
+        query = self.query(text)
+        if not query:
+            return [0.0] * len(self.documents)
+        if numpy is not None and use_numpy is not False:
+            ids = numpy.fromiter(query.keys(), dtype=numpy.intp, count=len(query))
+            weights = numpy.fromiter(query.values(), dtype=numpy.float32, count=len(query))
+            return (self.matrix()[:, ids] @ weights).tolist()
+
+        scores = [0.0] * len(self.documents)
+        for t, weight in query.items():
+            for d, document_weight in self.postings[t]:
+                scores[d] += weight * document_weight
+        return scores
+
+    def top_terms(self, text, count=10):
+        """The highest-weighted terms of text that occur in the index"""
+        query = self.query(text)
+        return [self.terms[t] for t in sorted(query, key=lambda t: -query[t])[:count]]
+
+
+def default_index_path(sections_dir):
+    """Index location for a sections directory: next to it, in the project root"""
+    return Path(os.path.abspath(sections_dir)).parent / INDEX_FILENAME
+
+
+def load_index(sections_dir, path=None):
+    """(index, merged data, rebuilt) for sections_dir, rebuilding the cached index only if a file changed"""
+    path = path or default_index_path(sections_dir)
+    key, data = read_sections(sections_dir)
+    index = KeywordIndex.load(path, key)
+    if index is not None:
+        return index, data, False
+    index = KeywordIndex.build(key, data)
+    index.save(path)
+    return index, data, True
+
+
+def ranked(items, scores):
+    """items ordered by descending score; ties keep their original order"""
+    order = sorted(range(len(items)), key=lambda i: -scores[i])
+    return [items[i] for i in order]
+
+
+def tailor(index, data, job_text, top_k=4):
+    """Sections of data tailored to job_text, as {section: value} for the sections that changed
+
+    Experience and project highlights are ranked by relevance and cut to the
+    top_k per position/project; projects, skill items within each category
+    and achievements are reordered by relevance but all kept.
+    """
+    scores = index.score(job_text)
+    by_group = {}
+    for (section, group, item, _), score in zip(index.documents, scores):
+        by_group.setdefault((section, group), {})[item] = score
+
+    tailored = {}
+
+    experience = []
+    for p, position in enumerate(data.get('experience', [])):
+        highlights = position.get('highlights', [])
+        group = by_group.get(('experience', p), {})
+        highlight_scores = [group.get(h, 0.0) for h in range(len(highlights))]
+        experience.append(dict(position, highlights=ranked(highlights, highlight_scores)[:top_k]))
+    if 'experience' in data:
+        tailored['experience'] = experience
+
+    projects, relevance = [], []
+    for p, project in enumerate(data.get('projects', [])):
+        highlights = project.get('highlights', [])
+        group = by_group.get(('projects', p), {})
+        highlight_scores = [group.get(h, 0.0) for h in range(len(highlights))]
+        projects.append(dict(project, highlights=ranked(highlights, highlight_scores)[:top_k]))
+        relevance.append(group.get(None, 0.0) + max(highlight_scores, default=0.0))
+    if 'projects' in data:
+        tailored['projects'] = ranked(projects, relevance)
+
+    skills, relevance = [], []
+    for c, category in enumerate(data.get('skills', [])):
+        items = category.get('items', [])
+        group = by_group.get(('skills', c), {})
+        item_scores = [group.get(i, 0.0) for i in range(len(items))]
+        skills.append(dict(category, items=ranked(items, item_scores)))
+        relevance.append(max(item_scores, default=0.0))
+    if 'skills' in data:
+        tailored['skills'] = ranked(skills, relevance)
+
+    if 'achievements' in data:
+        items = data['achievements'].get('items', [])
+        group = by_group.get(('achievements', 0), {})
+        item_scores = [group.get(i, 0.0) for i in range(len(items))]
+        tailored['achievements'] = dict(data['achievements'], items=ranked(items, item_scores))
+
+    return {section: value for section, value in tailored.items() if value != data[section]}
+
+
+def variant_name(job_path):
+    """Variant directory name for a job description file"""
+    return re.sub(r'[^A-Za-z0-9._-]+', '-', Path(job_path).stem).strip('-.') or 'job'
+
+
+def write_variant(variant_dir, base, tailored, job_path, terms):
+    """Write tailored sections into variant_dir as sparse overlays on base
+
+    Returns the overlay file names written, or None if variant_dir holds a
+    variant that was not generated by tailoring (it is left untouched).
+    """
+    variant_dir = Path(variant_dir)
+    readme = variant_dir / 'README.md'
+    if variant_dir.exists() and any(variant_dir.iterdir()):
+        try:
+            generated = readme.read_text(encoding='utf-8').startswith(TAILORED_MARKER)
+        except OSError:
+            generated = False
+        if not generated:
+            return None
+        for stale in variant_dir.glob('*.json'):
+            stale.unlink()
+    variant_dir.mkdir(parents=True, exist_ok=True)
+
+    written = []
+    for section, value in tailored.items():
+        overlay = diff_overlay({section: base[section]}, {section: value})
+        with open(variant_dir / f"{section}.json", 'w', encoding='utf-8') as f:
+            json.dump(overlay, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        written.append(f"{section}.json")
+
+    readme.write_text(
+        f"{TAILORED_MARKER}\n"
+        f"# {variant_name(job_path)}\n\n"
+        f"Tailored from `{job_path}` by `resume_generator.py --tailor`; regenerating overwrites this directory.\n\n"
+        f"Top matching terms: {', '.join(terms) or '(none)'}\n\n"
+        f"Overlays: {', '.join(written) or '(none, identical to the base)'}\n",
+        encoding='utf-8'
+    )
+    return written
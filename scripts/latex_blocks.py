@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Block helpers for the LaTeX section emitters.
+
+Each helper is a generator yielding string fragments for one template
+environment, so section emitters can stream output (or join it once)
+instead of growing a string with repeated concatenation.
+"""
+
+
+def section(title):
+    """\\section{title} heading"""
+    yield f"\\section{{{title}}}\n\n"
+
+
+def vspace(size, blank_line=True):
+    """Vertical space of `size` cm (a string, kept verbatim), optionally followed by a blank line"""
+    yield f"\\vspace{{{size} cm}}\n\n" if blank_line else f"\\vspace{{{size} cm}}\n"
+
+
+def twocolentry(right, left):
+    """Two-column entry: `right` is the full right-column line, `left` the main text"""
+    yield "\\begin{twocolentry}{\n"
+    yield f"{right}\n"
+    yield "}\n"
+    yield f"    {left}\\end{{twocolentry}}\n\n"
+
+
+def onecolentry(*lines):
+    """One-column entry holding the given lines verbatim (indentation included)"""
+    yield "\\begin{onecolentry}\n"
+    for line in lines:
+        yield f"{line}\n"
+    yield "\\end{onecolentry}\n\n"
+
+
+def highlights(items, environment='highlights'):
+    """Bulleted list of already-escaped items inside a one-column entry"""
+    yield "\\begin{onecolentry}\n"
+    yield f"    \\begin{{{environment}}}\n"
+    for item in items:
+        yield f"        \\item {item}\n"
+    yield f"    \\end{{{environment}}}\n"
+    yield "\\end{onecolentry}\n\n"
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Single-pass LaTeX escaping for resume text.
+
+Produces exactly the output of the original multi-step escaper (markdown
+bold conversion, backslash escaping, then nine chained str.replace calls),
+including how the later brace replacements rewrite the braces the earlier
+steps introduced, but scans each string once. Results are memoized because
+skills, companies and titles repeat across sections and variants.
+"""
+
+import functools
+import re
+
+# Final output for each special character once every replacement step has run.
+# '^' and '\\' gain braces that the '{'/'}' steps escape again; '~' runs after them.
+_ESCAPES = {
+    '\\': r'\textbackslash\{\}',
+    '%': r'\%',
+    '$': r'\$',
+    '#': r'\#',
+    '^': r'\textasciicircum\{\}',
+    '_': r'\_',
+    '{': r'\{',
+    '}': r'\}',
+    '~': r'\textasciitilde{}',
+    '&': r'\&',
+}
+_ESCAPES_KEEP_AMPERSAND = {**_ESCAPES, '&': '&'}
+
+# A backslash is kept as-is when it starts \textbf or \& (already LaTeX)
+_SPECIAL = r'\\(?!textbf|&)|[%$#^_{}~&]'
+_PLAIN_PATTERN = re.compile(_SPECIAL)
+_BOLD_PATTERN = re.compile(r'\*\*(.+?)\*\*|' + _SPECIAL)
+
+
+def _make_replacer(escapes):
+    def replace_plain(match):
+        return escapes[match.group()]
+
+    def replace(match):
+        bold = match.group(1)
+        if bold is None:
+            return escapes[match.group()]
+        # Bold text is escaped like any other text but never rescanned for **
+        return r'\textbf\{' + _PLAIN_PATTERN.sub(replace_plain, bold) + r'\}'
+
+    return replace
+
+
+_REPLACE = _make_replacer(_ESCAPES)
+_REPLACE_KEEP_AMPERSAND = _make_replacer(_ESCAPES_KEEP_AMPERSAND)
+
+
+@functools.lru_cache(maxsize=8192)
+def escape_latex(text, preserve_ampersand=False):
+    """Escape special LaTeX characters and convert **bold** markdown"""
+    return _BOLD_PATTERN.sub(_REPLACE_KEEP_AMPERSAND if preserve_ampersand else _REPLACE, text)
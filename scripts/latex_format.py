@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Precompiled LaTeX preamble support.
+
+Loading the template's packages dominates each pdflatex run. This module dumps
+the preamble of a generated .tex file into a .fmt format file once, keyed by
+the preamble hash and TeX engine version, so every later compile only has to
+typeset the document body.
+"""
+
+import functools
+import os
+import subprocess
+from pathlib import Path
+
+from build_cache import hash_bytes
+
+BEGIN_DOCUMENT = '\\begin{document}'
+
+
+@functools.lru_cache(maxsize=None)
+def engine_version(engine='pdflatex'):
+    """First line of `engine --version`; formats are only valid for the engine that dumped them"""
+    try:
+        result = subprocess.run([engine, '--version'], capture_output=True, text=True)
+    except FileNotFoundError:
+        return None
+    return result.stdout.splitlines()[0] if result.stdout else None
+
+
+def split_preamble(latex_content):
+    """Split LaTeX source into (preamble, body); body starts at \\begin{document}.
+
+    Returns (None, latex_content) when the document has no \\begin{document}.
+    """
+    index = latex_content.find(BEGIN_DOCUMENT)
+    if index == -1:
+        return None, latex_content
+    return latex_content[:index], latex_content[index:]
+
+
+def format_env(format_dir):
+    """Environment that lets TeX find formats in format_dir before the system ones"""
+    env = os.environ.copy()
+    env['TEXFORMATS'] = f"{format_dir}{os.pathsep}{env.get('TEXFORMATS', '')}"
+    return env
+
+
+def ensure_preamble_format(preamble, format_dir, engine='pdflatex', echo=print):
+    """Return the name of a format with `preamble` preloaded, dumping it if needed.
+
+    The format name is derived from the preamble hash, so a changed preamble
+    gets a new format instead of silently reusing a stale one. Returns None if
+    the engine is missing or the preamble cannot be dumped; callers should then
+    compile the full document normally. Progress goes through echo.
+    """
+    version = engine_version(engine)
+    if version is None:
+        return None
+
+    format_dir = Path(format_dir).resolve()
+    format_dir.mkdir(parents=True, exist_ok=True)
+
+    preamble_hash = hash_bytes((version + '\n' + preamble).encode('utf-8'))
+    format_name = f"preamble-{preamble_hash[:16]}"
+    format_path = format_dir / f"{format_name}.fmt"
+    if format_path.exists():
+        return format_name
+
+    # Dump under a per-process job name and rename into place, so parallel
+    # batch workers racing on the same preamble never load a half-written file
+    job_name = f"{format_name}-{os.getpid()}"
+    source_path = format_dir / f"{job_name}.tex"
+    source_path.write_text(preamble + '\n\\dump\n', encoding='utf-8')
+
+    try:
+        result = subprocess.run([
+            engine,
+            '-ini',
+            '-interaction=nonstopmode',
+            f'-jobname={job_name}',
+            f'-output-directory={format_dir}',
+            f'&{engine}',
+            str(source_path)
+        ], cwd=format_dir, capture_output=True, text=True)
+
+        dumped_path = format_dir / f"{job_name}.fmt"
+        if result.returncode != 0 or not dumped_path.exists():
+            print("⚠️  Could not precompile preamble, falling back to full compile")
+            return None
+
+        os.replace(dumped_path, format_path)
+        echo(f"✅ Precompiled preamble: {format_path}")
+        return format_name
+    finally:
+        for suffix in ('.tex', '.log', '.fmt'):
+            leftover = format_dir / f"{job_name}{suffix}"
+            if leftover.exists():
+                leftover.unlink()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Streaming Markdown renderer for resume data.
+
+The document is produced line by line, one generator per section, so it can
+be written to a file or sent as an HTTP response without ever holding the
+whole document in memory. Works on the merged section data alone, so both
+the generator script and the webapp can use it.
+"""
+
+
+def _section(heading, body_lines):
+    """Wrap section body lines with a heading and the trailing rule"""
+    yield heading
+    yield ""
+    yield from body_lines
+    yield "---"
+    yield ""
+
+
+def iter_header(data):
+    personal = data.get('personal', {})
+    yield f"# {personal.get('name', 'Your Name')}"
+    yield ""
+    yield f"**{personal.get('title', 'Your Title')}**"
+    yield ""
+    yield f"📧 {personal.get('email', '')} | 📱 {personal.get('phone', '')} | 📍 {personal.get('location', '')}"
+    yield f"💻 {personal.get('github', '')} | 🌐 {personal.get('linkedin', '')} | 🌍 {personal.get('website', '')}"
+    yield ""
+    yield "---"
+    yield ""
+
+
+def iter_summary(data):
+    yield data['summary']['text']
+    yield ""
+
+
+def iter_skills(data):
+    for skill_group in data['skills']:
+        yield f"### {skill_group['category']}"
+        yield ""
+        for item in skill_group['items']:
+            yield f"- {item}"
+        yield ""
+
+
+def iter_experience(data):
+    for exp in data['experience']:
+        yield f"### {exp['title']}"
+        yield f"**{exp['company']}** | {exp['dates']} | {exp['location']}"
+        if exp.get('description'):
+            yield f"*{exp['description']}*"
+        yield ""
+        for highlight in exp.get('highlights', []):
+            yield f"- {highlight}"
+        yield ""
+
+
+def iter_projects(data):
+    for project in data['projects']:
+        yield f"### {project['name']}"
+        yield f"**Technologies**: {project['technologies']}"
+        yield ""
+        for highlight in project.get('highlights', []):
+            yield f"- {highlight}"
+        yield ""
+
+
+def iter_education(data):
+    for edu in data['education']:
+        yield f"**{edu['degree']}**"
+        yield f"*{edu['institution']}* | {edu['dates']}"
+        if edu.get('note'):
+            yield f"**{edu['note']}**"
+        yield ""
+        for detail in edu.get('details', []):
+            yield f"- {detail}"
+        yield ""
+
+
+def iter_achievements(data):
+    for achievement in data['achievements']['items']:
+        yield f"- {achievement}"
+    yield ""
+
+
+def iter_learning(data):
+    if data['learning'].get('focus_areas'):
+        yield "**2025 Focus Areas:**"
+        for area in data['learning']['focus_areas']:
+            yield f"- {area}"
+        yield ""
+    if data['learning'].get('continuous_learning'):
+        yield "**Continuous Learning:**"
+        for item in data['learning']['continuous_learning']:
+            yield f"- {item}"
+        yield ""
+
+
+def iter_languages(data):
+    for lang_info in data['languages']['items']:
+        yield f"- **{lang_info['language']}**: {lang_info['proficiency']}"
+    yield ""
+
+
+def iter_footer(data):
+    last_updated = data.get('metadata', {}).get('last_updated', 'June 2025')
+    website = data.get('personal', {}).get('website', 'yourwebsite.com')
+    yield f"*Portfolio: {website} | Last Updated: {last_updated}*"
+
+
+# Body sections in document order: (data key, heading, line generator)
+MARKDOWN_SECTIONS = [
+    ('summary', "## 🎯 Professional Summary", iter_summary),
+    ('skills', "## 💻 Technical Skills", iter_skills),
+    ('experience', "## 🚀 Professional Experience", iter_experience),
+    ('projects', "## 🏗️ Key Projects", iter_projects),
+    ('education', "## 🎓 Education & Certifications", iter_education),
+    ('achievements', "## 🏆 Notable Achievements", iter_achievements),
+    ('learning', "## 🌱 Current Learning & Development", iter_learning),
+    ('languages', "## 🌐 Languages", iter_languages),
+]
+
+
+def iter_markdown(data):
+    """Yield the Markdown document line by line (without newlines)"""
+    yield from iter_header(data)
+    for key, heading, iter_lines in MARKDOWN_SECTIONS:
+        if key in data:
+            yield from _section(heading, iter_lines(data))
+    yield from iter_footer(data)
+
+
+def iter_markdown_chunks(data, lines_per_chunk=256):
+    """Yield the document as newline-joined text chunks of bounded size.
+
+    Concatenating the chunks gives exactly '\\n'.join(iter_markdown(data)).
+    """
+    buffer = []
+    separator = ""
+    for line in iter_markdown(data):
+        buffer.append(line)
+        if len(buffer) >= lines_per_chunk:
+            yield separator + '\n'.join(buffer)
+            separator = "\n"
+            buffer = []
+    if buffer:
+        yield separator + '\n'.join(buffer)
+
+
+def write_markdown(data, path, buffer_size=1 << 16):
+    """Stream the Markdown document to path through a buffered file handle"""
+    with open(path, 'w', buffering=buffer_size) as f:
+        for chunk in iter_markdown_chunks(data):
+            f.write(chunk)
+    return path
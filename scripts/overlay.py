@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Layered section data: job variants as sparse overlays on top of sections/.
+
+A variant directory only holds the section files (and, inside them, the keys)
+that differ from the base. Objects are merged key by key, recursively; any
+other value (lists, strings, numbers) in the overlay replaces the base value.
+"""
+
+import json
+from pathlib import Path
+
+
+def merge_overlay(base, overlay):
+    """Merge overlay onto base without mutating either"""
+    if isinstance(base, dict) and isinstance(overlay, dict):
+        merged = dict(base)
+        for key, value in overlay.items():
+            merged[key] = merge_overlay(base[key], value) if key in base else value
+        return merged
+    return overlay
+
+
+def overlay_shadows(base, overlay):
+    """Whether overlay replaces every value of base, so base no longer affects the merge"""
+    if overlay is None:
+        return False
+    if isinstance(base, dict) and isinstance(overlay, dict):
+        return all(key in overlay and overlay_shadows(value, overlay[key]) for key, value in base.items())
+    return True
+
+
+def diff_overlay(base, variant):
+    """Smallest overlay that turns base into variant, or None if no overlay can express it.
+
+    Overlays cannot delete keys, so a variant that drops keys from the base
+    has to keep those objects in full.
+    """
+    if isinstance(base, dict) and isinstance(variant, dict):
+        diff = {}
+        for key, value in variant.items():
+            if key not in base:
+                diff[key] = value
+            elif base[key] != value:
+                sub_diff = diff_overlay(base[key], value)
+                diff[key] = value if sub_diff is None else sub_diff
+        return diff if merge_overlay(base, diff) == variant else None
+    return variant
+
+
+def sparsify_variant(base_dir, variant_dir, dry_run=False):
+    """Rewrite a variant's JSON files as minimal overlays on base_dir.
+
+    Files identical to the base are removed, others keep only differing keys.
+    Returns a list of (filename, action) tuples with action in
+    'removed', 'reduced' or 'kept'.
+    """
+    base_dir = Path(base_dir)
+    actions = []
+
+    for variant_path in sorted(Path(variant_dir).glob('*.json')):
+        base_path = base_dir / variant_path.name
+        if not base_path.exists():
+            actions.append((variant_path.name, 'kept'))
+            continue
+
+        with open(base_path, 'r', encoding='utf-8') as f:
+            base = json.load(f)
+        with open(variant_path, 'r', encoding='utf-8') as f:
+            variant = json.load(f)
+
+        diff = diff_overlay(base, variant)
+        if diff is None or diff == variant:
+            actions.append((variant_path.name, 'kept'))
+        elif diff == {}:
+            actions.append((variant_path.name, 'removed'))
+            if not dry_run:
+                variant_path.unlink()
+        else:
+            actions.append((variant_path.name, 'reduced'))
+            if not dry_run:
+                with open(variant_path, 'w', encoding='utf-8') as f:
+                    json.dump(diff, f, indent=2, ensure_ascii=False)
+                    f.write('\n')
+
+    return actions
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Page-budget fitting: trim the lowest-priority content until the PDF fits.
+
+Content is removed along a fixed plan of cuts, least important first:
+- the learning section
+- highlights, one at a time from the end of the longest experience or
+  project list (projects and older positions first on ties), down to
+  FIT_MIN_HIGHLIGHTS per entry
+- the achievements and projects sections
+- highlights down to one per entry
+
+List order is priority, so variants written by --tailor lose their least
+relevant highlights first. Applying more cuts never makes the document
+longer, which makes "fewest cuts that fit" a search over one integer.
+
+Compiles are the expensive part, so the search starts from an estimate: the
+length of the data in lines (highlights wrapped at a fixed width, fixed
+costs per section and entry) is converted to pages with a lines-per-page
+ratio calibrated on the untrimmed document. Each probe runs a single
+pdflatex pass and reads the page count, and how full the last page is, from
+the .log; every probe recalibrates the ratio. From the estimated cut count
+the search gallops outward to bracket the boundary and then bisects it with
+real compiles, typically 2-4 of them instead of one per trial edit.
+"""
+
+import copy
+import math
+import re
+import subprocess
+from pathlib import Path
+
+# Highlights kept per entry before whole sections are dropped
+FIT_MIN_HIGHLIGHTS = 2
+# Sections dropped, in order, once highlights are down to FIT_MIN_HIGHLIGHTS
+FIT_DROP_SECTIONS = ('achievements', 'projects')
+
+# Estimator weights, in text lines of the default template
+CHARS_PER_LINE = 100
+SECTION_LINES = 2.5
+ENTRY_LINES = 1.5
+HEADER_LINES = 4.0
+
+# Appended before \end{document}: the height used on the last page and the page height
+FILL_MARKER = 'RESUME-FIT-FILL'
+FILL_PROBE = f'\\par\\typeout{{{FILL_MARKER} \\the\\pagetotal\\space\\the\\pagegoal}}\n'
+PAGES_PATTERN = re.compile(r'Output written on .*?\((\d+) pages?', re.DOTALL)
+FILL_PATTERN = re.compile(FILL_MARKER + r' ([\d.]+)pt ([\d.]+)pt')
+# \pagegoal on an empty page
+MAX_DIMEN = 16383.99998
+
+
+def text_lines(text):
+    return max(1, math.ceil(len(text.replace('**', '')) / CHARS_PER_LINE))
+
+
+def estimate_lines(data):
+    """Rough height of the rendered data in text lines; only its ratio to real pages matters"""
+    lines = HEADER_LINES
+    summary = data.get('summary', {}).get('text')
+    if summary:
+        lines += SECTION_LINES + text_lines(summary)
+    if 'skills' in data:
+        lines += SECTION_LINES + sum(
+            text_lines(f"{group.get('category', '')}: {', '.join(group.get('items', []))}")
+            for group in data['skills']
+        )
+    for key, detail in (('experience', 'description'), ('projects', 'technologies')):
+        if key in data:
+            lines += SECTION_LINES
+            for entry in data[key]:
+                lines += ENTRY_LINES + (text_lines(entry[detail]) if entry.get(detail) else 0)
+                lines += sum(text_lines(text) for text in entry.get('highlights', []))
+    if 'education' in data:
+        lines += SECTION_LINES
+        for entry in data['education']:
+            details = ([entry['note']] if entry.get('note') else []) + list(entry.get('details', []))
+            lines += ENTRY_LINES + sum(text_lines(text) for text in details)
+    if 'achievements' in data:
+        lines += SECTION_LINES + sum(text_lines(text) for text in data['achievements'].get('items', []))
+    if 'learning' in data:
+        learning = data['learning']
+        items = list(learning.get('focus_areas', [])) + list(learning.get('continuous_learning', []))
+        lines += SECTION_LINES + 2 + sum(text_lines(text) for text in items)
+    if 'languages' in data:
+        lines += SECTION_LINES + 1
+    return lines
+
+
+def trim_plan(data):
+    """Cuts in the order they are applied: ('section', key) or ('highlight', key, entry index)"""
+    plan = [('section', 'learning')] if 'learning' in data else []
+    counts = {
+        (key, i): len(entry.get('highlights', []))
+        for key in ('projects', 'experience') if key in data
+        for i, entry in enumerate(data[key])
+    }
+    dropped = set()
+
+    def trim_highlights(minimum):
+        while True:
+            candidates = [(count, key == 'projects', i, key) for (key, i), count in counts.items()
+                          if count > minimum and key not in dropped]
+            if not candidates:
+                return
+            _, _, i, key = max(candidates)
+            counts[key, i] -= 1
+            plan.append(('highlight', key, i))
+
+    trim_highlights(FIT_MIN_HIGHLIGHTS)
+    for key in FIT_DROP_SECTIONS:
+        if key in data:
+            plan.append(('section', key))
+            dropped.add(key)
+    trim_highlights(1)
+    return plan
+
+
+def apply_cuts(data, plan, count):
+    """Copy of data with the first count cuts of plan applied"""
+    data = dict(data)
+    copied = set()
+    for cut in plan[:count]:
+        if cut[0] == 'section':
+            data.pop(cut[1], None)
+            continue
+        _, key, i = cut
+        if key not in data:
+            continue
+        if key not in copied:
+            data[key] = copy.deepcopy(data[key])
+            copied.add(key)
+        data[key][i]['highlights'] = data[key][i]['highlights'][:-1]
+    return data
+
+
+def describe_cuts(plan, count):
+    """Human-readable summary of the first count cuts"""
+    sections = [cut[1] for cut in plan[:count] if cut[0] == 'section']
+    highlights = sum(1 for cut in plan[:count] if cut[0] == 'highlight')
+    parts = [f"{highlights} highlight(s)"] if highlights else []
+    if sections:
+        parts.append(f"section(s) {', '.join(sections)}")
+    return ', '.join(parts) or 'nothing'
+
+
+def read_page_count(log_text):
+    """(pages, pages used) from a pdflatex log; pages used counts the last page by its fill, else None"""
+    match = PAGES_PATTERN.search(log_text)
+    if match is None:
+        return None, None
+    pages = int(match.group(1))
+    fill = FILL_PATTERN.search(log_text)
+    if fill is None:
+        return pages, None
+    total, goal = float(fill.group(1)), float(fill.group(2))
+    if goal <= 0 or goal >= MAX_DIMEN:
+        return pages, float(pages)
+    return pages, pages - 1 + min(total / goal, 1.0)
+
+
+class PageFitter:
+    """
+    Finds the fewest cuts of trim_plan(data) that fit the document in a page budget.
+
+    render(data) returns the LaTeX source for data. Probes are compiled in
+    build_dir with one pdflatex pass each, which settles the page count even
+    when cross-references would need another pass.
+    """
+
+    def __init__(self, data, render, build_dir, profiler, echo=print):
+        self.data = data
+        self.render = render
+        self.build_dir = Path(build_dir)
+        self.profiler = profiler
+        self.echo = echo
+        self.plan = trim_plan(data)
+        self.probes = {}
+        self.lines_per_page = None
+
+    def estimate(self, count):
+        return estimate_lines(apply_cuts(self.data, self.plan, count))
+
+    def measure(self, count):
+        """(pages, pages used) of the document with count cuts, from a real compile; memoized"""
+        if count in self.probes:
+            return self.probes[count]
+
+        self.build_dir.mkdir(parents=True, exist_ok=True)
+        latex = self.render(apply_cuts(self.data, self.plan, count))
+        latex = latex.replace('\\end{document}', FILL_PROBE + '\\end{document}', 1)
+        source = self.build_dir / 'fit.tex'
+        source.write_text(latex)
+        log_path = self.build_dir / 'fit.log'
+
+        with self.profiler.span(f'fit probe {count}', 'latex') as span:
+            result = subprocess.run(
+                ['pdflatex', '-interaction=nonstopmode', f'-output-directory={self.build_dir.resolve()}', str(source.resolve())],
+                cwd=self.build_dir, capture_output=True, text=True
+            )
+            log_text = log_path.read_text(errors='replace') if log_path.exists() else result.stdout
+            pages, used = read_page_count(log_text)
+            span.set(returncode=result.returncode, pages=pages)
+        if pages is None:
+            raise RuntimeError(f"pdflatex produced no pages for the fitting probe (exit status {result.returncode})")
+
+        if used is not None and used > 0:
+            # Calibrate the estimator on the latest compile
+            self.lines_per_page = self.estimate(count) / used
+        self.probes[count] = (pages, used)
+        return pages, used
+
+    def fits(self, count, budget):
+        return self.measure(count)[0] <= budget
+
+    def predict(self, budget):
+        """Fewest cuts the calibrated estimator expects to fit budget pages"""
+        for count in range(len(self.plan) + 1):
+            if self.estimate(count) / self.lines_per_page <= budget:
+                return count
+        return len(self.plan)
+
+    def fit(self, budget):
+        """Fewest cuts whose document has at most budget pages, or None if even all cuts overflow
+
+        Returns (cuts, compiles).
+        """
+        if self.fits(0, budget):
+            return 0, len(self.probes)
+        last = len(self.plan)
+        if self.lines_per_page is None:
+            # No fill measurement: start the bracket at the middle of the plan
+            guess = max(1, last // 2)
+        else:
+            guess = max(1, self.predict(budget))
+
+        # Gallop from the guess until the boundary is bracketed: lo overflows, hi fits
+        if self.fits(guess, budget):
+            lo, hi, step = 0, guess, 1
+            while hi - step > lo:
+                if not self.fits(hi - step, budget):
+                    lo = hi - step
+                    break
+                hi, step = hi - step, step * 2
+        else:
+            lo, hi, step = guess, None, 1
+            while hi is None:
+                probe = min(lo + step, last)
+                if self.fits(probe, budget):
+                    hi = probe
+                elif probe == last:
+                    return None, len(self.probes)
+                else:
+                    lo, step = probe, step * 2
+
+        while hi - lo > 1:
+            middle = (lo + hi) // 2
+            if self.fits(middle, budget):
+                hi = middle
+            else:
+                lo = middle
+        return hi, len(self.probes)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Structured timing of the generation pipeline.
+
+A Profiler records one event per timed span (section loading, model
+validation, each section emitter, template rendering, each pdflatex pass,
+file writes) in the Chrome trace event format, so a run can be written as
+JSON lines for scripts or as a trace file for chrome://tracing / Perfetto.
+Timestamps come from the monotonic perf counter, which every process on the
+machine shares, so events recorded by batch workers line up in one trace.
+
+Code under measurement always goes through a profiler; NULL_PROFILER is the
+default and does no work, so unprofiled builds pay one method call per span.
+"""
+
+import json
+import os
+import threading
+import time
+
+
+class Span:
+    """A span being timed; use as a context manager"""
+
+    __slots__ = ('profiler', 'name', 'category', 'args', 'started')
+
+    def __init__(self, profiler, name, category, args):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+        self.started = None
+
+    def set(self, **args):
+        """Attach more arguments to the event, e.g. results only known at the end"""
+        self.args.update(args)
+
+    def __enter__(self):
+        self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        ended = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        self.profiler.record(self.name, self.category, self.started, ended, self.args)
+        return False
+
+
+class NullSpan:
+    """Stand-in for Span when profiling is off"""
+
+    __slots__ = ()
+
+    def set(self, **args):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class Profiler:
+    """
+    Collects timed spans as Chrome trace "complete" events.
+
+    Listeners are called with each event as it is recorded, e.g. to stream
+    events somewhere else or to react to slow stages.
+    """
+
+    enabled = True
+
+    def __init__(self, listeners=()):
+        self.events = []
+        self.listeners = list(listeners)
+        self.pid = os.getpid()
+
+    def span(self, name, category='build', **args):
+        return Span(self, name, category, args)
+
+    def record(self, name, category, started_ns, ended_ns, args=None):
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': round(started_ns / 1000, 3),
+            'dur': round((ended_ns - started_ns) / 1000, 3),
+            'pid': self.pid,
+            'tid': threading.get_ident(),
+            'args': {} if args is None else args,
+        }
+        self.add(event)
+
+    def add(self, event):
+        self.events.append(event)
+        for listener in self.listeners:
+            listener(event)
+
+    def extend(self, events):
+        """Add events recorded elsewhere, e.g. returned by a batch worker"""
+        for event in events:
+            self.add(event)
+
+    def totals(self):
+        """[(category, name, count, total seconds)], slowest first"""
+        totals = {}
+        for event in self.events:
+            key = (event['cat'], event['name'])
+            count, total = totals.get(key, (0, 0.0))
+            totals[key] = (count + 1, total + event['dur'] / 1e6)
+        return sorted(
+            ((category, name, count, total) for (category, name), (count, total) in totals.items()),
+            key=lambda item: item[3], reverse=True
+        )
+
+    def write(self, path):
+        """Write the events as JSON lines (*.jsonl) or as a Chrome trace file (anything else)"""
+        events = sorted(self.events, key=lambda event: event['ts'])
+        with open(path, 'w') as f:
+            if str(path).endswith('.jsonl'):
+                for event in events:
+                    f.write(json.dumps(event) + '\n')
+            else:
+                json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+        return path
+
+
+class NullProfiler:
+    """Profiler that records nothing"""
+
+    enabled = False
+    events = ()
+
+    _span = NullSpan()
+
+    def span(self, name, category='build', **args):
+        return self._span
+
+    def record(self, name, category, started_ns, ended_ns, args=None):
+        pass
+
+    def extend(self, events):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
@@ -7,11 +7,77 @@ import argparse
 import json
 import os
 import re
-import subprocess
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
 
+# Only what every command needs is imported here. Modules used by a single
+# command (PDF compilation, batch builds, snapshots, the data model, ...) are
+# imported where they are used, so a call that needs none of them doesn't pay
+# for them. benchmarks/bench_startup.py keeps an eye on this.
+from build_cache import BuildCache, hash_bytes, hash_file
+from latex_escape import escape_latex
+from latex_blocks import highlights, onecolentry, section, twocolentry, vspace
+from overlay import merge_overlay
+from profiling import NULL_PROFILER
+from template_engine import CompiledTemplate
+
+# Bump whenever generated output changes for identical input, so cached builds are invalidated
+GENERATOR_VERSION = "2.1"
+
+# Section files and the data key each one provides
+SECTION_FILES = {
+    'personal.json': 'personal',
+    'summary.json': 'summary',
+    'skills.json': 'skills',
+    'experience.json': 'experience',
+    'projects.json': 'projects',
+    'education.json': 'education',
+    'achievements.json': 'achievements',
+    'learning.json': 'learning',
+    'languages.json': 'languages',
+    'metadata.json': 'metadata'
+}
+
+# Data key each template placeholder is rendered from
+PLACEHOLDER_SECTIONS = {
+    'NAME': 'personal',
+    'LOCATION': 'personal',
+    'EMAIL': 'personal',
+    'PHONE': 'personal',
+    'PHONE_CLEAN': 'personal',
+    'WEBSITE': 'personal',
+    'LINKEDIN': 'personal',
+    'GITHUB': 'personal',
+    'SUMMARY': 'summary',
+    'LAST_UPDATED': 'metadata',
+    'SKILLS_SECTION': 'skills',
+    'EXPERIENCE_SECTION': 'experience',
+    'PROJECTS_SECTION': 'projects',
+    'EDUCATION_SECTION': 'education',
+    'ACHIEVEMENTS_SECTION': 'achievements',
+    'LEARNING_SECTION': 'learning',
+    'LANGUAGES_SECTION': 'languages',
+}
+
+# Formats each CLI command produces; a PDF is compiled from the .tex, so it implies LaTeX
+COMMAND_FORMATS = {
+    'md': ('md',),
+    'tex': ('tex',),
+    'pdf': ('tex', 'pdf'),
+    'all': ('md', 'tex', 'pdf'),
+}
+
+# Backends producing the printable document: pdflatex, or the webapp template as print-ready HTML
+ENGINES = ('latex', 'html', 'auto')
+
+# Log messages asking for another LaTeX pass (kernel, hyperref, lastpage, longtable, ...)
+LATEX_RERUN_PATTERN = re.compile(r'Rerun to get|Label\(s\) may have changed|Rerun LaTeX|\(rerunfilecheck\)')
+
+
+def _silent(*args, **kwargs):
+    """print() replacement for quiet mode"""
+
 
 class ResumeGenerator:
     """
@@ -19,395 +85,594 @@ class ResumeGenerator:
     professional LaTeX and PDF outputs using external template files.
     """
 
-    def __init__(self, sections_dir="sections", templates_dir="templates", output_dir="output"):
+    def __init__(self, sections_dir="sections", templates_dir="templates", output_dir="output", use_cache=True,
+                 build_dir=None, max_latex_passes=3, precompile_preamble=False, format_cache_dir=None, data=None,
+                 base_dir=None, snapshot_path=None, profiler=None, quiet=False, fit_pages=None):
         self.sections_dir = Path(sections_dir)
+        # When set, sections_dir is a sparse overlay merged on top of base_dir
+        self.base_dir = Path(base_dir) if base_dir else None
         self.templates_dir = Path(templates_dir)
-        self.output_dir = Path(output_dir)
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        self.use_cache = use_cache
+
+        # Where pdflatex writes aux/log files; a persistent dir lets them carry over between builds
+        self.build_dir = Path(build_dir) if build_dir else None
+        self.max_latex_passes = max_latex_passes
+
+        # Opt-in: compile against a cached .fmt with the template preamble preloaded
+        self.precompile_preamble = precompile_preamble
+        self.format_cache_dir = Path(format_cache_dir) if format_cache_dir else None
+
+        # Page budget for LaTeX/PDF output: lowest-priority content is trimmed until it fits
+        self.fit_pages = fit_pages
+
+        # Content hash of every loaded section file, used as build cache input
+        self.section_hashes = {}
+        # Section files that exist but could not be loaded, with the error
+        self.load_errors = {}
+        # Data keys each loaded section file provided
+        self.file_keys = {}
+
+        # Data keys to load (None = all); set before the data is first used
+        self.sections = None
+
+        # Timed spans go to the profiler; quiet drops progress messages (warnings and errors still print)
+        self.profiler = profiler or NULL_PROFILER
+        self.echo = _silent if quiet else print
+
+        # Compiled snapshot of the section files; fresh entries are used instead of parsing JSON
+        self.snapshot = None
+        if snapshot_path:
+            from snapshot import load_snapshot
+            self.snapshot = load_snapshot(snapshot_path)
 
-        # Ensure output directory exists
-        self.output_dir.mkdir(exist_ok=True)
+        # Section files are loaded on first use, unless already-merged data was given
+        self._data = data
+        self._resume = None
 
-        # Load and combine all modular JSON files
-        self.data = self.load_modular_json_data()
+        # Template and placeholder values of the last incremental render
+        self._latex_template = None
+        self._latex_values = {}
+
+    @property
+    def data(self):
+        """Merged section data, loaded from the JSON files on first use"""
+        if self._data is None:
+            self._data = self.load_modular_json_data()
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._resume = None
+
+    @property
+    def resume(self):
+        """Typed model of self.data, parsed on first use after data changes"""
+        if self._resume is None:
+            from resume_model import Resume
+            data = self.data
+            with self.profiler.span('validate', 'model'):
+                self._resume = Resume.from_dict(data)
+        return self._resume
+
+    def validate(self):
+        """Parse the data into the typed model; raises ResumeDataError before anything is written"""
+        return self.resume
+
+    def ensure_output_dir(self):
+        """Create the output directory; only done once something is about to be written"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def sections_for_template(self, template_name="modern_template.tex"):
+        """Data keys the template's placeholders are rendered from"""
+        template = self.load_template(template_name)
+        return {PLACEHOLDER_SECTIONS[name] for name in template.placeholders if name in PLACEHOLDER_SECTIONS}
 
     def load_modular_json_data(self):
-        """Load all JSON files from sections directory and combine into single data structure"""
+        """Load the JSON files from the sections directory and combine into single data structure
+
+        Only the files for self.sections are read when it is set.
+        """
         combined_data = {}
 
-        # Define the expected JSON files and their content structure
-        json_files = {
-            'personal.json': 'personal',
-            'summary.json': 'summary',
-            'skills.json': 'skills',
-            'experience.json': 'experience',
-            'projects.json': 'projects',
-            'education.json': 'education',
-            'achievements.json': 'achievements',
-            'learning.json': 'learning',
-            'languages.json': 'languages',
-            'metadata.json': 'metadata'
-        }
+        with self.profiler.span('load sections', 'load', sections_dir=str(self.sections_dir)):
+            for filename, data_key in SECTION_FILES.items():
+                if self.sections is not None and data_key not in self.sections:
+                    continue
 
-        for filename, data_key in json_files.items():
-            json_path = self.sections_dir / filename
-
-            if json_path.exists():
-                try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        file_data = json.load(f)
-                        combined_data.update(file_data)
-                        print(f"✅ Loaded {filename}")
-                except Exception as e:
-                    print(f"❌ Error loading {filename}: {e}")
-            else:
-                print(f"⚠️  {filename} not found, skipping...")
+                file_data = self.load_section_file(filename)
+                if file_data is not None:
+                    combined_data.update(file_data)
+                    self.file_keys[filename] = tuple(file_data)
+
+        if self.snapshot is not None and self.snapshot.hits:
+            self.echo(f"ℹ️  {self.snapshot.hits} section file(s) read from snapshot")
 
         return combined_data
 
+    def load_section_file(self, filename):
+        """Load one section file, merged onto its base file if there is one
+
+        Returns None if neither exists or the file could not be loaded.
+        """
+        json_path = self.sections_dir / filename
+        base_path = self.base_dir / filename if self.base_dir else None
+        has_overlay = json_path.exists()
+        has_base = base_path is not None and base_path.exists()
+
+        if not (has_overlay or has_base):
+            print(f"⚠️  {filename} not found, skipping...")
+            return None
+
+        try:
+            with self.profiler.span(f"load {filename}", 'load'):
+                file_data = None
+                if has_base:
+                    file_data = self.read_section_file(base_path, f"base/{filename}")
+                if has_overlay:
+                    overlay_data = self.read_section_file(json_path, filename)
+                    file_data = merge_overlay(file_data, overlay_data) if has_base else overlay_data
+        except Exception as e:
+            self.load_errors[filename] = str(e)
+            print(f"❌ Error loading {filename}: {e}")
+            return None
+
+        if has_base and has_overlay:
+            self.echo(f"✅ Loaded {filename} (overlay on {self.base_dir})")
+        elif has_base:
+            self.echo(f"✅ Loaded {filename} (from {self.base_dir})")
+        else:
+            self.echo(f"✅ Loaded {filename}")
+        return file_data
+
+    def reload_section_file(self, filename):
+        """Reread a single section file into the loaded data; returns the data keys whose value changed
+
+        A file that fails to load (e.g. caught mid-save) keeps its previous
+        data. Other sections, and the template output cached for them, are
+        left untouched.
+        """
+        if filename not in SECTION_FILES:
+            return set()
+
+        self.load_errors.pop(filename, None)
+        self.section_hashes.pop(filename, None)
+        self.section_hashes.pop(f"base/{filename}", None)
+        file_data = self.load_section_file(filename)
+        if filename in self.load_errors:
+            return set()
+        file_data = file_data or {}
+
+        old_keys = self.file_keys.get(filename, ())
+        data = dict(self.data)
+        old_values = {key: data.pop(key) for key in old_keys if key in data}
+        data.update(file_data)
+        self.file_keys[filename] = tuple(file_data)
+
+        changed = {
+            key for key in old_values.keys() | file_data.keys()
+            if key not in old_values or key not in file_data or old_values[key] != file_data[key]
+        }
+        if changed:
+            self.data = data
+        return changed
+
+    def read_section_file(self, path, hash_key):
+        """Parsed contents of a section file, from the snapshot when it is still fresh"""
+        cached = self.snapshot.lookup(path) if self.snapshot is not None else None
+        if cached is not None:
+            digest, file_data = cached
+        else:
+            raw = path.read_bytes()
+            file_data = json.loads(raw.decode('utf-8'))
+            digest = hash_bytes(raw)
+        self.section_hashes[hash_key] = digest
+        return file_data
+
     def clean_phone_for_tel(self, phone):
         """Clean phone number for tel: links"""
         return re.sub(r'[^\d+]', '', phone)
     
     def escape_latex(self, text, preserve_ampersand=False):
         """Escape special LaTeX characters"""
-        # Convert markdown bold to LaTeX first
-        text = re.sub(r'\*\*(.+?)\*\*', r'\\textbf{\1}', text)
-        
-        # Basic LaTeX escaping - order matters!
-        # Handle backslash first, but preserve already escaped sequences
-        text = re.sub(r'\\(?!textbf|&)', r'\\textbackslash{}', text)
-        
-        latex_special_chars = {
-            '%': r'\%',
-            '$': r'\$',
-            '#': r'\#',
-            '^': r'\textasciicircum{}',
-            '_': r'\_',
-            '{': r'\{',
-            '}': r'\}',
-            '~': r'\textasciitilde{}',
-        }
-        
-        # Only escape & if not preserving it (for section titles)
-        if not preserve_ampersand:
-            latex_special_chars['&'] = r'\&'
-        
-        for char, escape in latex_special_chars.items():
-            text = text.replace(char, escape)
-        
-        return text
+        return escape_latex(text, preserve_ampersand)
     
-    def generate_skills_section(self):
-        """Generate skills section LaTeX"""
-        if 'skills' not in self.data:
-            return ""
+    def iter_skills_section(self):
+        """Stream skills section LaTeX"""
+        if self.resume.skills is None:
+            return
         
-        skills_latex = "\\section{Technical Skills}\n\n"
+        yield from section("Technical Skills")
         
-        for skill_group in self.data['skills']:
-            category = skill_group['category']
-            items = skill_group['items']
-            
+        for skill_group in self.resume.skills:
             # Create a single line with all skills in this category
-            skills_text = ", ".join([self.escape_latex(item) for item in items])
+            skills_text = ", ".join(skill_group.tex('items'))
             
-            skills_latex += f"\\begin{{onecolentry}}\n"
-            skills_latex += f"\\textbf{{{self.escape_latex(category)}:}} {skills_text}\n"
-            skills_latex += f"\\end{{onecolentry}}\n\n"
-            skills_latex += f"\\vspace{{0.2 cm}}\n\n"
-        
-        return skills_latex
+            yield from onecolentry(f"\\textbf{{{skill_group.tex('category')}:}} {skills_text}")
+            yield from vspace("0.2")
     
-    def generate_experience_section(self):
-        """Generate experience section LaTeX"""
-        if 'experience' not in self.data:
-            return ""
+    def iter_experience_section(self):
+        """Stream experience section LaTeX"""
+        if self.resume.experience is None:
+            return
         
-        experience_latex = "\\section{Experience}\n\n"
+        yield from section("Experience")
         
-        for i, exp in enumerate(self.data['experience']):
+        for i, exp in enumerate(self.resume.experience):
             if i > 0:
-                experience_latex += "\\vspace{0.2 cm}\n\n"
+                yield from vspace("0.2")
             
-            # Format dates
-            dates = exp['dates']
-            title = self.escape_latex(exp['title'])
-            company = self.escape_latex(exp['company'])
-            location = self.escape_latex(exp['location'])
+            location = exp.tex('location')
             
             # Create header
-            experience_latex += f"\\begin{{twocolentry}}{{\n"
-            experience_latex += f"{dates}\n"
-            experience_latex += f"}}\n"
-            experience_latex += f"    \\textbf{{{title}}}, {company}"
+            header = f"\\textbf{{{exp.tex('title')}}}, {exp.tex('company')}"
             if location and location != "Contract" and location != "Remote" and location != "Part-time":
-                experience_latex += f" -- {location}"
-            experience_latex += f"\\end{{twocolentry}}\n\n"
+                header += f" -- {location}"
+            yield from twocolentry(exp.dates, header)
             
             # Add description if exists
-            if exp.get('description') and exp['description'].strip():
-                experience_latex += f"\\vspace{{0.05 cm}}\n"
-                experience_latex += f"\\begin{{onecolentry}}\n"
-                experience_latex += f"    \\textit{{{self.escape_latex(exp['description'])}}}\n"
-                experience_latex += f"\\end{{onecolentry}}\n\n"
+            if exp.description and exp.description.strip():
+                yield from vspace("0.05", blank_line=False)
+                yield from onecolentry(f"    \\textit{{{exp.tex('description')}}}")
             
             # Add highlights
-            if exp.get('highlights'):
-                experience_latex += f"\\vspace{{0.10 cm}}\n"
-                experience_latex += f"\\begin{{onecolentry}}\n"
-                experience_latex += f"    \\begin{{highlights}}\n"
-                
-                for highlight in exp['highlights']:
-                    experience_latex += f"        \\item {self.escape_latex(highlight)}\n"
-                
-                experience_latex += f"    \\end{{highlights}}\n"
-                experience_latex += f"\\end{{onecolentry}}\n\n"
-        
-        return experience_latex
+            if exp.highlights:
+                yield from vspace("0.10", blank_line=False)
+                yield from highlights(exp.tex('highlights'))
     
-    def generate_projects_section(self):
-        """Generate projects section LaTeX"""
-        if 'projects' not in self.data:
-            return ""
+    def iter_projects_section(self):
+        """Stream projects section LaTeX"""
+        if self.resume.projects is None:
+            return
         
-        projects_latex = "\\section{Projects}\n\n"
+        yield from section("Projects")
         
-        for i, project in enumerate(self.data['projects']):
+        for i, project in enumerate(self.resume.projects):
             if i > 0:
-                projects_latex += "\\vspace{0.2 cm}\n\n"
+                yield from vspace("0.2")
             
-            name = self.escape_latex(project['name'])
-            technologies = self.escape_latex(project['technologies'])
-            link = project.get('link', '')
+            technologies = project.tex('technologies')
+            link = project.link
             
-            # Create header with link if available
-            projects_latex += f"\\begin{{twocolentry}}{{\n"
-            if link:
-                projects_latex += f"    \\hrefWithoutArrow{{{link}}}{{{link}}}\n"
-            else:
-                projects_latex += f"    \n"  # Empty if no link
-            projects_latex += f"}}\n"
-            projects_latex += f"    \\textbf{{{name}}}\\end{{twocolentry}}\n\n"
+            # Create header with link if available (empty right column otherwise)
+            link_line = f"    \\hrefWithoutArrow{{{link}}}{{{link}}}" if link else "    "
+            yield from twocolentry(link_line, f"\\textbf{{{project.tex('name')}}}")
             
             # Add technologies
             if technologies:
-                projects_latex += f"\\vspace{{0.05 cm}}\n"
-                projects_latex += f"\\begin{{onecolentry}}\n"
-                projects_latex += f"    \\textbf{{Technologies:}} {technologies}\n"
-                projects_latex += f"\\end{{onecolentry}}\n\n"
+                yield from vspace("0.05", blank_line=False)
+                yield from onecolentry(f"    \\textbf{{Technologies:}} {technologies}")
             
             # Add highlights
-            if project.get('highlights'):
-                projects_latex += f"\\vspace{{0.10 cm}}\n"
-                projects_latex += f"\\begin{{onecolentry}}\n"
-                projects_latex += f"    \\begin{{highlights}}\n"
-                
-                for highlight in project['highlights']:
-                    projects_latex += f"        \\item {self.escape_latex(highlight)}\n"
-                
-                projects_latex += f"    \\end{{highlights}}\n"
-                projects_latex += f"\\end{{onecolentry}}\n\n"
-        
-        return projects_latex
+            if project.highlights:
+                yield from vspace("0.10", blank_line=False)
+                yield from highlights(project.tex('highlights'))
     
-    def generate_education_section(self):
-        """Generate education section LaTeX"""
-        if 'education' not in self.data:
-            return ""
+    def iter_education_section(self):
+        """Stream education section LaTeX"""
+        if self.resume.education is None:
+            return
         
-        education_latex = "\\section{Education}\n\n"
+        yield from section("Education")
         
-        for i, edu in enumerate(self.data['education']):
+        for i, edu in enumerate(self.resume.education):
             if i > 0:
-                education_latex += "\\vspace{0.2 cm}\n\n"
+                yield from vspace("0.2")
             
-            degree = self.escape_latex(edu['degree'])
-            institution = self.escape_latex(edu['institution'])
-            dates = edu['dates']
-            location = self.escape_latex(edu.get('location', ''))
-            note = self.escape_latex(edu.get('note', ''))
+            location = edu.tex('location')
+            note = edu.tex('note')
             
             # Create header
-            education_latex += f"\\begin{{twocolentry}}{{\n"
-            education_latex += f"    {dates}\n"
-            education_latex += f"}}\n"
-            education_latex += f"    \\textbf{{{institution}}}, {degree}"
+            header = f"\\textbf{{{edu.tex('institution')}}}, {edu.tex('degree')}"
             if location:
-                education_latex += f" -- {location}"
-            education_latex += f"\\end{{twocolentry}}\n\n"
+                header += f" -- {location}"
+            yield from twocolentry(f"    {edu.dates}", header)
             
             # Add note and details
-            if note or edu.get('details'):
-                education_latex += f"\\vspace{{0.10 cm}}\n"
-                education_latex += f"\\begin{{onecolentry}}\n"
-                education_latex += f"    \\begin{{highlights}}\n"
-                
-                if note:
-                    education_latex += f"        \\item {note}\n"
-                
-                for detail in edu.get('details', []):
-                    education_latex += f"        \\item {self.escape_latex(detail)}\n"
-                
-                education_latex += f"    \\end{{highlights}}\n"
-                education_latex += f"\\end{{onecolentry}}\n\n"
-        
-        return education_latex
+            if note or edu.details:
+                items = [note] if note else []
+                items.extend(edu.tex('details'))
+                yield from vspace("0.10", blank_line=False)
+                yield from highlights(items)
     
-    def generate_achievements_section(self):
-        """Generate achievements section LaTeX"""
-        if 'achievements' not in self.data or not self.data['achievements'].get('items'):
-            return ""
-        
-        achievements_latex = "\\section{Notable Achievements}\n\n"
-        achievements_latex += "\\begin{onecolentry}\n"
-        achievements_latex += "    \\begin{highlightsforbulletentries}\n"
-        
-        for achievement in self.data['achievements']['items']:
-            achievements_latex += f"        \\item {self.escape_latex(achievement)}\n"
-        
-        achievements_latex += "    \\end{highlightsforbulletentries}\n"
-        achievements_latex += "\\end{onecolentry}\n\n"
+    def iter_achievements_section(self):
+        """Stream achievements section LaTeX"""
+        if not self.resume.achievements:
+            return
         
-        return achievements_latex
+        yield from section("Notable Achievements")
+        yield from highlights(
+            (self.escape_latex(achievement) for achievement in self.resume.achievements),
+            environment='highlightsforbulletentries'
+        )
     
-    def generate_learning_section(self):
-        """Generate learning section LaTeX"""
-        if 'learning' not in self.data:
-            return ""
+    def iter_learning_section(self):
+        """Stream learning section LaTeX"""
+        learning = self.resume.learning
+        if learning is None:
+            return
         
-        learning_latex = "\\section{Current Learning \\& Development}\n\n"
+        yield from section("Current Learning \\& Development")
         
         # Focus areas
-        if self.data['learning'].get('focus_areas'):
-            learning_latex += "\\begin{onecolentry}\n"
-            learning_latex += "    \\textbf{2025 Focus Areas:}\n"
-            learning_latex += "\\end{onecolentry}\n\n"
-            learning_latex += "\\begin{onecolentry}\n"
-            learning_latex += "    \\begin{highlights}\n"
-            
-            for area in self.data['learning']['focus_areas']:
-                learning_latex += f"        \\item {self.escape_latex(area)}\n"
-            
-            learning_latex += "    \\end{highlights}\n"
-            learning_latex += "\\end{onecolentry}\n\n"
+        if learning.focus_areas:
+            yield from onecolentry("    \\textbf{2025 Focus Areas:}")
+            yield from highlights(learning.tex('focus_areas'))
         
         # Continuous learning
-        if self.data['learning'].get('continuous_learning'):
-            learning_latex += "\\vspace{0.2 cm}\n\n"
-            learning_latex += "\\begin{onecolentry}\n"
-            learning_latex += "    \\textbf{Continuous Learning:}\n"
-            learning_latex += "\\end{onecolentry}\n\n"
-            learning_latex += "\\begin{onecolentry}\n"
-            learning_latex += "    \\begin{highlights}\n"
-            
-            for item in self.data['learning']['continuous_learning']:
-                learning_latex += f"        \\item {self.escape_latex(item)}\n"
-            
-            learning_latex += "    \\end{highlights}\n"
-            learning_latex += "\\end{onecolentry}\n\n"
-        
-        return learning_latex
+        if learning.continuous_learning:
+            yield from vspace("0.2")
+            yield from onecolentry("    \\textbf{Continuous Learning:}")
+            yield from highlights(learning.tex('continuous_learning'))
     
-    def generate_languages_section(self):
-        """Generate languages section LaTeX"""
-        if 'languages' not in self.data or not self.data['languages'].get('items'):
-            return ""
+    def iter_languages_section(self):
+        """Stream languages section LaTeX"""
+        if not self.resume.languages:
+            return
         
-        languages_latex = "\\section{Languages}\n\n"
+        yield from section("Languages")
         
         # Create a single line with all languages
-        language_items = []
-        for lang_info in self.data['languages']['items']:
-            language = self.escape_latex(lang_info['language'])
-            proficiency = self.escape_latex(lang_info['proficiency'])
-            language_items.append(f"\\textbf{{{language}}}: {proficiency}")
+        language_items = [
+            f"\\textbf{{{lang_info.tex('language')}}}: {lang_info.tex('proficiency')}"
+            for lang_info in self.resume.languages
+        ]
         
-        languages_text = ", ".join(language_items)
-        
-        languages_latex += "\\begin{onecolentry}\n"
-        languages_latex += f"    {languages_text}\n"
-        languages_latex += "\\end{onecolentry}\n\n"
+        yield from onecolentry(f"    {', '.join(language_items)}")
+    
+    def generate_skills_section(self):
+        """Generate skills section LaTeX"""
+        with self.profiler.span('section skills', 'section'):
+            return ''.join(self.iter_skills_section())
+    
+    def generate_experience_section(self):
+        """Generate experience section LaTeX"""
+        with self.profiler.span('section experience', 'section'):
+            return ''.join(self.iter_experience_section())
+    
+    def generate_projects_section(self):
+        """Generate projects section LaTeX"""
+        with self.profiler.span('section projects', 'section'):
+            return ''.join(self.iter_projects_section())
+    
+    def generate_education_section(self):
+        """Generate education section LaTeX"""
+        with self.profiler.span('section education', 'section'):
+            return ''.join(self.iter_education_section())
+    
+    def generate_achievements_section(self):
+        """Generate achievements section LaTeX"""
+        with self.profiler.span('section achievements', 'section'):
+            return ''.join(self.iter_achievements_section())
+    
+    def generate_learning_section(self):
+        """Generate learning section LaTeX"""
+        with self.profiler.span('section learning', 'section'):
+            return ''.join(self.iter_learning_section())
+    
+    def generate_languages_section(self):
+        """Generate languages section LaTeX"""
+        with self.profiler.span('section languages', 'section'):
+            return ''.join(self.iter_languages_section())
+    
+    def template_resolvers(self):
+        """Map each template placeholder to a callable producing its value.
+
+        Values are computed lazily, so sections a template doesn't reference
+        are never generated.
+        """
+        personal = self.resume.personal
         
-        return languages_latex
+        return {
+            'NAME': lambda: personal.get('name', 'Your Name'),
+            'LOCATION': lambda: personal.get('location', 'Your Location'),
+            'EMAIL': lambda: personal.get('email', 'your.email@example.com'),
+            'PHONE': lambda: personal.get('phone', '+1 234 567 8900'),
+            'PHONE_CLEAN': lambda: self.clean_phone_for_tel(personal.get('phone', '+1 234 567 8900')),
+            'WEBSITE': lambda: personal.get('website', 'yourwebsite.com'),
+            'LINKEDIN': lambda: personal.get('linkedin', 'linkedin.com/in/yourprofile'),
+            'GITHUB': lambda: personal.get('github', 'github.com/yourusername'),
+            'SUMMARY': lambda: self.escape_latex(self.resume.get('summary', 'Your professional summary here')),
+            'LAST_UPDATED': lambda: self.resume.get('last_updated', 'June 2025'),
+            'SKILLS_SECTION': self.generate_skills_section,
+            'EXPERIENCE_SECTION': self.generate_experience_section,
+            'PROJECTS_SECTION': self.generate_projects_section,
+            'EDUCATION_SECTION': self.generate_education_section,
+            'ACHIEVEMENTS_SECTION': self.generate_achievements_section,
+            'LEARNING_SECTION': self.generate_learning_section,
+            'LANGUAGES_SECTION': self.generate_languages_section,
+        }
     
-    def generate_latex_from_template(self, template_name="modern_template.tex"):
-        """Generate LaTeX from template file"""
+    def load_template(self, template_name="modern_template.tex"):
+        """Return the compiled template, parsed once per file and reused while it is unchanged"""
         template_path = self.templates_dir / template_name
-        output_path = self.output_dir / "resume.tex"
         
         if not template_path.exists():
             raise FileNotFoundError(f"Template file not found: {template_path}")
         
-        # Read template
-        with open(template_path, 'r') as f:
-            template_content = f.read()
-        
-        # Extract personal information
-        personal = self.data.get('personal', {})
+        return CompiledTemplate.load(template_path)
+    
+    def render_latex(self, template_name="modern_template.tex"):
+        """Render the LaTeX document in memory"""
+        template = self.load_template(template_name)
+        resolvers = self.template_resolvers()
+        with self.profiler.span(f"render {template_name}", 'template'):
+            return template.render(resolvers)
+    
+    def render_latex_incremental(self, template_name="modern_template.tex", changed_sections=None):
+        """Render the LaTeX document, recomputing only placeholders whose sections changed
+
+        Placeholder values from the previous call are kept and spliced back into
+        the template. changed_sections=None, or a template that changed on disk,
+        recomputes every placeholder.
+        """
+        template = self.load_template(template_name)
+        if template is not self._latex_template or changed_sections is None:
+            self._latex_template = template
+            self._latex_values = {}
+
+        values = self._latex_values
+        resolvers = self.template_resolvers()
+        with self.profiler.span(f"render {template_name}", 'template', incremental=True):
+            for name in template.placeholders & resolvers.keys():
+                if name not in values or (changed_sections and PLACEHOLDER_SECTIONS.get(name) in changed_sections):
+                    values[name] = str(resolvers[name]())
+            return template.render_values(values)
+
+    def generate_latex_from_template(self, template_name="modern_template.tex"):
+        """Generate LaTeX from template file"""
+        output_path = self.output_dir / "resume.tex"
+        self.validate()
+        self.ensure_output_dir()
         
-        # Prepare replacements
-        replacements = {
-            'NAME': personal.get('name', 'Your Name'),
-            'LOCATION': personal.get('location', 'Your Location'),
-            'EMAIL': personal.get('email', 'your.email@example.com'),
-            'PHONE': personal.get('phone', '+1 234 567 8900'),
-            'PHONE_CLEAN': self.clean_phone_for_tel(personal.get('phone', '+1 234 567 8900')),
-            'WEBSITE': personal.get('website', 'yourwebsite.com'),
-            'LINKEDIN': personal.get('linkedin', 'linkedin.com/in/yourprofile'),
-            'GITHUB': personal.get('github', 'github.com/yourusername'),
-            'SUMMARY': self.escape_latex(self.data.get('summary', {}).get('text', 'Your professional summary here')),
-            'LAST_UPDATED': self.data.get('metadata', {}).get('last_updated', 'June 2025'),
-            'SKILLS_SECTION': self.generate_skills_section(),
-            'EXPERIENCE_SECTION': self.generate_experience_section(),
-            'PROJECTS_SECTION': self.generate_projects_section(),
-            'EDUCATION_SECTION': self.generate_education_section(),
-            'ACHIEVEMENTS_SECTION': self.generate_achievements_section(),
-            'LEARNING_SECTION': self.generate_learning_section(),
-            'LANGUAGES_SECTION': self.generate_languages_section(),
-        }
+        template = self.load_template(template_name)
+        resolvers = self.template_resolvers()
         
-        # Replace placeholders
-        for key, value in replacements.items():
-            placeholder = f"{{{{{{{key}}}}}}}"
-            template_content = template_content.replace(placeholder, str(value))
+        unknown = template.unknown_placeholders(resolvers)
+        if unknown:
+            print(f"⚠️  Unknown placeholders left in {template_name}: {', '.join(unknown)}")
+        unused = template.unused_placeholders(resolvers)
+        if unused:
+            self.echo(f"ℹ️  {template_name} does not use: {', '.join(unused)}")
         
+        with self.profiler.span(f"render {template_name}", 'template'):
+            latex = template.render(resolvers)
+
         # Write generated LaTeX
-        with open(output_path, 'w') as f:
-            f.write(template_content)
+        with self.profiler.span(f"write {output_path.name}", 'write'), open(output_path, 'w') as f:
+            f.write(latex)
         
-        print(f"✅ Generated LaTeX: {output_path}")
+        self.echo(f"✅ Generated LaTeX: {output_path}")
         return output_path
     
-    def generate_pdf_from_latex(self, latex_file):
-        """Generate PDF from LaTeX file"""
+    def fit_to_pages(self, budget, template_name="modern_template.tex", cache=None, key=None):
+        """Trim self.data until the rendered template fits in budget pages (see page_fit.py)
+
+        The number of cuts found is stored in cache under key, so unchanged
+        inputs are refitted without compiling.
+        """
+        from page_fit import PageFitter, apply_cuts, describe_cuts
+
+        def render(data):
+            probe = ResumeGenerator(templates_dir=self.templates_dir, output_dir=None, data=data, quiet=True)
+            return probe.render_latex(template_name)
+
+        fit_dir = Path(self.build_dir or self.output_dir) / '.fit'
+        fitter = PageFitter(self.data, render, fit_dir, self.profiler, self.echo)
+        cuts = cache.value('fit', key) if cache else None
+        if cuts is not None and cuts <= len(fitter.plan):
+            self.echo(f"⏭️  Page fit up to date: cutting {describe_cuts(fitter.plan, cuts)}")
+        else:
+            try:
+                with self.profiler.span('fit pages', 'latex', budget=budget) as span:
+                    cuts, compiles = fitter.fit(budget)
+                    span.set(cuts=cuts, compiles=compiles)
+            except FileNotFoundError:
+                print("⚠️  pdflatex not found, cannot fit to a page budget; using all content")
+                return self.data
+            except RuntimeError as e:
+                print(f"⚠️  Page fitting failed: {e}; using all content")
+                return self.data
+
+            if cuts is None:
+                cuts = len(fitter.plan)
+                print(f"⚠️  Does not fit in {budget} page(s) even after cutting "
+                      f"{describe_cuts(fitter.plan, cuts)}")
+            else:
+                self.echo(f"✅ Fitted to {budget} page(s) by cutting {describe_cuts(fitter.plan, cuts)} "
+                          f"({compiles} pdflatex probe(s) for {len(fitter.plan)} possible cuts)")
+            if cache:
+                cache.store_value('fit', key, cuts)
+
+        self.data = apply_cuts(self.data, fitter.plan, cuts)
+        return self.data
+
+    @staticmethod
+    def latex_needs_rerun(log_text, aux_before, aux_after):
+        """Decide whether another pdflatex pass is needed.
+
+        LaTeX and most packages (hyperref, lastpage, longtable, ...) print a
+        "Rerun" hint when cross-references are not yet stable. Beyond that, a
+        pass that read an aux file and then wrote a different one has not
+        converged. A pass that started without an aux file relies on the log:
+        the kernel itself warns "Label(s) may have changed" in that case.
+        """
+        if LATEX_RERUN_PATTERN.search(log_text):
+            return True
+        return aux_before is not None and aux_before != aux_after
+
+    def generate_pdf_from_latex(self, latex_file, max_passes=None, build_dir=None):
+        """Generate PDF from LaTeX file, running only as many passes as needed to converge"""
+        import shutil
+        import subprocess
+
         output_path = self.output_dir / "resume.pdf"
-        
+        max_passes = max_passes or self.max_latex_passes
+        build_dir = Path(build_dir or self.build_dir or self.output_dir).resolve()
+        build_dir.mkdir(parents=True, exist_ok=True)
+
+        latex_file = Path(latex_file).resolve()
+        aux_path = build_dir / latex_file.with_suffix('.aux').name
+        log_path = build_dir / latex_file.with_suffix('.log').name
+        built_pdf = build_dir / latex_file.with_suffix('.pdf').name
+
         try:
-            # Change to output directory for LaTeX compilation
-            original_dir = os.getcwd()
-            os.chdir(self.output_dir)
-            
-            # Run pdflatex twice for proper references
-            for i in range(2):
-                result = subprocess.run([
-                    'pdflatex', 
-                    '-interaction=nonstopmode', 
-                    latex_file.name
-                ], capture_output=True, text=True)
-                
-                if result.returncode != 0:
-                    print(f"❌ LaTeX compilation failed on pass {i+1}:")
-                    print(result.stderr)
-                    return None
-            
-            # Check if PDF was created (use local path since we're in output dir)
-            if Path("resume.pdf").exists():
-                print(f"✅ Generated PDF: {output_path}")
-                return output_path
+            command = ['pdflatex', '-interaction=nonstopmode', f'-output-directory={build_dir}']
+            source_file = latex_file
+            env = None
+
+            if self.precompile_preamble:
+                from latex_format import ensure_preamble_format, format_env, split_preamble
+
+                format_dir = (self.format_cache_dir or build_dir / '.fmt-cache').resolve()
+                preamble, body = split_preamble(latex_file.read_text())
+                with self.profiler.span('preamble format', 'latex'):
+                    format_name = (ensure_preamble_format(preamble, format_dir, echo=self.echo)
+                                   if preamble is not None else None)
+                if format_name:
+                    # Only the body is typeset; the job name keeps aux/log/pdf names unchanged
+                    source_file = build_dir / f"{latex_file.stem}.body.tex"
+                    source_file.write_text(body)
+                    command += [f'-fmt={format_name}', f'-jobname={latex_file.stem}']
+                    env = format_env(format_dir)
+
+            command.append(str(source_file))
+
+            for i in range(max_passes):
+                aux_before = hash_file(aux_path) if aux_path.exists() else None
+
+                with self.profiler.span(f"pdflatex pass {i+1}", 'latex') as span:
+                    result = subprocess.run(command, cwd=latex_file.parent, env=env, capture_output=True, text=True)
+                    span.set(returncode=result.returncode)
+
+                    if result.returncode != 0:
+                        print(f"❌ LaTeX compilation failed on pass {i+1}:")
+                        print(result.stderr or result.stdout)
+                        return None
+
+                    aux_after = hash_file(aux_path) if aux_path.exists() else None
+                    log_text = log_path.read_text(errors='replace') if log_path.exists() else result.stdout
+                    rerun = self.latex_needs_rerun(log_text, aux_before, aux_after)
+                    span.set(rerun=rerun)
+
+                if not rerun:
+                    self.echo(f"✅ LaTeX converged after {i+1} pass(es)")
+                    break
             else:
+                print(f"⚠️  LaTeX did not converge after {max_passes} passes, using last output")
+
+            if not built_pdf.exists():
                 print("❌ PDF generation failed - file not created")
                 return None
-                
+
+            if built_pdf.resolve() != output_path.resolve():
+                with self.profiler.span(f"write {output_path.name}", 'write'):
+                    shutil.copy2(built_pdf, output_path)
+
+            self.echo(f"✅ Generated PDF: {output_path}")
+            return output_path
+
         except FileNotFoundError:
             print("❌ pdflatex not found. Please install LaTeX distribution.")
             print("Ubuntu/Debian: sudo apt install texlive-latex-base texlive-latex-recommended texlive-latex-extra")
@@ -415,190 +680,576 @@ class ResumeGenerator:
         except Exception as e:
             print(f"❌ Error generating PDF: {e}")
             return None
-        finally:
-            os.chdir(original_dir)
     
     def generate_markdown(self):
-        """Generate markdown version from JSON data"""
+        """Generate markdown version from JSON data, streamed straight to the file"""
+        from markdown_renderer import write_markdown
+
+        self.validate()
+        self.ensure_output_dir()
         output_path = self.output_dir / "resume_from_json.md"
+        with self.profiler.span(f"write {output_path.name}", 'write'):
+            write_markdown(self.data, output_path)
         
-        markdown_content = []
-        
-        # Header
-        personal = self.data.get('personal', {})
-        markdown_content.append(f"# {personal.get('name', 'Your Name')}")
-        markdown_content.append("")
-        markdown_content.append(f"**{personal.get('title', 'Your Title')}**")
-        markdown_content.append("")
-        markdown_content.append(f"📧 {personal.get('email', '')} | 📱 {personal.get('phone', '')} | 📍 {personal.get('location', '')}")
-        markdown_content.append(f"💻 {personal.get('github', '')} | 🌐 {personal.get('linkedin', '')} | 🌍 {personal.get('website', '')}")
-        markdown_content.append("")
-        markdown_content.append("---")
-        markdown_content.append("")
-        
-        # Summary
-        if 'summary' in self.data:
-            markdown_content.append("## 🎯 Professional Summary")
-            markdown_content.append("")
-            markdown_content.append(self.data['summary']['text'])
-            markdown_content.append("")
-            markdown_content.append("---")
-            markdown_content.append("")
-        
-        # Skills
-        if 'skills' in self.data:
-            markdown_content.append("## 💻 Technical Skills")
-            markdown_content.append("")
-            for skill_group in self.data['skills']:
-                markdown_content.append(f"### {skill_group['category']}")
-                markdown_content.append("")
-                for item in skill_group['items']:
-                    markdown_content.append(f"- {item}")
-                markdown_content.append("")
-            markdown_content.append("---")
-            markdown_content.append("")
-        
-        # Experience
-        if 'experience' in self.data:
-            markdown_content.append("## 🚀 Professional Experience")
-            markdown_content.append("")
-            for exp in self.data['experience']:
-                markdown_content.append(f"### {exp['title']}")
-                markdown_content.append(f"**{exp['company']}** | {exp['dates']} | {exp['location']}")
-                if exp.get('description'):
-                    markdown_content.append(f"*{exp['description']}*")
-                markdown_content.append("")
-                for highlight in exp.get('highlights', []):
-                    markdown_content.append(f"- {highlight}")
-                markdown_content.append("")
-            markdown_content.append("---")
-            markdown_content.append("")
-        
-        # Projects
-        if 'projects' in self.data:
-            markdown_content.append("## 🏗️ Key Projects")
-            markdown_content.append("")
-            for project in self.data['projects']:
-                markdown_content.append(f"### {project['name']}")
-                markdown_content.append(f"**Technologies**: {project['technologies']}")
-                markdown_content.append("")
-                for highlight in project.get('highlights', []):
-                    markdown_content.append(f"- {highlight}")
-                markdown_content.append("")
-            markdown_content.append("---")
-            markdown_content.append("")
-        
-        # Education
-        if 'education' in self.data:
-            markdown_content.append("## 🎓 Education & Certifications")
-            markdown_content.append("")
-            for edu in self.data['education']:
-                markdown_content.append(f"**{edu['degree']}**")
-                markdown_content.append(f"*{edu['institution']}* | {edu['dates']}")
-                if edu.get('note'):
-                    markdown_content.append(f"**{edu['note']}**")
-                markdown_content.append("")
-                for detail in edu.get('details', []):
-                    markdown_content.append(f"- {detail}")
-                markdown_content.append("")
-            markdown_content.append("---")
-            markdown_content.append("")
-        
-        # Achievements
-        if 'achievements' in self.data:
-            markdown_content.append("## 🏆 Notable Achievements")
-            markdown_content.append("")
-            for achievement in self.data['achievements']['items']:
-                markdown_content.append(f"- {achievement}")
-            markdown_content.append("")
-            markdown_content.append("---")
-            markdown_content.append("")
-        
-        # Learning
-        if 'learning' in self.data:
-            markdown_content.append("## 🌱 Current Learning & Development")
-            markdown_content.append("")
-            if self.data['learning'].get('focus_areas'):
-                markdown_content.append("**2025 Focus Areas:**")
-                for area in self.data['learning']['focus_areas']:
-                    markdown_content.append(f"- {area}")
-                markdown_content.append("")
-            if self.data['learning'].get('continuous_learning'):
-                markdown_content.append("**Continuous Learning:**")
-                for item in self.data['learning']['continuous_learning']:
-                    markdown_content.append(f"- {item}")
-                markdown_content.append("")
-            markdown_content.append("---")
-            markdown_content.append("")
-        
-        # Languages
-        if 'languages' in self.data:
-            markdown_content.append("## 🌐 Languages")
-            markdown_content.append("")
-            for lang_info in self.data['languages']['items']:
-                markdown_content.append(f"- **{lang_info['language']}**: {lang_info['proficiency']}")
-            markdown_content.append("")
-            markdown_content.append("---")
-            markdown_content.append("")
-        
-        # Footer
-        last_updated = self.data.get('metadata', {}).get('last_updated', 'June 2025')
-        website = personal.get('website', 'yourwebsite.com')
-        markdown_content.append(f"*Portfolio: {website} | Last Updated: {last_updated}*")
-        
-        # Write markdown file
-        with open(output_path, 'w') as f:
-            f.write('\n'.join(markdown_content))
-        
-        print(f"✅ Generated Markdown: {output_path}")
+        self.echo(f"✅ Generated Markdown: {output_path}")
         return output_path
     
-    def generate_all_formats(self, template_name="modern_template.tex"):
-        """Generate all resume formats"""
-        print("🚀 Generating resume from JSON data...")
+    def generate_html(self):
+        """Generate a print-ready HTML document from the webapp template, streamed straight to the file"""
+        from html_renderer import HTML_TEMPLATE, write_html
+
+        self.validate()
+        self.ensure_output_dir()
+        output_path = self.output_dir / "resume.html"
+        with self.profiler.span(f"render {HTML_TEMPLATE.name}", 'template'):
+            write_html(self.data, output_path)
+
+        self.echo(f"✅ Generated HTML: {output_path}")
+        return output_path
+
+    def generate_all_formats(self, template_name="modern_template.tex", formats=COMMAND_FORMATS['all']):
+        """Generate the requested resume formats ('md', 'html', 'tex', 'pdf'; a PDF needs the .tex)
+
+        Returns the path of each generated format, None for formats not built.
+        """
+        self.echo("🚀 Generating resume from JSON data...")
+
+        # LaTeX only reads the sections its template references; Markdown and HTML read them all
+        latex_sections = None
+        if 'tex' in formats:
+            try:
+                latex_sections = self.sections_for_template(template_name)
+            except FileNotFoundError as e:
+                # Only the LaTeX outputs fail; the other formats are still built from all sections
+                print(f"❌ {e}")
+        if self._data is None and latex_sections is not None and 'md' not in formats and 'html' not in formats:
+            self.sections = latex_sections
+        # Cache keys are built from the section file hashes, which loading records
+        self.data
+
+        cache = BuildCache(self.output_dir) if self.use_cache else None
+        outputs = {'md': None, 'html': None, 'tex': None, 'pdf': None}
         
-        # Generate markdown
-        self.generate_markdown()
+        # Generate markdown (depends only on the section data)
+        if 'md' in formats:
+            markdown_file = self.output_dir / "resume_from_json.md"
+            markdown_key = BuildCache.make_key('md', GENERATOR_VERSION, self.section_hashes)
+            if cache and cache.is_fresh('md', markdown_key, markdown_file):
+                self.echo(f"⏭️  Markdown up to date: {markdown_file}")
+            else:
+                markdown_file = self.generate_markdown()
+                if cache:
+                    cache.record('md', markdown_key, markdown_file)
+            outputs['md'] = markdown_file
+
+        # Generate HTML (depends on the section data and the webapp template files)
+        if 'html' in formats:
+            from html_renderer import template_files
+
+            html_file = self.output_dir / "resume.html"
+            html_key = BuildCache.make_key('html', GENERATOR_VERSION, self.section_hashes,
+                                           {path.name: hash_file(path) for path in template_files()})
+            if cache and cache.is_fresh('html', html_key, html_file):
+                self.echo(f"⏭️  HTML up to date: {html_file}")
+            else:
+                html_file = self.generate_html()
+                if cache:
+                    cache.record('html', html_key, html_file)
+            outputs['html'] = html_file
         
-        # Generate LaTeX
-        latex_file = self.generate_latex_from_template(template_name)
+        # Generate LaTeX (depends on the sections the template uses and the template)
+        if 'tex' in formats and latex_sections is not None:
+            latex_file = self.output_dir / "resume.tex"
+            template_path = self.templates_dir / template_name
+            template_hash = hash_file(template_path) if template_path.exists() else None
+            latex_hashes = {
+                key: digest for key, digest in self.section_hashes.items()
+                if SECTION_FILES.get(key.removeprefix('base/')) in latex_sections
+            }
+            key_parts = ('tex', GENERATOR_VERSION, latex_hashes, template_name, template_hash)
+            if self.fit_pages:
+                key_parts += ('fit', self.fit_pages)
+            latex_key = BuildCache.make_key(*key_parts)
+            if cache and cache.is_fresh('tex', latex_key, latex_file):
+                self.echo(f"⏭️  LaTeX up to date: {latex_file}")
+            else:
+                if self.fit_pages:
+                    # After Markdown, which always keeps the full content
+                    self.fit_to_pages(self.fit_pages, template_name, cache, latex_key)
+                latex_file = self.generate_latex_from_template(template_name)
+                if cache:
+                    cache.record('tex', latex_key, latex_file)
+            outputs['tex'] = latex_file
         
-        # Generate PDF from LaTeX
-        self.generate_pdf_from_latex(latex_file)
+        # Generate PDF from LaTeX (depends only on the .tex bytes, so data edits
+        # that don't change the LaTeX output never trigger a recompile)
+        if 'pdf' in formats and outputs['tex'] is not None:
+            pdf_file = self.output_dir / "resume.pdf"
+            pdf_key = BuildCache.make_key('pdf', GENERATOR_VERSION, hash_file(outputs['tex']))
+            if cache and cache.is_fresh('pdf', pdf_key, pdf_file):
+                self.echo(f"⏭️  PDF up to date: {pdf_file}")
+            else:
+                pdf_file = self.generate_pdf_from_latex(outputs['tex'])
+                if cache:
+                    if pdf_file:
+                        cache.record('pdf', pdf_key, pdf_file)
+                    else:
+                        cache.invalidate('pdf')
+            outputs['pdf'] = pdf_file
         
-        print(f"\n📁 All files generated in: {self.output_dir}")
-        print("📄 Available formats:")
-        print("   - resume_from_json.md (Markdown from JSON)")
-        print("   - resume.tex (LaTeX from template)")
-        print("   - resume.pdf (PDF - if LaTeX is installed)")
+        self.echo(f"\n📁 All files generated in: {self.output_dir}")
+        self.echo("📄 Available formats:")
+        if 'md' in formats:
+            self.echo("   - resume_from_json.md (Markdown from JSON)")
+        if 'html' in formats:
+            self.echo("   - resume.html (print-ready HTML)")
+        if 'tex' in formats:
+            self.echo("   - resume.tex (LaTeX from template)")
+        if 'pdf' in formats:
+            self.echo("   - resume.pdf (PDF - if LaTeX is installed)")
 
-def main():
-    print("🚀 Generating resume from JSON data...")
+        return outputs
+
+    def check_inputs(self, template_name="modern_template.tex"):
+        """Validate section data and template without writing anything; returns True if all is well"""
+        from resume_model import ResumeDataError
+
+        # Loading reports unreadable files itself
+        self.data
+        ok = not self.load_errors
+        try:
+            self.validate()
+            print("✅ Section data matches the resume schema")
+        except ResumeDataError as e:
+            print(f"❌ Invalid section data: {e}")
+            ok = False
+
+        try:
+            template = self.load_template(template_name)
+        except FileNotFoundError as e:
+            print(f"❌ {e}")
+            ok = False
+        else:
+            unknown = template.unknown_placeholders(self.template_resolvers())
+            if unknown:
+                print(f"⚠️  Unknown placeholders in {template_name}: {', '.join(unknown)}")
+            else:
+                print(f"✅ Template {template_name} is valid")
+
+        import shutil
+        if shutil.which('pdflatex') is None:
+            print("ℹ️  pdflatex not found, PDFs cannot be generated")
+
+        return ok
+
+
+def engine_formats(formats, engine, command='all'):
+    """Formats to build when the printable document comes from engine
+
+    The html engine replaces the LaTeX/PDF pair with resume.html (an explicit
+    'tex' command still gets LaTeX); auto picks html only when pdflatex is
+    not installed.
+    """
+    if engine == 'auto':
+        import shutil
+        engine = 'latex' if shutil.which('pdflatex') else 'html'
+    if engine == 'latex' or command == 'tex' or not {'tex', 'pdf'} & set(formats):
+        return formats
+    return tuple(fmt for fmt in formats if fmt not in ('tex', 'pdf')) + ('html',)
+
+
+def discover_variants(sections_dir="sections", jobs_dir="jobs"):
+    """Find the base sections dir and every job variant directory.
+
+    Variants are sparse overlays on the base, so a directory without any JSON
+    file is a valid variant identical to the base. Returns a list of
+    (name, path) tuples; the base sections dir is named 'base'.
+    """
+    variants = []
+    sections_path = Path(sections_dir)
+    if sections_path.is_dir():
+        variants.append(('base', sections_path))
+
+    jobs_path = Path(jobs_dir)
+    if jobs_path.is_dir():
+        for variant_dir in sorted(jobs_path.iterdir()):
+            if variant_dir.is_dir() and not variant_dir.name.startswith('.'):
+                variants.append((variant_dir.name, variant_dir))
 
-    parser = argparse.ArgumentParser(description='Generate resume from JSON data using external templates')
-    parser.add_argument('--sections-dir', default='sections', help='Directory containing modular JSON files')
-    parser.add_argument('--templates-dir', default='templates', help='Directory containing LaTeX template files')
-    parser.add_argument('--output-dir', default='output', help='Output directory for generated files')
-    parser.add_argument('--latex-only', action='store_true', help='Generate only LaTeX, skip PDF compilation')
+    return variants
 
-    args = parser.parse_args()
+
+def build_variant(name, sections_dir, templates_dir, output_dir, template_name="modern_template.tex",
+                  formats=COMMAND_FORMATS['all'], profile=False, **generator_options):
+    """Build a single variant; runs inside a worker process during batch builds.
+
+    Output is captured rather than printed so parallel builds don't interleave.
+    With profile=True the variant's profiling events are returned under
+    'profile'. Extra keyword arguments are passed through to ResumeGenerator.
+    """
+    import contextlib
+    import io
+
+    log = io.StringIO()
+    started = time.perf_counter()
+    result = {'variant': name, 'sections_dir': str(sections_dir), 'output_dir': str(output_dir)}
+    if profile:
+        from profiling import Profiler
+        generator_options['profiler'] = Profiler()
+    profiler = generator_options.get('profiler') or NULL_PROFILER
 
     try:
-        generator = ResumeGenerator(
+        with contextlib.redirect_stdout(log), profiler.span(f"variant {name}", 'variant'):
+            generator = ResumeGenerator(
+                sections_dir=sections_dir,
+                templates_dir=Path(templates_dir).resolve(),
+                output_dir=output_dir,
+                **generator_options
+            )
+            outputs = generator.generate_all_formats(template_name, formats)
+        result['outputs'] = {fmt: str(path) if path else None for fmt, path in outputs.items() if fmt in formats}
+        result['status'] = 'ok' if all(outputs[fmt] for fmt in formats) else 'partial'
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = str(e)
+
+    result['elapsed'] = round(time.perf_counter() - started, 3)
+    result['log'] = log.getvalue()
+    if profile:
+        result['profile'] = profiler.events
+    return result
+
+
+def build_all_variants(sections_dir="sections", jobs_dir="jobs", templates_dir="templates",
+                       output_dir="output", template_name="modern_template.tex", workers=None,
+                       build_dir=None, formats=COMMAND_FORMATS['all'], profiler=NULL_PROFILER, **generator_options):
+    """Build every variant in parallel, one output (and build) subdirectory per variant
+
+    Each worker profiles its own variants when profiler is enabled; their
+    events are merged into profiler, not written to the batch summary.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from datetime import datetime
+
+    echo = _silent if generator_options.get('quiet') else print
+    variants = discover_variants(sections_dir, jobs_dir)
+    if not variants:
+        print(f"⚠️  No variants found in {sections_dir} or {jobs_dir}")
+        return []
+
+    output_root = Path(output_dir)
+    output_root.mkdir(parents=True, exist_ok=True)
+
+    # Variants built from the same template share one precompiled preamble
+    if not generator_options.get('format_cache_dir'):
+        generator_options['format_cache_dir'] = output_root / '.fmt-cache'
+    workers = workers or os.cpu_count() or 1
+
+    echo(f"🚀 Building {len(variants)} variant(s) with {workers} worker(s)...")
+    started = time.perf_counter()
+    results = []
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(
+                build_variant, name, path, templates_dir, output_root / name, template_name, formats,
+                build_dir=Path(build_dir) / name if build_dir else None,
+                base_dir=None if name == 'base' else sections_dir,
+                profile=profiler.enabled,
+                **generator_options
+            ): name
+            for name, path in variants
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            profiler.extend(result.pop('profile', ()))
+            icon = {'ok': '✅', 'partial': '⚠️ ', 'failed': '❌'}[result['status']]
+            echo(f"{icon} {result['variant']} ({result['elapsed']:.2f}s)")
+            results.append(result)
+
+    results.sort(key=lambda r: r['variant'])
+    elapsed = time.perf_counter() - started
+
+    summary = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'workers': workers,
+        'elapsed': round(elapsed, 3),
+        'variants': results,
+    }
+    summary_path = output_root / "batch_summary.json"
+    with open(summary_path, 'w') as f:
+        json.dump(summary, f, indent=2)
+
+    counts = {status: sum(1 for r in results if r['status'] == status) for status in ('ok', 'partial', 'failed')}
+    echo(f"\n📊 Batch summary: {counts['ok']} ok, {counts['partial']} without PDF, {counts['failed']} failed "
+         f"in {elapsed:.2f}s")
+    for result in results:
+        if result['status'] == 'failed':
+            print(f"   ❌ {result['variant']}: {result['error']}")
+    echo(f"📁 Report written to: {summary_path}")
+
+    return results
+
+
+def tailor_variants(args, profiler=NULL_PROFILER):
+    """Write one keyword-ranked variant per job description in args.tailor; returns the exit status"""
+    from keyword_index import load_index, tailor, variant_name, write_variant
+
+    echo = _silent if args.quiet else print
+    started = time.perf_counter()
+    with profiler.span('keyword index', 'model') as span:
+        index, data, rebuilt = load_index(args.sections_dir, args.keyword_index)
+        span.set(rebuilt=rebuilt, documents=len(index.documents), terms=len(index.terms))
+    echo(f"{'🔄 Rebuilt' if rebuilt else '⚡ Loaded'} keyword index: {len(index.documents)} item(s), "
+         f"{len(index.terms)} term(s) ({(time.perf_counter() - started) * 1000:.1f} ms)")
+
+    status = 0
+    started = time.perf_counter()
+    for job_path in args.tailor:
+        name = variant_name(job_path)
+        try:
+            with open(job_path, 'r', encoding='utf-8') as f:
+                job_text = f.read()
+        except OSError as e:
+            print(f"❌ {job_path}: {e}")
+            status = 1
+            continue
+        with profiler.span(f'tailor {name}', 'build'):
+            tailored = tailor(index, data, job_text, top_k=args.top_k)
+            written = write_variant(Path(args.jobs_dir) / name, data, tailored, job_path, index.top_terms(job_text))
+        if written is None:
+            print(f"⚠️  {Path(args.jobs_dir) / name} exists and was not generated by --tailor; skipped")
+            status = 1
+        else:
+            echo(f"✅ {name}: {', '.join(written) or 'identical to the base'}")
+    echo(f"📊 Tailored {len(args.tailor)} variant(s) in {(time.perf_counter() - started) * 1000:.1f} ms")
+    return status
+
+
+def add_common_arguments(parser, suppress_defaults=False):
+    """Options shared by every command.
+
+    They are accepted both before and after the command name. The copies on
+    the subcommand parsers suppress their defaults, so a value given before
+    the command is not reset by the subcommand.
+    """
+    def default(value):
+        return argparse.SUPPRESS if suppress_defaults else value
+
+    parser.add_argument('--sections-dir', default=default('sections'), help='Directory containing modular JSON files')
+    parser.add_argument('--templates-dir', default=default('templates'), help='Directory containing LaTeX template files')
+    parser.add_argument('--output-dir', default=default('output'), help='Output directory for generated files')
+    parser.add_argument('--latex-only', action='store_true', default=default(False),
+                        help='Generate only LaTeX, skip PDF compilation')
+    parser.add_argument('--batch', action='store_true', default=default(False),
+                        help='Build the base sections and every variant under --jobs-dir')
+    parser.add_argument('--jobs-dir', default=default('jobs'),
+                        help='Directory containing job-specific variants (used with --batch)')
+    parser.add_argument('--workers', type=int, default=default(None),
+                        help='Worker processes for --batch (default: CPU count)')
+    parser.add_argument('--base-dir', default=default(None),
+                        help='Base sections directory that --sections-dir is a sparse overlay on (e.g. sections)')
+    parser.add_argument('--sparsify-variants', action='store_true', default=default(False),
+                        help='Rewrite every variant under --jobs-dir as a minimal overlay on --sections-dir')
+    parser.add_argument('--no-cache', action='store_true', default=default(False),
+                        help='Rebuild every output even if its inputs are unchanged')
+    parser.add_argument('--build-dir', default=default(None),
+                        help='Persistent directory for LaTeX aux/log files (default: output dir)')
+    parser.add_argument('--max-latex-passes', type=int, default=default(3),
+                        help='Upper bound on pdflatex passes per build')
+    parser.add_argument('--precompile-preamble', action='store_true', default=default(False),
+                        help='Dump the template preamble to a cached .fmt file and compile against it')
+    parser.add_argument('--format-cache-dir', default=default(None),
+                        help='Directory for precompiled preamble formats (default: <build dir>/.fmt-cache)')
+    parser.add_argument('--compile-snapshot', action='store_true', default=default(False),
+                        help='Pack the sections and every variant under --jobs-dir into a binary snapshot and exit')
+    parser.add_argument('--snapshot', default=default(None),
+                        help='Snapshot file to load section data from (default: .resume-snapshot next to the sections)')
+    parser.add_argument('--no-snapshot', action='store_true', default=default(False),
+                        help='Always parse the section JSON files')
+    parser.add_argument('--tailor', nargs='+', default=default(None), metavar='JOB_FILE',
+                        help='Write a variant under --jobs-dir for each job description, '
+                             'with the content ranked by keyword relevance, and exit')
+    parser.add_argument('--top-k', type=int, default=default(4),
+                        help='Highlights kept per position and project with --tailor')
+    parser.add_argument('--keyword-index', default=default(None),
+                        help='Keyword index cache file (default: .keyword-index next to the sections)')
+    parser.add_argument('--engine', choices=ENGINES, default=default('latex'),
+                        help='Backend for the printable resume: pdflatex, print-ready HTML from the webapp '
+                             'template (styled by the Tailwind CDN, so open it online), '
+                             'or auto (HTML only when pdflatex is missing)')
+    parser.add_argument('--fit-pages', type=int, default=default(None), metavar='N',
+                        help='Trim the lowest-priority content until the LaTeX/PDF output fits in N pages')
+    parser.add_argument('--watch', action='store_true', default=default(False),
+                        help='Keep running and rebuild incrementally whenever a section or template file changes')
+    parser.add_argument('--profile', default=default(None), metavar='PATH',
+                        help='Time each build stage and write the spans to PATH: JSON lines for *.jsonl, '
+                             'a Chrome trace (chrome://tracing, Perfetto) otherwise')
+    parser.add_argument('--cprofile', default=default(None), metavar='PATH',
+                        help='Run under cProfile and dump the stats to PATH (main process only)')
+    parser.add_argument('-q', '--quiet', action='store_true', default=default(False),
+                        help='Only print warnings and errors')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description='Generate resume from JSON data using external templates',
+        epilog='Without a command, all formats are generated (same as "all").'
+    )
+    add_common_arguments(parser)
+
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    for name, help_text in (
+        ('md', 'Generate Markdown only'),
+        ('tex', 'Generate LaTeX only'),
+        ('pdf', 'Generate LaTeX and compile it to PDF'),
+        ('all', 'Generate Markdown, LaTeX and PDF'),
+        ('check', 'Validate section data and template without writing anything'),
+    ):
+        add_common_arguments(commands.add_parser(name, help=help_text), suppress_defaults=True)
+
+    return parser
+
+
+def main():
+    args = build_parser().parse_args()
+
+    profiler = NULL_PROFILER
+    if args.profile:
+        from profiling import Profiler
+        profiler = Profiler()
+
+    if args.cprofile:
+        import cProfile
+
+        cprofile = cProfile.Profile()
+        try:
+            status = cprofile.runcall(run, args, profiler)
+        finally:
+            cprofile.dump_stats(args.cprofile)
+    else:
+        status = run(args, profiler)
+
+    if profiler.enabled:
+        profiler.write(args.profile)
+        if not args.quiet:
+            print(f"\n📊 {len(profiler.events)} span(s) written to {args.profile}; slowest stages:")
+            for category, name, count, total in profiler.totals()[:10]:
+                print(f"   {category:<9} {name:<32} {count:4d}x {total * 1000:10.2f} ms")
+    if args.cprofile and not args.quiet:
+        print(f"📊 cProfile stats written to {args.cprofile}")
+    return status
+
+
+def run(args, profiler=NULL_PROFILER):
+    """Carry out the parsed command line; returns the exit status"""
+    command = args.command or 'all'
+    echo = _silent if args.quiet else print
+
+    # Variants are overlays on the base sections, so the snapshot lives next to the base directory
+    from snapshot import default_snapshot_path
+
+    base_sections = args.sections_dir if args.batch or not args.base_dir else args.base_dir
+    snapshot_path = None if args.no_snapshot else (args.snapshot or default_snapshot_path(base_sections))
+
+    if args.compile_snapshot:
+        from snapshot import compile_snapshot, snapshot_directories
+
+        snapshot_path = args.snapshot or default_snapshot_path(args.sections_dir)
+        count = compile_snapshot(snapshot_path, snapshot_directories(args.sections_dir, args.jobs_dir))
+        echo(f"✅ Compiled {count} section file(s) into {snapshot_path}")
+        return 0
+
+    if args.tailor:
+        return tailor_variants(args, profiler)
+
+    if args.sparsify_variants:
+        from overlay import sparsify_variant
+
+        for name, path in discover_variants(args.sections_dir, args.jobs_dir):
+            if name == 'base':
+                continue
+            for filename, action in sparsify_variant(args.sections_dir, path):
+                echo(f"   {name}/{filename}: {action}")
+        return 0
+
+    generator_options = {
+        'templates_dir': args.templates_dir,
+        'output_dir': args.output_dir,
+        'use_cache': not args.no_cache,
+        'build_dir': args.build_dir,
+        'max_latex_passes': args.max_latex_passes,
+        'precompile_preamble': args.precompile_preamble,
+        'format_cache_dir': args.format_cache_dir,
+        'snapshot_path': snapshot_path,
+        'quiet': args.quiet,
+        'fit_pages': args.fit_pages,
+    }
+
+    if command == 'check':
+        generator = ResumeGenerator(sections_dir=args.sections_dir, base_dir=args.base_dir, **generator_options)
+        return 0 if generator.check_inputs() else 1
+
+    formats = COMMAND_FORMATS[command]
+    if args.latex_only:
+        formats = tuple(fmt for fmt in formats if fmt != 'pdf')
+    formats = engine_formats(formats, args.engine, command)
+
+    echo("🚀 Generating resume from JSON data...")
+
+    if args.watch:
+        from watch import IncrementalBuild, watch
+
+        if args.fit_pages:
+            print("⚠️  --fit-pages is not applied in watch mode")
+
+        builds = []
+        targets = discover_variants(args.sections_dir, args.jobs_dir) if args.batch else [('resume', args.sections_dir)]
+        for name, path in targets:
+            options = dict(generator_options)
+            if args.batch:
+                options['output_dir'] = Path(args.output_dir) / name
+                options['build_dir'] = Path(args.build_dir) / name if args.build_dir else None
+                base_dir = None if name == 'base' else args.sections_dir
+            else:
+                base_dir = args.base_dir
+            generator = ResumeGenerator(sections_dir=path, base_dir=base_dir, profiler=profiler, **options)
+            builds.append(IncrementalBuild(name, generator, formats=formats))
+        return watch(builds, echo=echo)
+
+    if args.batch:
+        results = build_all_variants(
             sections_dir=args.sections_dir,
-            templates_dir=args.templates_dir,
-            output_dir=args.output_dir
+            jobs_dir=args.jobs_dir,
+            workers=args.workers,
+            formats=formats,
+            profiler=profiler,
+            **generator_options
         )
+        # A variant missing a requested format (e.g. no PDF) fails the batch as well
+        return 1 if any(r['status'] != 'ok' for r in results) else 0
 
-        generator.generate_all_formats()
+    try:
+        generator = ResumeGenerator(sections_dir=args.sections_dir, base_dir=args.base_dir, profiler=profiler,
+                                    **generator_options)
+        with profiler.span('build', 'build', formats=list(formats)):
+            outputs = generator.generate_all_formats(formats=formats)
 
-        print("\n🎉 Resume generation complete!")
-        print("📁 Generated files:")
-        print(f"   - resume_from_json.md (Markdown from JSON)")
+        missing = [fmt for fmt in formats if not outputs[fmt]]
+        if missing:
+            print(f"❌ Not generated: {', '.join(missing)}")
+            return 1
 
-        if not args.latex_only:
-            print(f"   - resume.pdf (Professional PDF)")
-            print(f"   - resume.tex (LaTeX source)")
+        echo("\n🎉 Resume generation complete!")
+        echo("📁 Generated files:")
+        if outputs['md']:
+            echo(f"   - resume_from_json.md (Markdown from JSON)")
+        if outputs['html']:
+            echo("   - resume.html (print-ready HTML)")
+        if outputs['pdf']:
+            echo(f"   - resume.pdf (Professional PDF)")
+        if outputs['tex']:
+            echo(f"   - resume.tex (LaTeX source)")
 
     except Exception as e:
         print(f"❌ Error during generation: {e}")
@@ -607,4 +1258,4 @@ def main():
     return 0
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    sys.exit(main())
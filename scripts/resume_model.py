@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Typed, validated in-memory model of the merged resume data.
+
+The merged section dicts are parsed once into slotted dataclasses. Schema
+problems are reported up front with the path of the offending value (e.g.
+"experience[2].title: missing required field") instead of surfacing as a
+KeyError halfway through LaTeX generation. LaTeX-escaped copies of text
+fields are computed on first use and cached on each object.
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+from latex_escape import escape_latex
+
+
+class ResumeDataError(ValueError):
+    """Resume data does not match the expected section schema"""
+
+
+def _require_dict(value, path):
+    if not isinstance(value, dict):
+        raise ResumeDataError(f"{path}: expected an object, got {type(value).__name__}")
+    return value
+
+
+def _str(obj, key, path, required=True, default=None):
+    if key not in obj:
+        if required:
+            raise ResumeDataError(f"{path}.{key}: missing required field")
+        return default
+    value = obj[key]
+    if not isinstance(value, str):
+        raise ResumeDataError(f"{path}.{key}: expected a string, got {type(value).__name__}")
+    return value
+
+
+def _str_list(obj, key, path, required=False):
+    if key not in obj:
+        if required:
+            raise ResumeDataError(f"{path}.{key}: missing required field")
+        return ()
+    value = obj[key]
+    if not isinstance(value, list):
+        raise ResumeDataError(f"{path}.{key}: expected a list, got {type(value).__name__}")
+    for i, item in enumerate(value):
+        if not isinstance(item, str):
+            raise ResumeDataError(f"{path}.{key}[{i}]: expected a string, got {type(item).__name__}")
+    return tuple(value)
+
+
+def _list(data, key):
+    value = data[key]
+    if not isinstance(value, list):
+        raise ResumeDataError(f"{key}: expected a list, got {type(value).__name__}")
+    return value
+
+
+class _Model:
+    """Lazily escaped, per-object cached LaTeX versions of text fields"""
+
+    __slots__ = ()
+
+    def get(self, name, default=None):
+        """Field value, or default when the field was absent from the data"""
+        value = getattr(self, name)
+        return default if value is None else value
+
+    def tex(self, name):
+        """LaTeX-escaped value of a string field, or a tuple for a list field"""
+        cache = self._tex
+        if cache is None:
+            cache = self._tex = {}
+        try:
+            return cache[name]
+        except KeyError:
+            value = getattr(self, name)
+            escaped = escape_latex(value) if isinstance(value, str) else tuple(escape_latex(v) for v in value)
+            cache[name] = escaped
+            return escaped
+
+
+@dataclass(slots=True)
+class Personal(_Model):
+    name: Optional[str] = None
+    title: Optional[str] = None
+    location: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    github: Optional[str] = None
+    linkedin: Optional[str] = None
+    website: Optional[str] = None
+    _tex: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, obj, path='personal'):
+        obj = _require_dict(obj, path)
+        return cls(**{key: _str(obj, key, path, required=False) for key in (
+            'name', 'title', 'location', 'email', 'phone', 'github', 'linkedin', 'website'
+        )})
+
+
+@dataclass(slots=True)
+class SkillGroup(_Model):
+    category: str
+    items: Tuple[str, ...]
+    _tex: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, obj, path):
+        obj = _require_dict(obj, path)
+        return cls(_str(obj, 'category', path), _str_list(obj, 'items', path, required=True))
+
+
+@dataclass(slots=True)
+class Experience(_Model):
+    title: str
+    company: str
+    dates: str
+    location: str
+    description: Optional[str] = None
+    highlights: Tuple[str, ...] = ()
+    _tex: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, obj, path):
+        obj = _require_dict(obj, path)
+        return cls(
+            title=_str(obj, 'title', path),
+            company=_str(obj, 'company', path),
+            dates=_str(obj, 'dates', path),
+            location=_str(obj, 'location', path),
+            description=_str(obj, 'description', path, required=False),
+            highlights=_str_list(obj, 'highlights', path),
+        )
+
+
+@dataclass(slots=True)
+class Project(_Model):
+    name: str
+    technologies: str
+    link: str = ''
+    highlights: Tuple[str, ...] = ()
+    _tex: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, obj, path):
+        obj = _require_dict(obj, path)
+        return cls(
+            name=_str(obj, 'name', path),
+            technologies=_str(obj, 'technologies', path),
+            link=_str(obj, 'link', path, required=False, default=''),
+            highlights=_str_list(obj, 'highlights', path),
+        )
+
+
+@dataclass(slots=True)
+class Education(_Model):
+    degree: str
+    institution: str
+    dates: str
+    location: str = ''
+    note: str = ''
+    details: Tuple[str, ...] = ()
+    _tex: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, obj, path):
+        obj = _require_dict(obj, path)
+        return cls(
+            degree=_str(obj, 'degree', path),
+            institution=_str(obj, 'institution', path),
+            dates=_str(obj, 'dates', path),
+            location=_str(obj, 'location', path, required=False, default=''),
+            note=_str(obj, 'note', path, required=False, default=''),
+            details=_str_list(obj, 'details', path),
+        )
+
+
+@dataclass(slots=True)
+class Language(_Model):
+    language: str
+    proficiency: str
+    _tex: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, obj, path):
+        obj = _require_dict(obj, path)
+        return cls(_str(obj, 'language', path), _str(obj, 'proficiency', path))
+
+
+@dataclass(slots=True)
+class Learning(_Model):
+    focus_areas: Tuple[str, ...] = ()
+    continuous_learning: Tuple[str, ...] = ()
+    _tex: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, obj, path='learning'):
+        obj = _require_dict(obj, path)
+        return cls(_str_list(obj, 'focus_areas', path), _str_list(obj, 'continuous_learning', path))
+
+
+@dataclass(slots=True)
+class Resume(_Model):
+    """
+    The whole resume. A section is None when its key is absent from the data,
+    which emitters treat differently from a present-but-empty section.
+    """
+
+    personal: Personal
+    summary: Optional[str] = None
+    skills: Optional[Tuple[SkillGroup, ...]] = None
+    experience: Optional[Tuple[Experience, ...]] = None
+    projects: Optional[Tuple[Project, ...]] = None
+    education: Optional[Tuple[Education, ...]] = None
+    achievements: Optional[Tuple[str, ...]] = None
+    learning: Optional[Learning] = None
+    languages: Optional[Tuple[Language, ...]] = None
+    last_updated: Optional[str] = None
+    _tex: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, data):
+        """Parse and validate merged section data; raises ResumeDataError"""
+        data = _require_dict(data, 'resume')
+
+        def items(key, model):
+            if key not in data:
+                return None
+            return tuple(model.from_dict(obj, f"{key}[{i}]") for i, obj in enumerate(_list(data, key)))
+
+        def item_list(key, model=None):
+            if key not in data:
+                return None
+            section = _require_dict(data[key], key)
+            if model is None:
+                return _str_list(section, 'items', key)
+            return tuple(model.from_dict(obj, f"{key}.items[{i}]")
+                         for i, obj in enumerate(section.get('items') or []))
+
+        summary = None
+        if 'summary' in data:
+            summary = _str(_require_dict(data['summary'], 'summary'), 'text', 'summary', required=False)
+
+        metadata = _require_dict(data.get('metadata', {}), 'metadata')
+
+        return cls(
+            personal=Personal.from_dict(data.get('personal', {})),
+            summary=summary,
+            skills=items('skills', SkillGroup),
+            experience=items('experience', Experience),
+            projects=items('projects', Project),
+            education=items('education', Education),
+            achievements=item_list('achievements'),
+            learning=Learning.from_dict(data['learning']) if 'learning' in data else None,
+            languages=item_list('languages', Language),
+            last_updated=_str(metadata, 'last_updated', 'metadata', required=False),
+        )
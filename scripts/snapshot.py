@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Binary snapshot of the section JSON files for fast cold starts.
+
+Compiling packs the parsed contents of every section file (base sections and,
+optionally, every jobs/ variant) into a single versioned pickle. Loaders look
+files up in the snapshot and use the stored data only when the file on disk
+still has the mtime and size it had at compile time; anything edited, added
+or not compiled is read from JSON as before. A stale snapshot therefore costs
+a stat per file, never wrong data.
+
+The snapshot is a local build artifact produced by the generator. Like any
+pickle it must not be loaded from an untrusted source.
+
+Build it with `resume_generator.py --compile-snapshot`.
+"""
+
+import json
+import os
+from pathlib import Path
+
+from build_cache import hash_bytes, load_artifact, save_artifact
+
+SNAPSHOT_MAGIC = b'RESUME-SNAPSHOT\n'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_FILENAME = '.resume-snapshot'
+
+
+def default_snapshot_path(sections_dir):
+    """Snapshot location for a sections directory: next to it, in the project root"""
+    return Path(os.path.abspath(sections_dir)).parent / SNAPSHOT_FILENAME
+
+
+def file_signature(st):
+    """Part of a stat result that decides whether a snapshot entry is still fresh"""
+    return (st.st_mtime_ns, st.st_size)
+
+
+class Snapshot:
+    """
+    Parsed section files keyed by path relative to the snapshot's directory.
+
+    Each entry is (signature, sha256 of the raw bytes, parsed data); the hash
+    lets the generator's build cache key outputs without rereading the file.
+    Returned data is shared between lookups and must not be mutated.
+    """
+
+    def __init__(self, root, entries):
+        self.root = os.path.abspath(root)
+        self.entries = entries
+        # Same entries keyed by absolute path, so lookups need no relpath computation
+        self._by_path = {os.path.normpath(os.path.join(self.root, key)): entry for key, entry in entries.items()}
+        self.hits = 0
+        self.stale = 0
+
+    @classmethod
+    def load(cls, path):
+        """Snapshot stored at path, or None if it is missing, corrupt or from another version"""
+        payload = load_artifact(path, SNAPSHOT_MAGIC, SNAPSHOT_VERSION)
+        if payload is None:
+            return None
+        return cls(os.path.dirname(os.path.abspath(path)), payload['entries'])
+
+    def lookup(self, path, st=None):
+        """(hash, data) for path if the snapshot entry is fresh, else None
+
+        Pass the file's stat result as st when the caller already has it.
+        """
+        entry = self._by_path.get(os.path.abspath(path))
+        if entry is None:
+            return None
+        if st is None:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+        signature, digest, data = entry
+        if signature != file_signature(st):
+            self.stale += 1
+            return None
+        self.hits += 1
+        return digest, data
+
+    def stats(self):
+        return {'files': len(self.entries), 'hits': self.hits, 'stale': self.stale}
+
+
+# Loaded snapshots per process, keyed by path and reloaded when the file changes,
+# so batch workers unpickle the snapshot once rather than once per variant
+_loaded = {}
+
+
+def load_snapshot(path):
+    """Snapshot at path (memoized per process), or None if there is no usable one"""
+    path = os.path.abspath(path)
+    try:
+        signature = file_signature(os.stat(path))
+    except OSError:
+        return None
+    cached = _loaded.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    snapshot = Snapshot.load(path)
+    _loaded[path] = (signature, snapshot)
+    return snapshot
+
+
+def compile_snapshot(path, directories):
+    """Parse every JSON file in directories and write them to a snapshot at path
+
+    Returns the number of files packed. The snapshot is replaced atomically, so
+    concurrent readers see either the old or the new one.
+    """
+    root = os.path.dirname(os.path.abspath(path))
+    entries = {}
+    for directory in directories:
+        for file_path in sorted(Path(directory).glob('*.json')):
+            # Stat before reading: a write racing with compile then leaves a stale entry, not a wrong one
+            signature = file_signature(file_path.stat())
+            raw = file_path.read_bytes()
+            key = Path(os.path.relpath(os.path.abspath(file_path), root)).as_posix()
+            entries[key] = (signature, hash_bytes(raw), json.loads(raw.decode('utf-8')))
+
+    save_artifact(path, SNAPSHOT_MAGIC, SNAPSHOT_VERSION, {'entries': entries})
+    return len(entries)
+
+
+def snapshot_directories(sections_dir, jobs_dir=None):
+    """The base sections directory plus every non-hidden variant directory under jobs_dir"""
+    directories = [Path(sections_dir)]
+    if jobs_dir is not None and Path(jobs_dir).is_dir():
+        directories.extend(
+            path for path in sorted(Path(jobs_dir).iterdir())
+            if path.is_dir() and not path.name.startswith('.')
+        )
+    return directories
+
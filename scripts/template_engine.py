@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Single-pass renderer for {{{PLACEHOLDER}}} templates.
+
+Templates are parsed once into literal chunks and placeholder slots and cached
+per path/mtime, so batch builds across many variants never re-read or re-scan
+the same template file.
+"""
+
+import re
+from pathlib import Path
+
+PLACEHOLDER_PATTERN = re.compile(r'\{\{\{([A-Za-z0-9_]+)\}\}\}')
+
+
+class CompiledTemplate:
+    """
+    A template split into literals and placeholder names.
+
+    Rendering takes a mapping of placeholder name to a zero-argument callable,
+    so values (e.g. whole LaTeX sections) are only produced for placeholders
+    the template actually references, each exactly once.
+    """
+
+    _cache = {}
+
+    def __init__(self, source):
+        self.literals = []
+        self.slots = []
+
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(source):
+            self.literals.append(source[position:match.start()])
+            self.slots.append(match.group(1))
+            position = match.end()
+        self.literals.append(source[position:])
+
+        self.placeholders = frozenset(self.slots)
+
+    @classmethod
+    def load(cls, path):
+        """Return the compiled template at path, reusing the cached parse while the file is unchanged"""
+        path = Path(path).resolve()
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = cls._cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        with open(path, 'r') as f:
+            template = cls(f.read())
+        cls._cache[path] = (signature, template)
+        return template
+
+    def unknown_placeholders(self, resolvers):
+        """Placeholders in the template with no resolver; they are left as-is in the output"""
+        return sorted(self.placeholders - resolvers.keys())
+
+    def unused_placeholders(self, resolvers):
+        """Resolvers the template never references"""
+        return sorted(resolvers.keys() - self.placeholders)
+
+    def render(self, resolvers):
+        """Render in a single pass, resolving each referenced placeholder once"""
+        values = {key: str(resolvers[key]()) for key in self.placeholders if key in resolvers}
+        return self.render_values(values)
+
+    def render_values(self, values):
+        """Splice already-rendered placeholder values between the literals; missing ones are left as-is"""
+        parts = [self.literals[0]]
+        for key, literal in zip(self.slots, self.literals[1:]):
+            parts.append(values[key] if key in values else f"{{{{{{{key}}}}}}}")
+            parts.append(literal)
+        return ''.join(parts)
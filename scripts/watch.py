@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Watch mode: keep resume data and templates in memory and rebuild on save.
+
+The watched directories are polled with os.scandir (no extra dependency).
+A burst of saves is debounced into a single rebuild. Each rebuild rereads
+only the JSON files that changed, recomputes only the template sections
+that read from them, and recompiles the PDF only if the resulting .tex
+differs from the last one.
+"""
+
+import os
+import time
+from pathlib import Path
+
+WATCHED_SUFFIXES = ('.json', '.tex')
+# The webapp template rendered by the HTML engine, and the stylesheet it includes
+HTML_SUFFIXES = ('.html', '.css')
+
+
+def scan_files(directories):
+    """{path: (mtime_ns, size)} for every watched file; directories maps each directory to its file suffixes"""
+    files = {}
+    for directory, suffixes in directories.items():
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.endswith(suffixes) and entry.is_file():
+                        st = entry.stat()
+                        files[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            continue
+    return files
+
+
+def changed_files(before, after):
+    """Paths added, removed or modified between two scans"""
+    return {path for path in before.keys() | after.keys() if before.get(path) != after.get(path)}
+
+
+class IncrementalBuild:
+    """
+    One output target (the base sections or a variant) kept in memory between rebuilds.
+    """
+
+    def __init__(self, name, generator, template_name="modern_template.tex", formats=('md', 'tex', 'pdf')):
+        self.name = name
+        self.generator = generator
+        self.template_name = template_name
+        self.formats = formats
+        self.latex_source = None
+
+        # Section files are read from these; the templates directory is watched as well
+        self.data_dirs = {Path(generator.sections_dir).resolve()}
+        if generator.base_dir:
+            self.data_dirs.add(Path(generator.base_dir).resolve())
+        self.directories = dict.fromkeys(self.data_dirs | {Path(generator.templates_dir).resolve()}, WATCHED_SUFFIXES)
+        if 'html' in formats:
+            from html_renderer import HTML_TEMPLATE
+            self.directories[HTML_TEMPLATE.parent] = self.directories.get(HTML_TEMPLATE.parent, ()) + HTML_SUFFIXES
+
+    def affected_by(self, paths):
+        return {path for path in paths if path.parent in self.directories}
+
+    def build(self, changed_paths=None):
+        """Build everything (changed_paths=None) or apply the given changed files"""
+        generator = self.generator
+        started = time.perf_counter()
+
+        if changed_paths is None:
+            changed_sections = None
+        else:
+            changed_sections = set()
+            for filename in sorted({path.name for path in changed_paths if path.parent in self.data_dirs}):
+                changed_sections |= generator.reload_section_file(filename)
+
+        try:
+            if 'md' in self.formats and (changed_sections is None or changed_sections):
+                generator.generate_markdown()
+
+            if 'html' in self.formats:
+                generator.generate_html()
+
+            if 'tex' in self.formats:
+                latex = generator.render_latex_incremental(self.template_name, changed_sections)
+                latex_file = generator.output_dir / "resume.tex"
+                if self.latex_source is None and latex_file.exists():
+                    self.latex_source = latex_file.read_text()
+
+                pdf_missing = 'pdf' in self.formats and not (generator.output_dir / "resume.pdf").exists()
+                if latex != self.latex_source:
+                    generator.ensure_output_dir()
+                    with generator.profiler.span(f"write {latex_file.name}", 'write'), open(latex_file, 'w') as f:
+                        f.write(latex)
+                    self.latex_source = latex
+                    generator.echo(f"✅ Generated LaTeX: {latex_file}")
+                elif not pdf_missing:
+                    generator.echo("⏭️  LaTeX unchanged, PDF not recompiled")
+                    return
+
+                if 'pdf' in self.formats:
+                    generator.generate_pdf_from_latex(latex_file)
+        except Exception as e:
+            print(f"❌ Error rebuilding {self.name}: {e}")
+            return
+        finally:
+            generator.echo(f"⚡ {self.name} rebuilt in {time.perf_counter() - started:.2f}s")
+
+
+def watch(builds, interval=0.2, debounce=0.3, echo=print):
+    """Build every target, then rebuild the affected targets whenever a watched file changes"""
+    directories = {}
+    for build in builds:
+        for directory, suffixes in build.directories.items():
+            directories[directory] = tuple(dict.fromkeys(directories.get(directory, ()) + suffixes))
+    state = scan_files(directories)
+
+    for build in builds:
+        build.build()
+
+    print(f"\n👀 Watching {', '.join(str(directory) for directory in sorted(directories))} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(interval)
+            current = scan_files(directories)
+            changed = changed_files(state, current)
+            if not changed:
+                continue
+
+            # Wait for the files to settle, so an editor's burst of writes triggers one rebuild
+            while True:
+                time.sleep(debounce)
+                settled = scan_files(directories)
+                more = changed_files(current, settled)
+                if not more:
+                    break
+                changed |= more
+                current = settled
+            state = current
+
+            echo(f"\n🔄 Changed: {', '.join(sorted(path.name for path in changed))}")
+            for build in builds:
+                affected = build.affected_by(changed)
+                if affected:
+                    build.build(affected)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    return 0
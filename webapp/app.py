@@ -1,54 +1,394 @@
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+import asyncio
+import hashlib
 import json
 import os
+import sys
+
+# Renderers shared with the generator script live in ../scripts
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../scripts'))
+
+from build_cache import hash_file
+from html_renderer import template_files
+from markdown_renderer import iter_markdown_chunks
+from resume_generator import ResumeGenerator
+from resume_model import Resume, ResumeDataError
+from snapshot import default_snapshot_path, load_snapshot
+from utils.cache import JSONFileCache, OverlayCache, SectionCache
+from utils.metrics import Counter, Gauge, MetricsMiddleware, MetricsRegistry
+from utils.pages import PageCache, cached_response
+from utils.templates import TEMPLATE_DIR, make_environment
+from utils.pdf import PdfCompileError, PdfRenderer
+from utils.shared import SharedPageStore
 
 app = FastAPI()
 
-# Mount static files (CSS, icons) using absolute path
+# Per-worker request metrics, exposed in Prometheus text format at /metrics
+metrics = MetricsRegistry()
+app.add_middleware(MetricsMiddleware, registry=metrics)
+
+# Mount static files (CSS, icons) using absolute path; git does not keep the directory while it is empty
 static_dir = os.path.join(os.path.dirname(__file__), 'static')
-app.mount('/static', StaticFiles(directory=static_dir), name='static')
+if os.path.isdir(static_dir):
+    app.mount('/static', StaticFiles(directory=static_dir), name='static')
 
-# Jinja2 environment
-template_dir = os.path.join(os.path.dirname(__file__), 'templates')
-env = Environment(
-    loader=FileSystemLoader(template_dir),
-    autoescape=select_autoescape(['html', 'xml'])
-)
+# Jinja2 environment; compiled templates are cached on disk so worker starts skip compiling.
+# RESUME_PRODUCTION=1 compiles them at startup and stops checking the files for changes.
+production = os.environ.get('RESUME_PRODUCTION', '') not in ('', '0')
+env = make_environment(production=production)
+
+# RESUME_SECTIONS_DIR / RESUME_JOBS_DIR point the app at other data (e.g. synthetic benchmark data)
+sections_dir = os.environ.get('RESUME_SECTIONS_DIR') or os.path.join(os.path.dirname(__file__), '../sections')
+jobs_dir = os.environ.get('RESUME_JOBS_DIR') or os.path.join(os.path.dirname(__file__), '../jobs')
+latex_templates_dir = os.path.join(os.path.dirname(__file__), '../templates')
+latex_template = os.environ.get('RESUME_LATEX_TEMPLATE', 'modern_template.tex')
+
+# Parsed JSON per file, shared by the base and every variant layered on it. A snapshot
+# compiled with `resume_generator.py --compile-snapshot` spares workers the JSON parsing
+# on cold start; RESUME_SNAPSHOT overrides its location.
+snapshot_path = os.environ.get('RESUME_SNAPSHOT') or default_snapshot_path(sections_dir)
+json_cache = JSONFileCache(snapshot=load_snapshot(snapshot_path))
+
+# Handlers never touch the filesystem on the event loop: cache checks, reloads and
+# directory listings run on this bounded pool (RESUME_IO_THREADS threads)
+io_pool = ThreadPoolExecutor(max_workers=int(os.environ.get('RESUME_IO_THREADS', '4')), thread_name_prefix='resume-io')
+
+async def run_io(func, *args):
+    return await asyncio.get_running_loop().run_in_executor(io_pool, func, *args)
+
+# Parsed contents of each sections/*.json file by section name, for /state/{section};
+# replaced together with the merged data whenever the sections are reloaded
+section_files = {}
 
 # Load all JSON files from ../sections/
 def load_resume_data():
+    global section_files
     data = {}
-    sections_dir = os.path.join(os.path.dirname(__file__), '../sections')
+    files = {}
     for fname in os.listdir(sections_dir):
         if fname.endswith('.json'):
-            with open(os.path.join(sections_dir, fname), 'r') as f:
-                file_data = json.load(f)
-                # Merge the data from each file directly into the main data dict
-                # This avoids double-nesting (e.g., resume.achievements.achievements)
-                data.update(file_data)
+            file_data = json_cache.load(os.path.join(sections_dir, fname))
+            files[fname[:-len('.json')]] = file_data
+            # Merge the data from each file directly into the main data dict
+            # This avoids double-nesting (e.g., resume.achievements.achievements)
+            data.update(file_data)
+    section_files = files
     return data
 
+# Merged section data is cached per process and reloaded only when a file changes.
+# RESUME_CACHE_CHECK_INTERVAL bounds how stale it can be (seconds, 0 = check every request).
+cache_check_interval = float(os.environ.get('RESUME_CACHE_CHECK_INTERVAL', '1.0'))
+# Loaded data is checked against the typed model shared with the generator before it is cached
+section_cache = SectionCache(
+    sections_dir, load_resume_data, check_interval=cache_check_interval, validate=Resume.from_dict
+)
+
+# Each jobs/<variant>/ directory is a sparse overlay on ../sections/, merged
+# lazily on first request and cached with its own base-file dependencies
+variant_caches = {}
+
+def variant_cache(name):
+    cache = variant_caches.get(name)
+    if cache is None:
+        path = os.path.join(jobs_dir, name)
+        if name.startswith('.') or os.sep in name or not os.path.isdir(path):
+            return None
+        cache = variant_caches[name] = OverlayCache(
+            sections_dir, path, json_cache, check_interval=cache_check_interval, validate=Resume.from_dict
+        )
+    return cache
+
+async def get_variant_cache(name):
+    # Known variants are answered from memory; only a new name needs the directory check
+    cache = variant_caches.get(name)
+    if cache is None:
+        cache = await run_io(variant_cache, name)
+    return cache
+
+async def variant_response(variant, respond):
+    """await respond(cache) for a variant, or a 404 if it does not exist (any more)"""
+    cache = await get_variant_cache(variant)
+    if cache is None:
+        return variant_not_found()
+    try:
+        return await respond(cache)
+    except FileNotFoundError:
+        # Directory deleted since the cache was created
+        variant_caches.pop(variant, None)
+        return variant_not_found()
+
+def list_variants():
+    try:
+        with os.scandir(jobs_dir) as it:
+            return sorted(entry.name for entry in it if entry.is_dir() and not entry.name.startswith('.'))
+    except FileNotFoundError:
+        return []
+
+# Rendered bodies, keyed on the content hash of the merged data (and template for HTML)
+page_cache = PageCache()
+
+# Optional: with RESUME_SHARED_PAGES=<file>, rendered pages live in one memory-mapped
+# segment shared by every worker instead of a page cache per worker. Workers then find
+# pages by the files' fingerprint, so they serve them without loading the data at all.
+shared_pages = SharedPageStore(os.environ['RESUME_SHARED_PAGES']) if os.environ.get('RESUME_SHARED_PAGES') else None
+
+# Hash per template file and its (mtime, size). index.html includes print.css, so pages
+# rendered from it are keyed on every file in the template directory, as in the generator.
+template_hashes = {}
+templates_key = None
+
+def template_digest():
+    """Digest of the template files; computed once in production, where templates are never reloaded"""
+    global templates_key
+    if production and templates_key is not None:
+        return templates_key
+    digest = hashlib.sha256()
+    for path in template_files(os.path.join(TEMPLATE_DIR, 'index.html')):
+        st = path.stat()
+        entry = template_hashes.get(path)
+        if entry is None or entry[0] != (st.st_mtime_ns, st.st_size):
+            entry = template_hashes[path] = ((st.st_mtime_ns, st.st_size), hash_file(path))
+        digest.update(f'{path.name}:{entry[1]}\n'.encode('utf-8'))
+    templates_key = digest.hexdigest()[:16]
+    return templates_key
+
+if production:
+    # With the templates compiled at startup, so no request hashes them on the event loop
+    template_digest()
+
+def index_template():
+    """The compiled index.html and the digest of the files it renders from"""
+    return env.get_template('index.html'), template_digest()
+
+async def page_body(name, cache, render, template_key=None, known=None):
+    """Rendered body of a page built from cache's data by render(data)
+
+    known, for pages named by the client, is awaited before anything is
+    rendered or cached under name; if it returns False the result is None.
+    A shared page that is already published is served without calling it.
+    """
+    if shared_pages is None:
+        resume_data = await cache.aget(io_pool)
+        if known is not None and not await known():
+            return None
+        key = (cache.digest, template_key) if template_key is not None else cache.digest
+        return page_cache.get(name, key, lambda: render(resume_data))
+
+    suffix = f':{template_key}' if template_key is not None else ''
+    body = shared_pages.get(name, f'{await cache.ascan(io_pool)}{suffix}')
+    if body is None:
+        if known is not None and not await known():
+            return None
+        # Published under the fingerprint the data was verified against, so key and body always match
+        resume_data, source = await run_io(cache.verified)
+        body = await run_io(shared_pages.publish, name, f'{source}{suffix}', render(resume_data))
+    return body
+
+async def html_response(request, prefix, cache):
+    # Outside production mode the lookup stats the template files to pick up edits
+    template, template_key = index_template() if production else await run_io(index_template)
+    # Expose state and logic in the template context
+    cached = await page_body(
+        f'{prefix}index.html', cache,
+        lambda resume_data: template.render(request=request, resume=resume_data, state=resume_data),
+        template_key
+    )
+    return cached_response(request, cached, 'text/html; charset=utf-8', page_cache)
+
+async def state_response(request, prefix, cache):
+    # Expose all loaded JSON data as JSON
+    cached = await page_body(
+        f'{prefix}state', cache,
+        lambda resume_data: json.dumps(resume_data, ensure_ascii=False, separators=(',', ':'))
+    )
+    return cached_response(request, cached, 'application/json', page_cache)
+
+async def markdown_response(cache):
+    # Markdown rendering of the same data, streamed in chunks as it is generated
+    return StreamingResponse(
+        iter_markdown_chunks(await cache.aget(io_pool)),
+        media_type='text/markdown; charset=utf-8'
+    )
+
+def variant_not_found():
+    return JSONResponse({'error': 'Variant not found'}, status_code=404)
+
+@app.exception_handler(ResumeDataError)
+async def resume_data_error(request: Request, exc: ResumeDataError):
+    # Malformed section files: report which field is wrong instead of a bare 500
+    return JSONResponse({'error': 'Invalid resume data', 'detail': str(exc)}, status_code=500)
+
 @app.get('/', response_class=HTMLResponse)
 async def homepage(request: Request):
-    resume_data = load_resume_data()
-    template = env.get_template('index.html')
-    # Expose state and logic in the template context
-    return template.render(request=request, resume=resume_data, state=resume_data)
+    return await html_response(request, '', section_cache)
 
 @app.get('/state', response_class=JSONResponse)
-async def state():
-    # Expose all loaded JSON data as JSON
-    return load_resume_data()
-
-# Example: serve a JSON file directly for inspection
-@app.get('/state/{section}', response_class=FileResponse)
-async def state_section(section: str):
-    path = os.path.join(os.path.dirname(__file__), '../sections', f'{section}.json')
-    if os.path.exists(path):
-        return FileResponse(path)
-    return JSONResponse({'error': 'Section not found'}, status_code=404)
+async def state(request: Request):
+    return await state_response(request, '', section_cache)
+
+@app.get('/resume.md')
+async def resume_markdown():
+    return await markdown_response(section_cache)
+
+@app.get('/jobs', response_class=JSONResponse)
+async def jobs():
+    return await run_io(list_variants)
+
+@app.get('/jobs/{variant}', response_class=HTMLResponse)
+async def variant_homepage(request: Request, variant: str):
+    return await variant_response(variant, lambda cache: html_response(request, f'jobs/{variant}/', cache))
+
+@app.get('/jobs/{variant}/state', response_class=JSONResponse)
+async def variant_state(request: Request, variant: str):
+    return await variant_response(variant, lambda cache: state_response(request, f'jobs/{variant}/', cache))
+
+@app.get('/jobs/{variant}/resume.md')
+async def variant_resume_markdown(variant: str):
+    return await variant_response(variant, lambda cache: markdown_response(cache))
+
+# PDFs compile in per-request temp dirs via asyncio subprocesses, at most
+# RESUME_PDF_WORKERS at a time; identical in-flight compiles are shared
+pdf_renderer = PdfRenderer(
+    max_concurrency=int(os.environ.get('RESUME_PDF_WORKERS', os.cpu_count() or 1)), executor=io_pool
+)
+
+# Last rendered LaTeX source per variant, keyed on data digest and template
+latex_sources = {}
+
+def render_latex(name, cache):
+    """LaTeX source of cache's data, re-rendered only when data or template changed; blocking"""
+    resume_data, digest = cache.current()
+    generator = ResumeGenerator(templates_dir=latex_templates_dir, output_dir=None, data=resume_data)
+    try:
+        template = generator.load_template(latex_template)
+    except FileNotFoundError as e:
+        raise PdfCompileError(str(e)) from e
+
+    key = (digest, template)
+    entry = latex_sources.get(name)
+    if entry is None or entry[0] != key:
+        entry = latex_sources[name] = (key, template.render(generator.template_resolvers()))
+    return entry[1]
+
+async def pdf_response(request, name, cache):
+    try:
+        # Rendering runs the whole LaTeX emission, so it stays off the event loop too
+        latex = await run_io(render_latex, name, cache)
+        cached = await pdf_renderer.get(latex)
+    except PdfCompileError as e:
+        return JSONResponse({'error': str(e)}, status_code=503)
+    return cached_response(request, cached, 'application/pdf', compress=False)
+
+@app.get('/resume.pdf')
+async def resume_pdf(request: Request):
+    return await pdf_response(request, None, section_cache)
+
+@app.get('/jobs/{variant}/resume.pdf')
+async def variant_resume_pdf(request: Request, variant: str):
+    return await variant_response(variant, lambda cache: pdf_response(request, variant, cache))
+
+# A single section file, from the section map loaded alongside the merged data
+@app.get('/state/{section}', response_class=JSONResponse)
+async def state_section(request: Request, section: str):
+    # Unknown names are answered without caching anything, so junk URLs cannot grow the page caches.
+    # Only a page that is not cached yet loads the sections to tell the two apart.
+    async def known():
+        await section_cache.aget(io_pool)
+        return section in section_files
+
+    def render(resume_data):
+        # KeyError if the file was removed since the check; nothing is cached or published then
+        return json.dumps(section_files[section], ensure_ascii=False, separators=(',', ':'))
+
+    try:
+        cached = await page_body(f'state/{section}', section_cache, render, known=known)
+    except KeyError:
+        cached = None
+    if cached is None:
+        return JSONResponse({'error': 'Section not found'}, status_code=404)
+    return cached_response(request, cached, 'application/json', page_cache)
+
+# Cache counters, to confirm the hit rate under load
+@app.get('/cache', response_class=JSONResponse)
+async def cache_stats():
+    return {
+        'sections': section_cache.stats(),
+        'variants': {name: cache.stats() for name, cache in variant_caches.items()},
+        'json_files': json_cache.stats(),
+        'pages': page_cache.stats(),
+        'pdf': pdf_renderer.stats(),
+        'shared_pages': shared_pages.stats() if shared_pages is not None else None,
+    }
+
+# Cache counters and timings as Prometheus metrics, read from the caches on every scrape
+@metrics.collector
+def cache_metrics():
+    data_requests = Counter(
+        'resume_data_cache_requests_total', 'Merged data lookups by cache and result', ('cache', 'result')
+    )
+    data_seconds = Counter(
+        'resume_data_reload_seconds_total', 'Time spent reloading merged data, by cache and stage', ('cache', 'stage')
+    )
+    hit_ratio = Gauge('resume_cache_hit_ratio', 'Hit ratio since worker start, by cache', ('cache',))
+    json_loads = Counter('resume_json_file_loads_total', 'Section file loads by source', ('source',))
+    page_requests = Counter('resume_page_cache_requests_total', 'Rendered page lookups by result', ('result',))
+    page_render = Counter('resume_page_render_seconds_total', 'Time spent rendering pages on cache misses')
+    pdf_requests = Counter('resume_pdf_requests_total', 'PDF requests by result', ('result',))
+    pdf_seconds = Counter('resume_pdf_compile_seconds_total', 'Time spent compiling PDFs')
+    pdf_in_flight = Gauge('resume_pdf_compiles_in_flight', 'PDF compiles running or queued')
+
+    caches = {'sections': section_cache}
+    caches.update((f'jobs/{name}', cache) for name, cache in variant_caches.items())
+    for name, cache in caches.items():
+        stats = cache.stats()
+        data_requests.inc(stats['hits'], cache=name, result='hit')
+        data_requests.inc(stats['misses'], cache=name, result='miss')
+        data_seconds.inc(stats['load_seconds'], cache=name, stage='load')
+        data_seconds.inc(stats['validate_seconds'], cache=name, stage='validate')
+        if stats['hit_ratio'] is not None:
+            hit_ratio.set(stats['hit_ratio'], cache=name)
+
+    stats = json_cache.stats()
+    json_loads.inc(stats['hits'], source='cache')
+    json_loads.inc(stats['snapshot_hits'], source='snapshot')
+    json_loads.inc(stats['parses'], source='parse')
+
+    stats = page_cache.stats()
+    page_requests.inc(stats['hits'], result='hit')
+    page_requests.inc(stats['misses'], result='miss')
+    page_requests.inc(stats['not_modified'], result='not_modified')
+    page_render.inc(stats['render_seconds'])
+    if stats['hit_ratio'] is not None:
+        hit_ratio.set(stats['hit_ratio'], cache='pages')
+
+    stats = pdf_renderer.stats()
+    pdf_requests.inc(stats['hits'], result='hit')
+    pdf_requests.inc(stats['compiles'], result='compile')
+    pdf_requests.inc(stats['coalesced'], result='coalesced')
+    pdf_requests.inc(stats['failures'], result='failure')
+    pdf_seconds.inc(stats['compile_seconds'])
+    pdf_in_flight.set(stats['in_flight'])
+
+    families = [data_requests, data_seconds, hit_ratio, json_loads, page_requests, page_render,
+                pdf_requests, pdf_seconds, pdf_in_flight]
+    if shared_pages is not None:
+        shared_requests = Counter('resume_shared_pages_requests_total', 'Shared page lookups by result', ('result',))
+        shared_generation = Gauge('resume_shared_pages_generation', 'Generation of the shared page segment')
+        shared_bytes = Gauge('resume_shared_pages_segment_bytes', 'Size of the mapped shared page segment')
+        stats = shared_pages.stats()
+        shared_requests.inc(stats['hits'], result='hit')
+        shared_requests.inc(stats['misses'], result='miss')
+        shared_requests.inc(stats['publishes'], result='publish')
+        shared_generation.set(stats['generation'])
+        shared_bytes.set(stats['segment_bytes'])
+        families += [shared_requests, shared_generation, shared_bytes]
+    return families
+
+@app.get('/metrics')
+async def prometheus_metrics():
+    return Response(metrics.render(), media_type=metrics.content_type)
 
 # Comments and state exposure are present throughout for transparency. 
\ No newline at end of file
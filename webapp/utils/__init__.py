@@ -0,0 +1 @@
+# Helpers for the resume webapp: cached JSON loading and state exposure.
@@ -0,0 +1,308 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+
+from overlay import merge_overlay, overlay_shadows
+
+
+def scan_json_files(directory, prefix=''):
+    """(name, inode, mtime, size) for every JSON file in directory"""
+    entries = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.endswith('.json'):
+                st = entry.stat()
+                entries.append((prefix + entry.name, st.st_ino, st.st_mtime_ns, st.st_size))
+    return entries
+
+
+def fingerprint_digest(fingerprint):
+    """Short key for a directory fingerprint (inode, mtime and size per file), identical in every worker"""
+    return hashlib.sha256(repr(fingerprint).encode('utf-8')).hexdigest()[:32]
+
+
+class JSONFileCache:
+    """
+    Parsed JSON per file path, shared by every cache that reads the file.
+
+    A base section file is parsed once no matter how many variants layer on
+    top of it; it is reparsed only when its inode, mtime or size change.
+
+    With a compiled snapshot, a file seen for the first time is taken from the
+    snapshot instead of being parsed, as long as it has not changed since.
+    """
+
+    def __init__(self, snapshot=None):
+        self.snapshot = snapshot
+        self.hits = 0
+        self.parses = 0
+        self.snapshot_hits = 0
+        self._entries = {}
+
+    def load(self, path):
+        st = os.stat(path)
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == signature:
+            self.hits += 1
+            return entry[1]
+
+        cached = self.snapshot.lookup(path, st) if self.snapshot is not None else None
+        if cached is not None:
+            data = cached[1]
+            self.snapshot_hits += 1
+        else:
+            with open(path, 'r') as f:
+                data = json.load(f)
+            self.parses += 1
+        self._entries[path] = (signature, data)
+        return data
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'parses': self.parses,
+            'snapshot_hits': self.snapshot_hits,
+            'files': len(self._entries),
+        }
+
+
+class SectionCache:
+    """
+    Process-level cache of the merged resume data.
+
+    The sections directory is fingerprinted by (name, inode, mtime, size) of
+    every JSON file. Within `check_interval` seconds of the last check the
+    cached data is returned straight from memory; after that a single
+    `os.scandir` decides whether the files changed and need reloading.
+    Editors that save atomically (new inode) and in place (new mtime/size)
+    are both detected.
+
+    `validate`, when given, is called with freshly loaded data before it is
+    cached; if it raises, the previous data stays cached and the error
+    propagates to the request.
+
+    Async handlers use `aget`, which answers from memory when it can and
+    otherwise runs the check (and any reload) on an executor thread, so a
+    slow disk never blocks the event loop.
+
+    `scan` identifies the current files without loading them, and `source`
+    identifies the files the cached data was last verified against. Pages
+    shared between workers are keyed on these, so a worker can serve them
+    without parsing anything.
+    """
+
+    def __init__(self, sections_dir, loader, check_interval=1.0, validate=None):
+        self.sections_dir = sections_dir
+        self.loader = loader
+        self.check_interval = check_interval
+        self.validate = validate
+
+        self.hits = 0
+        self.misses = 0
+        self.checks = 0
+        self.version = 0
+        # Time spent (re)loading and validating data, split so either can be blamed
+        self.load_seconds = 0.0
+        self.validate_seconds = 0.0
+        # Content hash of the merged data, stable across reloads of identical content
+        self.digest = None
+        # fingerprint_digest of all files the data was last verified against
+        self.source = None
+
+        self._data = None
+        self._fingerprint = None
+        self._checked_at = 0.0
+        self._scan = None
+        self._scanned_at = 0.0
+        self._lock = threading.RLock()
+
+    def fingerprint(self):
+        return tuple(sorted(scan_json_files(self.sections_dir)))
+
+    def relevant(self, fingerprint):
+        """The part of a fingerprint the cached data depends on"""
+        return fingerprint
+
+    def fresh(self):
+        """The cached data if it was verified within check_interval, else None; never touches the disk"""
+        if self._data is not None and time.monotonic() - self._checked_at < self.check_interval:
+            return self._data
+        return None
+
+    def get(self, recheck=False):
+        """The merged data; recheck=True verifies it against the files even within check_interval"""
+        # Fast path: recently verified, no syscalls at all
+        data = None if recheck else self.fresh()
+        if data is not None:
+            self.hits += 1
+            return data
+
+        with self._lock:
+            # Another thread may have checked while this one waited for the lock
+            data = None if recheck else self.fresh()
+            if data is not None:
+                self.hits += 1
+                return data
+
+            self.checks += 1
+            fingerprint = self.fingerprint()
+            self._checked_at = time.monotonic()
+            self._scan = fingerprint_digest(fingerprint)
+            self._scanned_at = self._checked_at
+            if self._data is not None and self.relevant(fingerprint) == self._fingerprint:
+                self.hits += 1
+                self.source = self._scan
+                return self._data
+
+            self.misses += 1
+            started = time.perf_counter()
+            data = self.loader()
+            loaded = time.perf_counter()
+            self.load_seconds += loaded - started
+            if self.validate is not None:
+                try:
+                    self.validate(data)
+                finally:
+                    self.validate_seconds += time.perf_counter() - loaded
+            self._data = data
+            self.digest = hashlib.sha256(json.dumps(self._data, sort_keys=True).encode('utf-8')).hexdigest()
+            self._fingerprint = self.relevant(fingerprint)
+            self.source = self._scan
+            self.version += 1
+            return self._data
+
+    def verified(self):
+        """(data, source) with the data checked against the files right now, as one consistent pair"""
+        with self._lock:
+            data = self.get(recheck=True)
+            return data, self.source
+
+    def current(self):
+        """(data, digest) as one consistent pair; a reload cannot slip in between the two"""
+        with self._lock:
+            data = self.get()
+            return data, self.digest
+
+    def scan(self):
+        """fingerprint_digest of the files, rescanned at most once per check_interval; never loads data"""
+        if self._scan is None or time.monotonic() - self._scanned_at >= self.check_interval:
+            self._scan = fingerprint_digest(self.fingerprint())
+            self._scanned_at = time.monotonic()
+        return self._scan
+
+    async def ascan(self, executor=None):
+        """scan() for async code; only an actual rescan runs on executor"""
+        if self._scan is not None and time.monotonic() - self._scanned_at < self.check_interval:
+            return self._scan
+        return await asyncio.get_running_loop().run_in_executor(executor, self.scan)
+
+    async def aget(self, executor=None):
+        """get() for async code: blocking checks and reloads run on executor (None = the loop's default)"""
+        data = self.fresh()
+        if data is not None:
+            self.hits += 1
+            return data
+        return await asyncio.get_running_loop().run_in_executor(executor, self.get)
+
+    def invalidate(self):
+        with self._lock:
+            self._data = None
+            self._fingerprint = None
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'checks': self.checks,
+            'hit_ratio': self.hits / total if total else None,
+            'version': self.version,
+            'digest': self.digest,
+            'load_seconds': self.load_seconds,
+            'validate_seconds': self.validate_seconds,
+            'check_interval': self.check_interval,
+            'files': len(self._fingerprint or ()),
+        }
+
+
+class OverlayCache(SectionCache):
+    """
+    Merged data of a job variant stored as a sparse overlay on the base sections.
+
+    A base file whose every key the overlay replaces does not invalidate this
+    variant when it is edited, as long as the overlay still replaces every
+    key; a key added to it, and any base file added or removed, does. Parsed
+    files come from the shared JSONFileCache, so a base edit is parsed once
+    for all variants and re-checking a shadowed file is cheap.
+    """
+
+    def __init__(self, base_dir, overlay_dir, json_cache, check_interval=1.0, validate=None):
+        super().__init__(overlay_dir, self.load_merged, check_interval, validate)
+        self.base_dir = base_dir
+        self.json_cache = json_cache
+        # Base file names the merged data depends on; None until first load
+        self.dependencies = None
+        # Base file name -> fingerprint entry last confirmed to be fully replaced by the overlay
+        self._shadowed = {}
+
+    def fingerprint(self):
+        return tuple(sorted(scan_json_files(self.sections_dir) + scan_json_files(self.base_dir, 'base/')))
+
+    def relevant(self, fingerprint):
+        return tuple(
+            (entry[0], 'shadowed')
+            if entry[0].startswith('base/') and entry[0][5:] in self._shadowed and self.shadows(entry) else entry
+            for entry in fingerprint
+        )
+
+    def shadows(self, entry):
+        """Whether the overlay still replaces every key of the base file behind a fingerprint entry"""
+        name = entry[0][5:]
+        if self._shadowed[name] == entry:
+            return True
+        try:
+            base = self.json_cache.load(os.path.join(self.base_dir, name))
+            overlay = self.json_cache.load(os.path.join(self.sections_dir, name))
+        except (OSError, ValueError):
+            return False
+        if not overlay_shadows(base, overlay):
+            return False
+        self._shadowed[name] = entry
+        return True
+
+    def load_merged(self):
+        base_files = {name for name in os.listdir(self.base_dir) if name.endswith('.json')}
+        overlay_files = {name for name in os.listdir(self.sections_dir) if name.endswith('.json')}
+
+        data = {}
+        dependencies = set()
+        shadowed = set()
+        for fname in sorted(base_files | overlay_files):
+            base = self.json_cache.load(os.path.join(self.base_dir, fname)) if fname in base_files else None
+            overlay = self.json_cache.load(os.path.join(self.sections_dir, fname)) if fname in overlay_files else None
+
+            if base is None:
+                data.update(overlay)
+            elif overlay is None:
+                data.update(base)
+                dependencies.add(fname)
+            else:
+                data.update(merge_overlay(base, overlay))
+                if overlay_shadows(base, overlay):
+                    shadowed.add(fname)
+                else:
+                    dependencies.add(fname)
+
+        self.dependencies = dependencies
+        # Confirmed against the fingerprint entries when the load is recorded
+        self._shadowed = dict.fromkeys(shadowed)
+        return data
+
+    def stats(self):
+        stats = super().stats()
+        stats['base_dependencies'] = sorted(self.dependencies) if self.dependencies is not None else None
+        return stats
@@ -0,0 +1,135 @@
+import gzip
+import hashlib
+import threading
+import time
+
+from fastapi.responses import Response
+
+try:
+    import brotli
+except ImportError:  # optional: brotli bodies are only offered when installed
+    brotli = None
+
+
+class CachedBody:
+    """
+    Rendered response bytes plus their strong ETag.
+
+    Compressed variants are produced on first use and kept alongside the
+    identity body, each with its own ETag as they are distinct representations.
+    """
+
+    __slots__ = ('key', 'body', 'etag', '_encoded', '_lock')
+
+    def __init__(self, key, body):
+        self.key = key
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        self._encoded = {}
+        self._lock = threading.Lock()
+
+    def encoded(self, encoding):
+        """Return (body, etag) for 'gzip', 'br' or 'identity'"""
+        if encoding == 'identity':
+            return self.body, self.etag
+        if encoding not in self._encoded:
+            with self._lock:
+                if encoding not in self._encoded:
+                    if encoding == 'br':
+                        body = brotli.compress(self.body)
+                    else:
+                        body = gzip.compress(self.body, compresslevel=6, mtime=0)
+                    self._encoded[encoding] = body
+        return self._encoded[encoding], f'{self.etag[:-1]}-{encoding}"'
+
+
+class PageCache:
+    """
+    Cache of rendered page bodies, one entry per page name.
+
+    An entry is reused while its key (content hash of the merged data plus
+    the template object) is unchanged, so steady-state requests never re-render.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        # Time spent rendering on misses
+        self.render_seconds = 0.0
+        self._entries = {}
+
+    def get(self, name, key, render):
+        entry = self._entries.get(name)
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        started = time.perf_counter()
+        body = render()
+        self.render_seconds += time.perf_counter() - started
+        entry = CachedBody(key, body.encode('utf-8') if isinstance(body, str) else body)
+        self._entries[name] = entry
+        return entry
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'not_modified': self.not_modified,
+            'render_seconds': self.render_seconds,
+            'hit_ratio': self.hits / total if total else None,
+            'pages': sorted(self._entries),
+        }
+
+
+def accepted_encodings(header):
+    """Content codings the client accepts (q > 0), from an Accept-Encoding header"""
+    accepted = set()
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        q = params.strip()
+        if q.startswith('q='):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def etag_matches(header, etag):
+    """Whether an If-None-Match header matches etag (weak comparison, per RFC 9110)"""
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    bare = etag.removeprefix('W/')
+    return any(tag.strip().removeprefix('W/') == bare for tag in header.split(','))
+
+
+def cached_response(request, cached, media_type, page_cache=None, compress=True):
+    """Serve a CachedBody with ETag revalidation and precompressed bodies"""
+    accepted = accepted_encodings(request.headers.get('accept-encoding', '')) if compress else set()
+    if brotli is not None and 'br' in accepted:
+        encoding = 'br'
+    elif 'gzip' in accepted:
+        encoding = 'gzip'
+    else:
+        encoding = 'identity'
+
+    body, etag = cached.encoded(encoding)
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+
+    if etag_matches(request.headers.get('if-none-match'), etag):
+        if page_cache is not None:
+            page_cache.not_modified += 1
+        return Response(status_code=304, headers=headers)
+
+    if encoding != 'identity':
+        headers['Content-Encoding'] = encoding
+    return Response(content=body, media_type=media_type, headers=headers)
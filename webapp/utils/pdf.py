@@ -0,0 +1,151 @@
+import asyncio
+import hashlib
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from resume_generator import ResumeGenerator
+from utils.pages import CachedBody
+
+
+class PdfCompileError(Exception):
+    """pdflatex is missing or failed to compile the document"""
+
+
+class PdfRenderer:
+    """
+    Non-blocking PDF compilation for the webapp.
+
+    Each compile runs pdflatex as an asyncio subprocess inside its own
+    temporary directory (no os.chdir, so concurrent compiles never share a
+    working directory). A semaphore bounds how many compiles run at once,
+    concurrent requests for the same LaTeX source share one in-flight
+    compile, and finished PDFs are kept in a small LRU keyed on the source hash.
+    Reading and writing the temporary files happens on `executor` (None =
+    the loop's default), never on the event loop.
+    """
+
+    def __init__(self, max_concurrency=2, max_passes=3, cache_size=32, executor=None):
+        self.max_concurrency = max_concurrency
+        self.executor = executor
+        self.max_passes = max_passes
+        self.cache_size = cache_size
+
+        self.hits = 0
+        self.compiles = 0
+        self.coalesced = 0
+        self.failures = 0
+        # Wall time of compiles, excluding time spent waiting for a free slot
+        self.compile_seconds = 0.0
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._cache = OrderedDict()
+        self._inflight = {}
+
+    async def get(self, latex_source):
+        """Return a CachedBody with the PDF for latex_source, compiling it at most once"""
+        key = hashlib.sha256(latex_source.encode('utf-8')).hexdigest()
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._compile(key, latex_source))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+
+        # Shielded so a client disconnecting doesn't cancel a compile other requests wait on
+        return await asyncio.shield(task)
+
+    async def _compile(self, key, latex_source):
+        async with self._semaphore:
+            self.compiles += 1
+            started = time.perf_counter()
+            try:
+                pdf = await self._run_pdflatex(latex_source)
+            except PdfCompileError:
+                self.failures += 1
+                raise
+            finally:
+                self.compile_seconds += time.perf_counter() - started
+
+        cached = CachedBody(key, pdf)
+        self._cache[key] = cached
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return cached
+
+    async def _io(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    @staticmethod
+    def _prepare(latex_source):
+        work_dir = Path(tempfile.mkdtemp(prefix='resume-pdf-'))
+        (work_dir / 'resume.tex').write_text(latex_source)
+        return work_dir
+
+    @staticmethod
+    def _read_pass(work_dir):
+        """(aux bytes, log text) after a pass"""
+        aux_path = work_dir / 'resume.aux'
+        log_path = work_dir / 'resume.log'
+        aux = aux_path.read_bytes() if aux_path.exists() else None
+        log_text = log_path.read_text(errors='replace') if log_path.exists() else ''
+        return aux, log_text
+
+    @staticmethod
+    def _read_pdf(work_dir):
+        pdf_path = work_dir / 'resume.pdf'
+        return pdf_path.read_bytes() if pdf_path.exists() else None
+
+    async def _run_pdflatex(self, latex_source):
+        work_dir = await self._io(self._prepare, latex_source)
+        try:
+            aux_before = None
+            for i in range(self.max_passes):
+                try:
+                    process = await asyncio.create_subprocess_exec(
+                        'pdflatex', '-interaction=nonstopmode', 'resume.tex',
+                        cwd=work_dir,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.STDOUT
+                    )
+                except FileNotFoundError:
+                    raise PdfCompileError('pdflatex not found. Please install LaTeX distribution.')
+                output, _ = await process.communicate()
+
+                if process.returncode != 0:
+                    tail = output.decode(errors='replace').strip().splitlines()[-20:]
+                    raise PdfCompileError(f"LaTeX compilation failed on pass {i+1}:\n" + '\n'.join(tail))
+
+                aux_after, log_text = await self._io(self._read_pass, work_dir)
+                if not ResumeGenerator.latex_needs_rerun(log_text, aux_before, aux_after):
+                    break
+                aux_before = aux_after
+
+            pdf = await self._io(self._read_pdf, work_dir)
+            if pdf is None:
+                raise PdfCompileError('PDF generation failed - file not created')
+            return pdf
+        finally:
+            await self._io(shutil.rmtree, work_dir, True)
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'compiles': self.compiles,
+            'coalesced': self.coalesced,
+            'failures': self.failures,
+            'compile_seconds': self.compile_seconds,
+            'in_flight': len(self._inflight),
+            'cached': len(self._cache),
+            'max_concurrency': self.max_concurrency,
+        }
@@ -0,0 +1,258 @@
+import json
+import mmap
+import os
+import threading
+
+from utils.pages import CachedBody, brotli
+
+SHARED_MAGIC = b'RSMPAGE2'
+# Record layout: total length, index entry length, JSON index entry, bodies, RECORD_END
+RECORD_HEADER = 16
+RECORD_END = b'RSMPEND\n'
+# Compact once the segment is at least this large and over half of it is superseded pages
+COMPACT_MIN_BYTES = 1 << 20
+
+
+def encode_record(name, key, etag, parts):
+    """Chunks of one segment record holding the bodies of a page, RECORD_END last"""
+    entry = {'name': name, 'key': key, 'etag': etag, 'parts': {}}
+    offset = 0
+    for encoding, data in parts.items():
+        entry['parts'][encoding] = (offset, len(data))
+        offset += len(data)
+    entry_bytes = json.dumps(entry).encode('utf-8')
+    total = RECORD_HEADER + len(entry_bytes) + offset + len(RECORD_END)
+    header = total.to_bytes(8, 'little') + len(entry_bytes).to_bytes(8, 'little')
+    return [header + entry_bytes, *parts.values(), RECORD_END]
+
+
+def read_records(segment, offset, index):
+    """Add the complete records of segment from offset on to index; returns the offset after the last one
+
+    A later record for a page replaces the earlier one. A record that is
+    still being appended (no RECORD_END yet) ends the scan.
+    """
+    size = len(segment)
+    while offset + RECORD_HEADER <= size:
+        total = int.from_bytes(segment[offset:offset + 8], 'little')
+        entry_length = int.from_bytes(segment[offset + 8:offset + RECORD_HEADER], 'little')
+        end = offset + total
+        if total < RECORD_HEADER + entry_length + len(RECORD_END) or end > size \
+                or segment[end - len(RECORD_END):end] != RECORD_END:
+            break
+        entry = json.loads(segment[offset + RECORD_HEADER:offset + RECORD_HEADER + entry_length])
+        bodies = offset + RECORD_HEADER + entry_length
+        index[entry['name']] = {
+            'key': entry['key'],
+            'etag': entry['etag'],
+            'parts': {encoding: (bodies + start, length) for encoding, (start, length) in entry['parts'].items()},
+            'size': total,
+        }
+        offset = end
+    return offset
+
+
+class SharedBody:
+    """
+    A page body stored in a SharedPageStore segment.
+
+    Offers the same encoded() interface as CachedBody. Bytes are copied out
+    of the mapping per response, so nothing large stays referenced by a worker.
+    """
+
+    __slots__ = ('key', 'etag', '_segment', '_parts')
+
+    def __init__(self, key, etag, segment, parts):
+        self.key = key
+        self.etag = etag
+        self._segment = segment
+        self._parts = parts
+
+    def encoded(self, encoding):
+        part = self._parts.get(encoding)
+        if part is None:
+            # Published by a worker without brotli; compress this response locally
+            offset, length = self._parts['identity']
+            body = brotli.compress(self._segment[offset:offset + length])
+        else:
+            offset, length = part
+            body = self._segment[offset:offset + length]
+        return body, self.etag if encoding == 'identity' else f'{self.etag[:-1]}-{encoding}"'
+
+
+class SharedPageStore:
+    """
+    Rendered page bodies shared by every worker process through one memory-mapped file.
+
+    The segment file is an append-only log of page records (identity, gzip
+    and, if available, brotli bodies plus a small JSON index entry); all
+    workers map it read-only, so the bodies exist once in the OS page cache
+    however many workers run. A publish appends one record, so it costs the
+    size of that page rather than of the whole segment, and then bumps a
+    generation counter kept in a separate, shared-mapped control file.
+    Workers compare that counter (a memory read, no syscall) on every lookup
+    and, when it moved, remap the file and read only the records appended
+    since. A republished page supersedes its older record; once superseded
+    records make up over half of a large segment, the publisher rewrites it
+    with the current pages only and swaps it in with os.replace.
+
+    Publishers serialise on an flock; POSIX only.
+    """
+
+    def __init__(self, path, compact_min_bytes=COMPACT_MIN_BYTES):
+        self.path = os.path.abspath(path)
+        self.control_path = f'{self.path}.gen'
+        self.lock_path = f'{self.path}.lock'
+        self.compact_min_bytes = compact_min_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.publishes = 0
+        self.remaps = 0
+        self.compactions = 0
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        fd = os.open(self.control_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size < 8:
+                os.ftruncate(fd, 8)
+            self._control = mmap.mmap(fd, 8)
+        finally:
+            os.close(fd)
+
+        self._generation = None
+        # (mapping, index, inode, offset after the last complete record), replaced as one
+        self._mapped = (None, {}, None, 0)
+        self._lock = threading.Lock()
+
+    def generation(self):
+        return int.from_bytes(self._control[:8], 'little')
+
+    def _refresh(self):
+        if self.generation() != self._generation:
+            with self._lock:
+                self._remap()
+
+    def _remap(self):
+        generation = self.generation()
+        if generation == self._generation:
+            return
+        segment = inode = None
+        try:
+            with open(self.path, 'rb') as f:
+                inode = os.fstat(f.fileno()).st_ino
+                segment = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            pass
+
+        if segment is None or segment[:len(SHARED_MAGIC)] != SHARED_MAGIC:
+            mapped = (None, {}, None, 0)
+        else:
+            _, index, mapped_inode, end = self._mapped
+            if inode == mapped_inode:
+                # Same file, only appended to: read the new records
+                index = dict(index)
+            else:
+                # Compacted or recreated
+                index, end = {}, len(SHARED_MAGIC)
+            end = read_records(segment, end, index)
+            mapped = (segment, index, inode, end)
+        # The old mapping is unmapped once no SharedBody refers to it any more
+        self._mapped = mapped
+        self._generation = generation
+        self.remaps += 1
+
+    def get(self, name, key):
+        """SharedBody for page name if it was published with key, else None"""
+        self._refresh()
+        segment, index, _, _ = self._mapped
+        entry = index.get(name)
+        if entry is None or entry['key'] != key:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return SharedBody(key, entry['etag'], segment, entry['parts'])
+
+    def publish(self, name, key, body):
+        """Store a rendered body under name and key; returns the published SharedBody
+
+        Blocking (file I/O and a lock); run it on an executor from async code.
+        If another worker already published the same key, nothing is written.
+        """
+        import fcntl
+
+        with open(self.lock_path, 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            self._refresh()
+            entry = self._mapped[1].get(name)
+            if entry is None or entry['key'] != key:
+                self._append(name, key, body)
+                self._bump()
+                self._refresh()
+                self.publishes += 1
+                if self._should_compact():
+                    self._compact()
+                    self._bump()
+                    self._refresh()
+        return self.get(name, key)
+
+    def _append(self, name, key, body):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        cached = body if isinstance(body, CachedBody) else CachedBody(key, body)
+        encodings = ('identity', 'gzip', 'br') if brotli is not None else ('identity', 'gzip')
+        chunks = encode_record(name, key, cached.etag, {encoding: cached.encoded(encoding)[0] for encoding in encodings})
+
+        segment, _, _, end = self._mapped
+        if segment is None:
+            self._replace([])
+            end = len(SHARED_MAGIC)
+        with open(self.path, 'r+b') as f:
+            # Drop a partial record left by a publisher that died while appending
+            f.truncate(end)
+            f.seek(end)
+            # RECORD_END goes last, so readers never take a record for complete before its bodies are written
+            for chunk in chunks:
+                f.write(chunk)
+
+    def _should_compact(self):
+        _, index, _, end = self._mapped
+        live = len(SHARED_MAGIC) + sum(entry['size'] for entry in index.values())
+        return end >= self.compact_min_bytes and end > 2 * live
+
+    def _compact(self):
+        """Rewrite the segment with only the current record of each page"""
+        segment, index, _, _ = self._mapped
+        records = []
+        for name, entry in index.items():
+            parts = {encoding: segment[offset:offset + length] for encoding, (offset, length) in entry['parts'].items()}
+            records.append(encode_record(name, entry['key'], entry['etag'], parts))
+        self._replace(records)
+        self.compactions += 1
+
+    def _replace(self, records):
+        """Swap in a new segment holding records; mapped readers keep the old file until they remap"""
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(SHARED_MAGIC)
+            for chunks in records:
+                for chunk in chunks:
+                    f.write(chunk)
+        os.replace(tmp_path, self.path)
+
+    def _bump(self):
+        self._control[:8] = (self.generation() + 1).to_bytes(8, 'little')
+
+    def stats(self):
+        segment, index, _, end = self._mapped
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'publishes': self.publishes,
+            'remaps': self.remaps,
+            'compactions': self.compactions,
+            'generation': self.generation(),
+            'pages': sorted(index),
+            'segment_bytes': len(segment) if segment is not None else 0,
+            'live_bytes': len(SHARED_MAGIC) + sum(entry['size'] for entry in index.values()) if segment is not None else 0,
+        }